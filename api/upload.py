@@ -1,6 +1,9 @@
 from http.server import BaseHTTPRequestHandler
 from controllers.document_controller import DocumentController
 from views.api_response import APIResponseHandler
+from controllers.request_options import TENANT_FIELD
+from services.tenant_identity import tenant_resolver
+from services.request_profiler import profile_request, profile_stage
 
 class handler(BaseHTTPRequestHandler):
     def __init__(self, *args, **kwargs):
@@ -8,22 +11,34 @@ class handler(BaseHTTPRequestHandler):
         super().__init__(*args, **kwargs)
     
     def do_POST(self):
+        # 샘플링 비율 또는 X-Profile 헤더로 선택된 요청만 프로파일링
+        with profile_request("upload", self.headers):
+            self._handle_post()
+    
+    def _handle_post(self):
         try:
             # 요청 데이터 파싱
-            data = APIResponseHandler.parse_json_request(self)
+            with profile_stage("parse"):
+                data = APIResponseHandler.parse_json_request(self)
+                # 번역 메모리는 검증한 테넌트(API 키/Google 사용자)별로 사용
+                data[TENANT_FIELD] = tenant_resolver.resolve_headers(
+                    self.headers, self.client_address[0] if self.client_address else None
+                )
             
             # 문서 처리
-            result = self.document_controller.process_document(data)
+            with profile_stage("controller"):
+                result = self.document_controller.process_document(data)
             
             # 응답 전송
-            if result.get('success'):
-                APIResponseHandler.send_success_response(self, result)
-            else:
-                APIResponseHandler.send_error_response(
-                    self, 
-                    result.get('error', '문서 처리 중 오류가 발생했습니다.'),
-                    result.get('status_code', 500)
-                )
+            with profile_stage("respond"):
+                if result.get('success'):
+                    APIResponseHandler.send_success_response(self, result)
+                else:
+                    APIResponseHandler.send_error_response(
+                        self, 
+                        result.get('error', '문서 처리 중 오류가 발생했습니다.'),
+                        result.get('status_code', 500)
+                    )
                 
         except Exception as e:
             APIResponseHandler.send_error_response(self, f"문서 처리 중 오류가 발생했습니다: {str(e)}")
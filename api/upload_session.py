@@ -0,0 +1,78 @@
+from http.server import BaseHTTPRequestHandler
+from urllib.parse import urlparse, parse_qs
+from controllers.upload_session_controller import UploadSessionController
+from controllers.request_options import TENANT_FIELD
+from services.tenant_identity import tenant_resolver
+from views.api_response import APIResponseHandler
+from services.request_profiler import profile_request, profile_stage
+
+class handler(BaseHTTPRequestHandler):
+    def __init__(self, *args, **kwargs):
+        self.upload_session_controller = UploadSessionController()
+        super().__init__(*args, **kwargs)
+    
+    def do_POST(self):
+        # 샘플링 비율 또는 X-Profile 헤더로 선택된 요청만 프로파일링
+        with profile_request("upload_session", self.headers):
+            self._handle_post()
+    
+    def _handle_post(self):
+        try:
+            # 요청 데이터 파싱
+            with profile_stage("parse"):
+                data = APIResponseHandler.parse_json_request(self)
+            
+            # action 값에 따라 세션 생성 / 청크 전송 / 상태 조회 / 완료 처리
+            actions = {
+                'init': self.upload_session_controller.init_upload,
+                'chunk': self.upload_session_controller.upload_chunk,
+                'status': self.upload_session_controller.get_upload_status,
+                'finalize': self.upload_session_controller.finalize_upload
+            }
+            # 세션은 검증한 테넌트(API 키/Google 사용자, 그 외에는 클라이언트 IP)에 묶임
+            data[TENANT_FIELD] = self._tenant()
+            action = actions.get(data.get('action'))
+            if action is None:
+                APIResponseHandler.send_error_response(
+                    self, f"지원하지 않는 action입니다: {data.get('action')} (init, chunk, status, finalize)", 400
+                )
+                return
+            
+            with profile_stage("controller"):
+                result = action(data)
+            
+            # 응답 전송
+            with profile_stage("respond"):
+                self._send_result(result)
+        
+        except Exception as e:
+            APIResponseHandler.send_error_response(self, f"분할 업로드 처리 중 오류가 발생했습니다: {str(e)}")
+    
+    def do_GET(self):
+        try:
+            # 업로드 진행 상태 반환 (?upload_id=...)
+            query = parse_qs(urlparse(self.path).query)
+            upload_id = query.get('upload_id', [None])[0]
+            result = self.upload_session_controller.get_upload_status(
+                {'upload_id': upload_id, TENANT_FIELD: self._tenant()}
+            )
+            self._send_result(result)
+        
+        except Exception as e:
+            APIResponseHandler.send_error_response(self, f"업로드 상태 조회 중 오류가 발생했습니다: {str(e)}")
+    
+    def _tenant(self):
+        return tenant_resolver.resolve_headers(self.headers, self.client_address[0] if self.client_address else None)
+    
+    def _send_result(self, result):
+        if result.get('success'):
+            APIResponseHandler.send_success_response(self, result)
+        else:
+            APIResponseHandler.send_error_response(
+                self,
+                result.get('error', '분할 업로드 처리 중 오류가 발생했습니다.'),
+                result.get('status_code', 500)
+            )
+    
+    def do_OPTIONS(self):
+        APIResponseHandler.send_cors_response(self)
\ No newline at end of file
@@ -0,0 +1,70 @@
+"""
+문서 추출-번역 파이프라인 벤치마크 (추출 후 번역 vs 추출과 번역을 겹쳐 실행)
+
+사용법: python -m benchmarks.bench_document_pipeline [페이지 수] [페이지 추출 ms] [번역 호출 ms]
+
+페이지 추출(OCR 포함)과 LLM 번역 호출은 지정한 지연 시간으로 대신합니다.
+"""
+import sys
+import time
+from models.document import Document, FileType
+from models.translation import Language, TranslationResult
+from services.document_pipeline import DocumentPipeline
+from services.file_processor import FileProcessorService
+
+
+class SlowPageProcessor(FileProcessorService):
+    """페이지마다 고정 지연 후 텍스트를 반환하는 추출기"""
+
+    def __init__(self, page_count: int, page_seconds: float):
+        super().__init__()
+        self.page_count = page_count
+        self.page_seconds = page_seconds
+
+    def iter_document_pages(self, document, page_stats=None):
+        for index in range(self.page_count):
+            time.sleep(self.page_seconds)
+            yield "\n\n".join(
+                f"Page {index} paragraph {line}: The quick brown fox jumps over the lazy dog." for line in range(6)
+            )
+
+
+def make_translate(call_seconds: float):
+    """고정 지연 후 결과를 반환하는 번역 함수"""
+    def translate(text: str) -> TranslationResult:
+        time.sleep(call_seconds)
+        return TranslationResult(text, text.upper(), Language.ENGLISH, Language.KOREAN)
+    return translate
+
+
+def run_sequential(processor: SlowPageProcessor, document: Document, translate) -> float:
+    """기존 방식: 모든 페이지를 추출한 뒤 같은 기준의 구간으로 번역"""
+    started = time.perf_counter()
+    pages = list(processor.iter_document_pages(document))
+    extracted = FileProcessorService()
+    extracted.iter_document_pages = lambda document, page_stats=None: iter(pages)
+    DocumentPipeline(extracted).run(document, False, translate)
+    return (time.perf_counter() - started) * 1000
+
+
+def main():
+    page_count = int(sys.argv[1]) if len(sys.argv) > 1 else 40
+    page_seconds = (float(sys.argv[2]) if len(sys.argv) > 2 else 100) / 1000
+    call_seconds = (float(sys.argv[3]) if len(sys.argv) > 3 else 1500) / 1000
+
+    processor = SlowPageProcessor(page_count, page_seconds)
+    document = Document(file_name="bench.pdf", file_type=FileType.PDF, file_size=0, file_data=b"")
+    translate = make_translate(call_seconds)
+
+    sequential_ms = run_sequential(processor, document, translate)
+    _, stats = DocumentPipeline(processor).run(document, False, translate)
+
+    print(f"pages={page_count} extract_per_page={page_seconds * 1000:.0f}ms llm_call={call_seconds * 1000:.0f}ms")
+    print(f"{'mode':>10} {'total_ms':>9} {'first_ms':>9} {'segments':>8}")
+    print(f"{'sequential':>10} {sequential_ms:>9.0f} {'-':>9} {stats['segments']:>8}")
+    print(f"{'pipelined':>10} {stats['total_ms']:>9.0f} {stats['first_segment_ms']:>9.0f} {stats['segments']:>8}")
+    print(f"extract_ms={stats['extract_ms']:.0f} translate_ms={stats['translate_ms']:.0f} overlap_ms={stats['overlap_ms']:.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,64 @@
+"""
+DOCX 텍스트 추출 벤치마크 (python-docx 방식 vs 스트리밍 방식)
+
+사용법: python -m benchmarks.bench_docx_extraction
+"""
+import io
+import time
+import tracemalloc
+import docx
+from services.docx_stream_extractor import DocxStreamExtractor
+
+
+def generate_docx(paragraph_count: int) -> bytes:
+    """문단과 표가 섞인 DOCX 문서 생성"""
+    document = docx.Document()
+    document.sections[0].header.paragraphs[0].text = "머리글 - 문서 번역 서비스"
+    document.sections[0].footer.paragraphs[0].text = "바닥글 - 기밀"
+    for i in range(paragraph_count):
+        document.add_paragraph(f"문단 {i}: The quick brown fox jumps over the lazy dog. 빠른 갈색 여우가 게으른 개를 뛰어넘습니다.")
+        if i % 50 == 0:
+            table = document.add_table(rows=5, cols=4)
+            for r, row in enumerate(table.rows):
+                for c, cell in enumerate(row.cells):
+                    cell.text = f"셀 {r},{c}"
+    buffer = io.BytesIO()
+    document.save(buffer)
+    return buffer.getvalue()
+
+
+def extract_with_python_docx(file_bytes: bytes) -> str:
+    """기존 방식: python-docx 객체 모델로 문단만 추출"""
+    document = docx.Document(io.BytesIO(file_bytes))
+    return "\n".join(p.text for p in document.paragraphs).strip()
+
+
+def extract_with_stream(file_bytes: bytes) -> str:
+    """스트리밍 방식"""
+    return DocxStreamExtractor(io.BytesIO(file_bytes)).extract_text()
+
+
+def measure(func, file_bytes: bytes):
+    """실행 시간(ms)과 최대 메모리(MB) 측정"""
+    tracemalloc.start()
+    started = time.perf_counter()
+    text = func(file_bytes)
+    elapsed = (time.perf_counter() - started) * 1000
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return elapsed, peak / 1024 / 1024, len(text)
+
+
+def main():
+    print(f"{'paragraphs':>10} {'size_kb':>8} | {'docx_ms':>8} {'docx_mb':>8} {'chars':>8} | {'stream_ms':>9} {'stream_mb':>9} {'chars':>8}")
+    for paragraph_count in (1000, 5000, 20000):
+        file_bytes = generate_docx(paragraph_count)
+        legacy = measure(extract_with_python_docx, file_bytes)
+        stream = measure(extract_with_stream, file_bytes)
+        print(f"{paragraph_count:>10} {len(file_bytes) // 1024:>8} | "
+              f"{legacy[0]:>8.0f} {legacy[1]:>8.1f} {legacy[2]:>8} | "
+              f"{stream[0]:>9.0f} {stream[1]:>9.1f} {stream[2]:>8}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,55 @@
+"""
+추출 요약(TextRank / LSA) 문서 길이별 벤치마크
+
+사용법: python -m benchmarks.bench_extractive_summary [어휘 수]
+
+실제 문서처럼 어휘가 문장 수와 함께 늘어나도록 기본 단어에 Zipf 분포의 합성 단어를 섞습니다.
+"""
+import random
+import sys
+import time
+import tracemalloc
+from models.summary import SummaryRequest, SummaryMethod
+from services.extractive_summarizer import ExtractiveSummarizerService
+
+WORDS = (
+    "문서 번역 요약 서비스 모델 데이터 처리 성능 결과 분석 시스템 사용자 "
+    "document translation summary service model data processing result analysis system user "
+    "latency throughput memory request response quality sentence token"
+).split()
+
+
+def generate_text(sentence_count: int, vocabulary_size: int = 20000, seed: int = 42) -> str:
+    """임의 문장으로 구성된 텍스트 생성"""
+    rng = random.Random(seed)
+    vocabulary = WORDS + [f"term{i}" for i in range(vocabulary_size)]
+    weights = [1.0 / (rank + 1) for rank in range(len(vocabulary))]
+    sentences = []
+    for _ in range(sentence_count):
+        words = rng.choices(vocabulary, weights=weights, k=rng.randint(8, 24))
+        sentences.append(" ".join(words).capitalize() + ".")
+    return " ".join(sentences)
+
+
+def main():
+    vocabulary_size = int(sys.argv[1]) if len(sys.argv) > 1 else 20000
+    service = ExtractiveSummarizerService()
+    print(f"{'sentences':>10} {'chars':>10} | {'textrank_ms':>11} {'peak_mb':>8} | {'lsa_ms':>8} {'peak_mb':>8}")
+    for sentence_count in (10, 100, 500, 1000, 2000, 5000):
+        text = generate_text(sentence_count, vocabulary_size)
+        measurements = []
+        for method in (SummaryMethod.TEXTRANK, SummaryMethod.LSA):
+            request = SummaryRequest(text=text, method=method, sentences_count=3)
+            tracemalloc.start()
+            started = time.perf_counter()
+            service.summarize_text(request)
+            elapsed = (time.perf_counter() - started) * 1000
+            _, peak = tracemalloc.get_traced_memory()
+            tracemalloc.stop()
+            measurements.append((elapsed, peak / 1024 / 1024))
+        print(f"{sentence_count:>10} {len(text):>10} | {measurements[0][0]:>11.1f} {measurements[0][1]:>8.1f} | "
+              f"{measurements[1][0]:>8.1f} {measurements[1][1]:>8.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,79 @@
+"""
+이미지 OCR 벤치마크 (호출마다 tesseract 프로세스 실행 vs 상주 OCR 작업 풀)
+
+사용법: python -m benchmarks.bench_ocr [이미지 수] [병렬 수]
+
+엔진 차이만 비교하도록 같은 병렬 수끼리 측정합니다. 작업자 1개(순차 실행)와 병렬 수(기본값 OCR_WORKERS)에서
+tesseract 프로세스 실행은 스레드로, 작업 풀은 같은 수의 작업 프로세스로 실행합니다.
+tesserocr가 설치되어 있으면 작업 풀은 언어 데이터를 한 번만 로드한 엔진을 재사용합니다.
+"""
+import io
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+import pytesseract
+from PIL import Image, ImageDraw
+from config.settings import Settings
+from services.file_processor import _ocr_image_bytes
+from services.ocr_engine import OcrWorkerPool, ocr_backend
+
+
+def generate_image(index: int) -> bytes:
+    """텍스트 줄이 있는 PNG 이미지 생성"""
+    image = Image.new("L", (1240, 600), 255)
+    draw = ImageDraw.Draw(image)
+    for line in range(12):
+        draw.text((40, 30 + line * 45), f"Line {line} of page {index}: The quick brown fox jumps over the lazy dog.", fill=0)
+    buffer = io.BytesIO()
+    image.save(buffer, "PNG")
+    return buffer.getvalue()
+
+
+def _subprocess_ocr(data: bytes) -> str:
+    """기존 방식: pytesseract로 tesseract 프로세스 실행"""
+    return pytesseract.image_to_string(Image.open(io.BytesIO(data)), lang=Settings.OCR_LANGUAGES)
+
+
+def run_subprocess(images, workers: int) -> float:
+    """스레드 workers개에서 이미지마다 tesseract 프로세스 실행"""
+    started = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        list(executor.map(_subprocess_ocr, images))
+    return time.perf_counter() - started
+
+
+def run_pool(pool: OcrWorkerPool, images) -> float:
+    """상주 작업 풀로 실행"""
+    started = time.perf_counter()
+    futures = [pool.submit(_ocr_image_bytes, data) for data in images]
+    for future in futures:
+        future.result()
+    return time.perf_counter() - started
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 24
+    parallel = int(sys.argv[2]) if len(sys.argv) > 2 else max(Settings.OCR_WORKERS, 1)
+    try:
+        pytesseract.get_tesseract_version()
+    except Exception as e:
+        print(f"tesseract를 실행할 수 없습니다: {e}")
+        return
+
+    images = [generate_image(i) for i in range(count)]
+    print(f"backend={ocr_backend()} images={count}")
+    print(f"{'workers':>8} {'mode':>12} {'total_s':>8} {'per_image_ms':>13}")
+    for workers in sorted({1, parallel}):
+        pool = OcrWorkerPool(max_workers=workers)
+        # 작업 프로세스 시작과 엔진 로드는 측정에서 제외
+        run_pool(pool, images[:workers])
+        pool_seconds = run_pool(pool, images)
+        pool.shutdown()
+        subprocess_seconds = run_subprocess(images, workers)
+
+        for mode, seconds in (("subprocess", subprocess_seconds), ("pool", pool_seconds)):
+            print(f"{workers:>8} {mode:>12} {seconds:>8.2f} {seconds / count * 1000:>13.0f}")
+
+
+if __name__ == "__main__":
+    main()
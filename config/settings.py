@@ -1,6 +1,10 @@
 import os
+import json
 from typing import Optional
 
+_CPU_COUNT = os.cpu_count() or 1
+_SERVER_WORKERS = int(os.getenv('SERVER_WORKERS', str(_CPU_COUNT)))
+
 class Settings:
     """애플리케이션 설정 클래스"""
     
@@ -9,9 +13,43 @@ class Settings:
     OPENAI_MODEL: str = "gpt-4o"
     OPENAI_MAX_TOKENS: int = 2000
     OPENAI_TEMPERATURE: float = 0.3
+    OPENAI_TIMEOUT: float = float(os.getenv('OPENAI_TIMEOUT', '120'))
+    OPENAI_MAX_RETRIES: int = 2
+    # 비동기 클라이언트 연결 풀 (워커당 동시 LLM 호출 수)
+    OPENAI_MAX_CONNECTIONS: int = int(os.getenv('OPENAI_MAX_CONNECTIONS', '500'))
+    OPENAI_MAX_KEEPALIVE_CONNECTIONS: int = 100
+    
+    # LLM 호출 승인 제어 (워커 프로세스 단위)
+    LLM_MAX_IN_FLIGHT: int = int(os.getenv('LLM_MAX_IN_FLIGHT', '64'))
+    LLM_MAX_QUEUE: int = int(os.getenv('LLM_MAX_QUEUE', '256'))
+    LLM_QUEUE_TIMEOUT: float = float(os.getenv('LLM_QUEUE_TIMEOUT', '20'))
+    LLM_QUEUE_AGING_TOKENS_PER_SECOND: float = float(os.getenv('LLM_QUEUE_AGING_TOKENS_PER_SECOND', '2000'))  # 대기 1초마다 우선순위 비용 감소
+    
+    # 테넌트(API 키/사용자)별 가중 공정 스케줄링
+    # TENANT_API_KEYS: {"<API 키의 SHA-256 hex>": "<테넌트 ID>"} 형식의 JSON (원본 키는 설정에 두지 않음)
+    # TENANT_WEIGHTS / TENANT_TOKEN_QUOTAS: {"<테넌트 ID>": 값} 형식의 JSON
+    #   테넌트 ID는 API 키 테넌트 이름, Google 로그인 사용자는 "google:<sub>", 그 외는 "ip:<클라이언트 IP>"
+    TENANT_API_KEYS: dict = json.loads(os.getenv('TENANT_API_KEYS', '{}'))
+    TENANT_WEIGHTS: dict = json.loads(os.getenv('TENANT_WEIGHTS', '{}'))
+    TENANT_TOKEN_QUOTAS: dict = json.loads(os.getenv('TENANT_TOKEN_QUOTAS', '{}'))
+    TENANT_DEFAULT_WEIGHT: float = float(os.getenv('TENANT_DEFAULT_WEIGHT', '1.0'))
+    TENANT_DEFAULT_TOKEN_QUOTA: int = int(os.getenv('TENANT_DEFAULT_TOKEN_QUOTA', '0'))  # 분당 토큰, 0이면 무제한
+    TENANT_BATCH_WEIGHT_FACTOR: float = 0.25
+    TENANT_MAX_TRACKED: int = 10000
+    GOOGLE_CLIENT_ID: str = os.getenv('GOOGLE_CLIENT_ID', '')  # Bearer Google ID 토큰 검증용 (audience)
     
     # 파일 처리 설정
     MAX_FILE_SIZE: int = int(os.getenv('MAX_FILE_SIZE', '10485760'))  # 10MB
+    
+    # 분할 업로드 설정 (청크는 Base64 JSON 본문이 Vercel 요청 한도 4.5MB 안에 들어가도록 2MB)
+    MAX_UPLOAD_SESSION_SIZE: int = int(os.getenv('MAX_UPLOAD_SESSION_SIZE', '104857600'))  # 100MB
+    UPLOAD_CHUNK_SIZE: int = int(os.getenv('UPLOAD_CHUNK_SIZE', '2097152'))  # 2MB
+    UPLOAD_SPOOL_DIR: str = os.getenv('UPLOAD_SPOOL_DIR', '/tmp/dts-uploads')
+    UPLOAD_SESSION_TTL: int = int(os.getenv('UPLOAD_SESSION_TTL', '86400'))  # 마지막 청크 이후 24시간
+    # 테넌트별 동시 업로드 세션 수와 선언한 파일 크기 합계 한도 (0이면 무제한)
+    UPLOAD_SESSIONS_PER_TENANT: int = int(os.getenv('UPLOAD_SESSIONS_PER_TENANT', '4'))
+    UPLOAD_SPOOL_BYTES_PER_TENANT: int = int(os.getenv('UPLOAD_SPOOL_BYTES_PER_TENANT', '209715200'))  # 200MB
+    UPLOAD_FINALIZE_LOCK_TIMEOUT: int = 1800  # 완료 처리 잠금이 이보다 오래되면 비정상 종료로 보고 해제
     ALLOWED_FILE_TYPES: list = [
         'application/pdf',
         'application/vnd.openxmlformats-officedocument.wordprocessingml.document',
@@ -23,6 +61,48 @@ class Settings:
         'image/bmp'
     ]
     
+    # 메모리 예산 및 압축 폭탄 방지 설정
+    MAX_IMAGE_PIXELS: int = int(os.getenv('MAX_IMAGE_PIXELS', '50000000'))  # 디코딩 허용 최대 픽셀 수
+    OCR_MAX_PIXELS: int = int(os.getenv('OCR_MAX_PIXELS', '12000000'))  # OCR 전 축소 기준 픽셀 수
+    MAX_PDF_PAGES: int = int(os.getenv('MAX_PDF_PAGES', '500'))
+    MAX_EXTRACTED_CHARS: int = int(os.getenv('MAX_EXTRACTED_CHARS', '2000000'))
+    MAX_DOCX_UNCOMPRESSED_BYTES: int = int(os.getenv('MAX_DOCX_UNCOMPRESSED_BYTES', '209715200'))  # 200MB
+    PDF_MEMORY_FACTOR: int = 8  # PDF 파싱 시 파일 크기 대비 예상 메모리 배수
+    MEMORY_BUDGET_BYTES: int = int(os.getenv('MEMORY_BUDGET_BYTES', '1073741824'))  # 프로세스당 1GB
+    MEMORY_BUDGET_WAIT_TIMEOUT: float = float(os.getenv('MEMORY_BUDGET_WAIT_TIMEOUT', '10'))
+    
+    # OCR 설정 (이미지 업로드 및 텍스트 레이어가 없는 PDF 페이지)
+    OCR_LANGUAGES: str = os.getenv('OCR_LANGUAGES', 'kor+eng')
+    # 서버 워커 프로세스마다 만드는 OCR 작업 프로세스 수 (기본값은 호스트 CPU를 서버 워커끼리 나눈 수)
+    # 0이면 요청 스레드에서 직접 실행
+    OCR_WORKERS: int = int(os.getenv('OCR_WORKERS') or max(1, _CPU_COUNT // max(1, _SERVER_WORKERS)))
+    OCR_PDF_FALLBACK: bool = os.getenv('OCR_PDF_FALLBACK', 'true').lower() == 'true'
+    OCR_MIN_PAGE_CHARS: int = 20  # 추출된 글자 수가 이보다 적은 페이지는 스캔 페이지로 간주
+    
+    # 텍스트 정규화 설정 (추출 후 LLM 호출 전)
+    NORMALIZE_UPLOADS: bool = os.getenv('NORMALIZE_UPLOADS', 'false').lower() == 'true'
+    NORMALIZE_BOILERPLATE_SAMPLE_PAGES: int = 8  # 반복 머리글/바닥글 학습에 사용할 앞쪽 페이지 수
+    NORMALIZE_BOILERPLATE_EDGE_LINES: int = 2  # 페이지 위아래에서 검사할 줄 수
+    NORMALIZE_BOILERPLATE_MIN_RATIO: float = 0.5  # 학습 페이지 중 이 비율 이상 반복되면 제거
+    
+    # 번역 메모리 설정 (이전 번역 문단 재사용)
+    TRANSLATION_MEMORY_ENABLED: bool = os.getenv('TRANSLATION_MEMORY_ENABLED', 'true').lower() == 'true'
+    TRANSLATION_MEMORY_MAX_ENTRIES: int = int(os.getenv('TRANSLATION_MEMORY_MAX_ENTRIES', '50000'))
+    TRANSLATION_MEMORY_MIN_SIMILARITY: float = 0.6  # 근사 중복으로 볼 최소 자카드 유사도 (MinHash 추정)
+    TRANSLATION_MEMORY_MIN_CHARS: int = 40  # 이보다 짧은 문단은 완전 일치만 재사용
+    TRANSLATION_MEMORY_MAX_REFERENCES: int = 5  # 구간당 참고 번역 최대 개수
+    
+    # 긴 문서 구간 처리 및 체크포인트 설정 (구간 분할은 체크포인트를 켠 경우에만, 끄면 한 번에 처리)
+    TRANSLATION_SEGMENT_TOKENS: int = int(os.getenv('TRANSLATION_SEGMENT_TOKENS', '1500'))  # 번역 출력이 OPENAI_MAX_TOKENS를 넘지 않도록
+    SUMMARY_SEGMENT_TOKENS: int = int(os.getenv('SUMMARY_SEGMENT_TOKENS', '8000'))  # 초과하면 구간별 요약 후 다시 요약
+    CHECKPOINT_ENABLED: bool = os.getenv('CHECKPOINT_ENABLED', 'true').lower() == 'true'
+    CHECKPOINT_DB_PATH: str = os.getenv('CHECKPOINT_DB_PATH', '/tmp/dts-checkpoints/checkpoints.db')
+    CHECKPOINT_TTL: int = int(os.getenv('CHECKPOINT_TTL', '604800'))  # 7일
+    
+    # 문서 추출-번역 파이프라인 설정
+    DOCUMENT_PIPELINE_ENABLED: bool = os.getenv('DOCUMENT_PIPELINE_ENABLED', 'true').lower() == 'true'
+    DOCUMENT_PIPELINE_QUEUE_SIZE: int = int(os.getenv('DOCUMENT_PIPELINE_QUEUE_SIZE', '4'))  # 단계 사이 대기 항목 수 (페이지/구간)
+    
     # 번역 설정
     SUPPORTED_LANGUAGES: dict = {
         "ko": "한국어",
@@ -39,18 +119,51 @@ class Settings:
     MIN_SENTENCES: int = 1
     MAX_SENTENCES: int = 10
     DEFAULT_SENTENCES: int = 3
+    TEXTRANK_DAMPING: float = 0.85
+    TEXTRANK_MAX_ITERATIONS: int = 100
+    TEXTRANK_TOLERANCE: float = 1e-6
+    PREREDUCE_TOKEN_BUDGET: int = int(os.getenv('PREREDUCE_TOKEN_BUDGET', '3000'))
+    PREREDUCE_MMR_LAMBDA: float = 0.7
     
     # API 설정
     API_TIMEOUT: int = 30
     CORS_ORIGINS: list = ["*"]
     
+    # 요청 프로파일링 설정 (api/*.py 핸들러)
+    PROFILE_SAMPLE_RATE: float = float(os.getenv('PROFILE_SAMPLE_RATE', '0'))  # 0~1, 0이면 샘플링 안 함
+    PROFILE_HEADER_TOKEN: str = os.getenv('PROFILE_HEADER_TOKEN', '')  # X-Profile 헤더 값, 비어 있으면 헤더 트리거 비활성화
+    PROFILE_INTERVAL_MS: float = float(os.getenv('PROFILE_INTERVAL_MS', '5'))
+    PROFILE_OUTPUT_DIR: str = os.getenv('PROFILE_OUTPUT_DIR', '/tmp/dts-profiles')
+    
+    # 자체 호스팅 서버 설정 (python -m server)
+    SERVER_HOST: str = os.getenv('SERVER_HOST', '0.0.0.0')
+    SERVER_PORT: int = int(os.getenv('SERVER_PORT', '8000'))
+    SERVER_WORKERS: int = _SERVER_WORKERS
+    SERVER_KEEP_ALIVE: int = int(os.getenv('SERVER_KEEP_ALIVE', '5'))
+    SERVER_GRACEFUL_SHUTDOWN_TIMEOUT: int = int(os.getenv('SERVER_GRACEFUL_SHUTDOWN_TIMEOUT', '30'))
+    SERVER_READINESS_DRAIN_SECONDS: float = float(os.getenv('SERVER_READINESS_DRAIN_SECONDS', '5'))  # 종료 신호 후 readiness 503을 유지한 채 기다릴 시간
+    
     @classmethod
     def validate(cls) -> bool:
         """설정 유효성 검사"""
         if not cls.OPENAI_API_KEY:
             raise ValueError("OPENAI_API_KEY가 설정되지 않았습니다.")
+        cls.validate_tenants()
         return True
     
+    @classmethod
+    def validate_tenants(cls) -> None:
+        """테넌트 가중치/할당량 설정 검사 (가중치는 0보다 커야 함)"""
+        weights = {"TENANT_DEFAULT_WEIGHT": cls.TENANT_DEFAULT_WEIGHT,
+                   "TENANT_BATCH_WEIGHT_FACTOR": cls.TENANT_BATCH_WEIGHT_FACTOR}
+        weights.update({f"TENANT_WEIGHTS[{tenant_id}]": weight for tenant_id, weight in cls.TENANT_WEIGHTS.items()})
+        for name, weight in weights.items():
+            if not isinstance(weight, (int, float)) or isinstance(weight, bool) or weight <= 0:
+                raise ValueError(f"{name} 가중치는 0보다 큰 숫자여야 합니다: {weight}")
+        for tenant_id, quota in cls.TENANT_TOKEN_QUOTAS.items():
+            if not isinstance(quota, int) or isinstance(quota, bool) or quota < 0:
+                raise ValueError(f"TENANT_TOKEN_QUOTAS[{tenant_id}] 할당량은 0 이상의 정수여야 합니다: {quota}")
+    
     @classmethod
     def get_openai_config(cls) -> dict:
         """OpenAI 설정 반환"""
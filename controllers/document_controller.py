@@ -1,6 +1,13 @@
-from typing import Dict, Any
+from typing import Dict, Any, List, Optional
+from config.settings import Settings
+from controllers.request_options import parse_flag, request_tenant
+from controllers.translation_controller import TranslationController
 from models.document import Document
+from models.translation import TranslationRequest, TranslationResult, Language
+from services.document_pipeline import DocumentPipeline
 from services.file_processor import FileProcessorService
+from services.request_profiler import profile_stage
+from services.text_segmenter import join_paragraphs
 from views.error_handler import ErrorHandler
 
 class DocumentController:
@@ -9,32 +16,138 @@ class DocumentController:
     def __init__(self):
         """문서 컨트롤러 초기화"""
         self.file_processor = FileProcessorService()
+        self.document_pipeline = DocumentPipeline(self.file_processor)
+        self._translation_controller = None
+    
+    @property
+    def translation_controller(self) -> TranslationController:
+        """번역 컨트롤러 (번역을 함께 요청한 경우에만 생성)"""
+        if self._translation_controller is None:
+            self._translation_controller = TranslationController()
+        return self._translation_controller
     
     def process_document(self, data: Dict[str, Any]) -> Dict[str, Any]:
-        """문서 처리"""
+        """문서 처리 (target_lang을 지정하면 추출한 텍스트를 번역까지 수행)"""
         try:
             # 요청 데이터 검증
             self._validate_document_request(data)
             
+            if data.get('target_lang'):
+                self.translation_controller.validate_languages(data)
+                with profile_stage("decode"):
+                    document = self.file_processor.create_document_from_upload(
+                        data['file_data'], data['file_type'], data['file_name']
+                    )
+                return self._translate_document(document, data)
+            
             # 문서 처리
             document = self.file_processor.process_document(
                 file_data=data['file_data'],
                 file_type=data['file_type'],
-                file_name=data['file_name']
+                file_name=data['file_name'],
+                normalize=parse_flag(data, 'normalize')
             )
             
             # 결과 반환
-            return {
-                "success": True,
-                "file_name": document.file_name,
-                "file_type": document.file_type.value,
-                "extracted_text": document.extracted_text,
-                "text_length": document.text_length
-            }
+            return self._build_response(document)
+            
+        except Exception as e:
+            return ErrorHandler.get_error_response(e)
+    
+    def process_spooled_document(self, file_path: str, file_type: str, file_name: str,
+                                 normalize: Optional[bool] = None,
+                                 translation: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        """분할 업로드로 스풀된 문서 처리 (translation에 target_lang이 있으면 번역까지 수행)"""
+        try:
+            if translation and translation.get('target_lang'):
+                self.translation_controller.validate_languages(translation)
+                with profile_stage("decode"):
+                    document = self.file_processor.create_document_from_file(file_path, file_type, file_name)
+                return self._translate_document(document, {**translation, 'normalize': normalize})
+            
+            document = self.file_processor.process_spooled_file(
+                file_path=file_path,
+                file_type=file_type,
+                file_name=file_name,
+                normalize=normalize
+            )
+            return self._build_response(document)
             
         except Exception as e:
             return ErrorHandler.get_error_response(e)
     
+    def _translate_document(self, document: Document, options: Dict[str, Any]) -> Dict[str, Any]:
+        """문서 텍스트 추출 후 번역
+
+        DOCUMENT_PIPELINE_ENABLED이면 앞쪽 페이지를 추출하는 대로 정규화와 번역을 시작하고,
+        아니면 추출을 모두 마친 뒤 번역합니다.
+        """
+        normalize = parse_flag(options, 'normalize')
+        if normalize is None:
+            normalize = Settings.NORMALIZE_UPLOADS
+        source_language = Language(options.get('source_lang', 'auto'))
+        target_language = Language(options['target_lang'])
+        memory_scope = self.translation_controller.memory_scope(options)
+        # 파이프라인은 문서를 구간으로 나누어 하나씩 번역하므로, 실패 후 재시도할 때 끝난 구간을
+        # 다시 번역하지 않도록 구간마다 체크포인트
+        pipelined = Settings.DOCUMENT_PIPELINE_ENABLED
+        
+        def translate(text: str) -> TranslationResult:
+            request = TranslationRequest(text=text, source_language=source_language, target_language=target_language)
+            return self.translation_controller.translate_request(request, memory_scope, request_tenant(options),
+                                                                 checkpoint=pipelined)
+        
+        if pipelined:
+            results, pipeline = self.document_pipeline.run(document, normalize, translate)
+        else:
+            document = self.file_processor.process_loaded_document(document, normalize)
+            results = [translate(document.extracted_text)] if document.extracted_text.strip() else []
+            pipeline = None
+        
+        if not results:
+            raise ValueError("번역할 텍스트가 비어있습니다.")
+        
+        response = self._build_response(document)
+        response["translation"] = self._merge_translations(results, source_language, target_language)
+        if pipeline is not None:
+            response["pipeline"] = pipeline
+        return response
+    
+    def _merge_translations(self, results: List[TranslationResult], source_language: Language,
+                            target_language: Language) -> Dict[str, Any]:
+        """구간별 번역 결과를 원문 순서대로 합침 (원문은 extracted_text와 같으므로 제외)"""
+        usages = [result.usage for result in results if result.usage]
+        usage = None
+        if usages:
+            usage = {"prompt_template": usages[-1].get("prompt_template")}
+            for name in ("prompt_tokens", "cached_tokens", "completion_tokens"):
+                usage[name] = sum(item.get(name, 0) for item in usages)
+        
+        return {
+            "translated_text": join_paragraphs([result.translated_text for result in results]),
+            "source_language": source_language.value,
+            "target_language": target_language.value,
+            "model": results[-1].model,
+            "segments": len(results),
+            "usage": usage
+        }
+    
+    def _build_response(self, document: Document) -> Dict[str, Any]:
+        """문서 처리 결과 응답 생성"""
+        response = {
+            "success": True,
+            "file_name": document.file_name,
+            "file_type": document.file_type.value,
+            "extracted_text": document.extracted_text,
+            "text_length": document.text_length
+        }
+        if document.normalization is not None:
+            response["normalization"] = document.normalization
+        if document.page_stats is not None:
+            response["page_stats"] = document.page_stats
+            response["ocr_pages"] = sum(1 for stat in document.page_stats if stat["source"] == "ocr")
+        return response
+    
     def _validate_document_request(self, data: Dict[str, Any]) -> None:
         """문서 요청 데이터 검증"""
         required_fields = ['file_data', 'file_type', 'file_name']
@@ -0,0 +1,39 @@
+from typing import Any, Dict, Optional, Tuple
+from services.text_normalizer import TextNormalizer
+
+# 서버가 검증한 테넌트 ID를 넣는 요청 필드 (클라이언트가 보낸 값은 서버가 항상 덮어씀)
+TENANT_FIELD = '_tenant'
+
+
+def parse_flag(data: Dict[str, Any], field: str, default: Optional[bool] = None) -> Optional[bool]:
+    """요청의 불리언 옵션 해석 (JSON true/false 또는 "true"/"false" 문자열만 허용, 없으면 default)"""
+    value = data.get(field)
+    if value is None:
+        return default
+    if isinstance(value, bool):
+        return value
+    if isinstance(value, str) and value.strip().lower() in ('true', 'false'):
+        return value.strip().lower() == 'true'
+    raise ValueError(f"{field} 값은 true 또는 false여야 합니다: {value}")
+
+
+def normalize_text_input(data: Dict[str, Any],
+                         normalizer: TextNormalizer) -> Tuple[Dict[str, Any], Optional[Dict[str, Any]]]:
+    """normalize 옵션이 있으면 처리 전에 요청 텍스트 정규화 (정규화하지 않으면 통계는 None)"""
+    if not parse_flag(data, 'normalize', False) or not isinstance(data.get('text'), str):
+        return data, None
+    text, stats = normalizer.normalize_text(data['text'])
+    return {**data, 'text': text}, stats
+
+
+def attach_normalization(response: Dict[str, Any], normalization: Optional[Dict[str, Any]]) -> Dict[str, Any]:
+    """응답에 정규화 통계 추가"""
+    if normalization is not None:
+        response["normalization"] = normalization
+    return response
+
+
+def request_tenant(data: Dict[str, Any]) -> Optional[str]:
+    """서버가 넣어 준 테넌트 ID (직접 호출하여 없으면 None)"""
+    tenant_id = data.get(TENANT_FIELD)
+    return tenant_id if isinstance(tenant_id, str) else None
@@ -1,6 +1,16 @@
-from typing import Dict, Any
+import asyncio
+from dataclasses import replace
+from typing import Dict, Any, Optional, Tuple
 from models.summary import SummaryRequest, SummaryResult, SummaryMethod
-from services.openai_service import OpenAIService
+from services.openai_service import OpenAIService, AsyncOpenAIService
+from services.extractive_summarizer import ExtractiveSummarizerService
+from services.request_profiler import profile_stage
+from services.text_normalizer import TextNormalizer
+from services.summary_plan import SummaryPlan
+from services.checkpoint_store import checkpoint_store, checkpoint_key
+from services.segment_executor import SegmentExecutor, run_sync
+from controllers.request_options import parse_flag, normalize_text_input, attach_normalization, request_tenant
+from config.settings import Settings
 from views.error_handler import ErrorHandler
 
 class SummaryController:
@@ -8,43 +18,161 @@ class SummaryController:
     
     def __init__(self):
         """요약 컨트롤러 초기화"""
-        self.openai_service = OpenAIService()
+        self._openai_service = None
+        self.extractive_service = ExtractiveSummarizerService()
+        self._async_openai_service = None
+        self.text_normalizer = TextNormalizer()
+        self.checkpoint_store = checkpoint_store
+    
+    @property
+    def openai_service(self) -> OpenAIService:
+        """GPT 서비스 (처음 사용할 때 생성, 추출 요약만 사용하면 API 키 불필요)"""
+        if self._openai_service is None:
+            self._openai_service = OpenAIService()
+        return self._openai_service
+    
+    @property
+    def async_openai_service(self) -> AsyncOpenAIService:
+        """비동기 서비스 (처음 사용할 때 생성)"""
+        if self._async_openai_service is None:
+            self._async_openai_service = AsyncOpenAIService()
+        return self._async_openai_service
     
     def summarize_text(self, data: Dict[str, Any]) -> Dict[str, Any]:
         """텍스트 요약 처리"""
         try:
-            # 요청 데이터 검증
-            self._validate_summary_request(data)
+            data, normalization = normalize_text_input(data, self.text_normalizer)
+            request = self._build_summary_request(data)
             
-            # SummaryRequest 객체 생성
-            request = SummaryRequest(
-                text=data['text'],
-                method=SummaryMethod(data.get('method', 'gpt')),
-                sentences_count=int(data.get('sentences_count', 3))
-            )
+            # 요약 실행 (추출 요약은 로컬에서 처리)
+            if self._is_extractive(request):
+                with profile_stage("extractive"):
+                    result = self.extractive_service.summarize_text(request)
+            elif request.prereduce:
+                with profile_stage("prereduce"):
+                    reduced_request, stats = self._prereduce(request)
+                result = self.openai_service.summarize_text(reduced_request)
+                self._apply_prereduction(result, request, stats)
+            else:
+                executor = SegmentExecutor.sync(self.openai_service.summarize_text)
+                result = run_sync(self._execute_summary_plan(request, request_tenant(data), executor))
+            
+            # 결과 반환
+            return attach_normalization(result.to_dict(), normalization)
+            
+        except Exception as e:
+            return ErrorHandler.get_error_response(e)
+    
+    async def summarize_text_async(self, data: Dict[str, Any]) -> Dict[str, Any]:
+        """텍스트 요약 처리 (비동기, CPU 작업은 스레드에서 실행)"""
+        try:
+            data, normalization = normalize_text_input(data, self.text_normalizer)
+            request = self._build_summary_request(data)
             
-            # 요약 실행
-            result = self.openai_service.summarize_text(request)
+            # 요약 실행 (추출 요약은 로컬에서 처리)
+            if self._is_extractive(request):
+                result = await asyncio.to_thread(self.extractive_service.summarize_text, request)
+            elif request.prereduce:
+                reduced_request, stats = await asyncio.to_thread(self._prereduce, request)
+                result = await self.async_openai_service.summarize_text(reduced_request)
+                self._apply_prereduction(result, request, stats)
+            else:
+                executor = SegmentExecutor.threaded(self.async_openai_service.summarize_text)
+                result = await self._execute_summary_plan(request, request_tenant(data), executor)
             
             # 결과 반환
-            return {
-                "success": True,
-                "original_text": result.original_text,
-                "summary": result.summary,
-                "method": result.method.value,
-                "sentences_count": result.sentences_count,
-                "original_length": result.original_length,
-                "summary_length": result.summary_length,
-                "model": result.model
-            }
+            return attach_normalization(result.to_dict(), normalization)
             
         except Exception as e:
             return ErrorHandler.get_error_response(e)
     
+    async def aclose(self) -> None:
+        """비동기 서비스 연결 정리"""
+        if self._async_openai_service is not None:
+            await self._async_openai_service.close()
+    
+    def _build_summary_request(self, data: Dict[str, Any]) -> SummaryRequest:
+        """요청 데이터 검증 후 SummaryRequest 객체 생성"""
+        self._validate_summary_request(data)
+        
+        return SummaryRequest(
+            text=data['text'],
+            method=SummaryMethod(data.get('method', 'gpt')),
+            sentences_count=int(data.get('sentences_count', 3)),
+            prereduce=parse_flag(data, 'prereduce', False),
+            token_budget=int(data['token_budget']) if data.get('token_budget') is not None else None
+        )
+    
+    async def _execute_summary_plan(self, request: SummaryRequest, tenant_id: Optional[str],
+                                    executor: SegmentExecutor) -> SummaryResult:
+        """GPT 요약 (체크포인트를 켠 경우 긴 문서는 구간별 요약 결과를 체크포인트하며 요약한 뒤 다시 요약)"""
+        plan = SummaryPlan(request)
+        if not plan.segmented:
+            return await executor.call(request)
+        
+        for index, segment in plan.pending_requests():
+            plan.complete(index, *await self._checkpointed_summary(segment, tenant_id, executor))
+        return plan.build_result(*await self._checkpointed_summary(plan.reduce_request(), tenant_id, executor))
+    
+    async def _checkpointed_summary(self, request: SummaryRequest, tenant_id: Optional[str],
+                                    executor: SegmentExecutor) -> Tuple[SummaryResult, bool]:
+        """체크포인트가 있으면 재사용하고 없으면 요약 후 저장 (결과, 재사용 여부)"""
+        key = self._checkpoint_key(request, tenant_id)
+        cached = await executor.run_blocking(self.checkpoint_store.load, key) if key else None
+        if cached is not None:
+            return self._restore_checkpoint(request, cached), True
+        result = await executor.call(request)
+        if key:
+            await executor.run_blocking(self.checkpoint_store.save, key, "summary", {
+                "summary": result.summary,
+                "model": result.model,
+                "usage": result.usage
+            })
+        return result, False
+    
+    def _restore_checkpoint(self, request: SummaryRequest, cached: Dict[str, Any]) -> SummaryResult:
+        """체크포인트(요약문과 사용량만 저장)에서 구간 결과 복원"""
+        return SummaryResult(
+            original_text=request.text,
+            summary=cached["summary"],
+            method=request.method,
+            sentences_count=request.sentences_count,
+            original_length=len(request.text.split()),
+            summary_length=len(cached["summary"].split()),
+            model=cached.get("model") or Settings.OPENAI_MODEL,
+            usage=cached.get("usage")
+        )
+    
+    def _checkpoint_key(self, request: SummaryRequest, tenant_id: Optional[str]) -> Optional[str]:
+        """테넌트별 구간 체크포인트 키 (체크포인트를 끈 경우 None)"""
+        if not Settings.CHECKPOINT_ENABLED:
+            return None
+        return checkpoint_key("summary", self.openai_service.summary_checkpoint_params(request),
+                              request.text, tenant_id)
+    
+    def _is_extractive(self, request: SummaryRequest) -> bool:
+        """로컬 추출 요약 방법 여부"""
+        return request.method in (SummaryMethod.TEXTRANK, SummaryMethod.LSA)
+    
+    def _prereduce(self, request: SummaryRequest) -> Tuple[SummaryRequest, Dict[str, Any]]:
+        """로컬 추출 단계로 문장을 선별하여 GPT에 보낼 요청 생성"""
+        token_budget = request.token_budget or Settings.PREREDUCE_TOKEN_BUDGET
+        reduced_text, stats = self.extractive_service.reduce_text(request.text, token_budget)
+        return replace(request, text=reduced_text), stats
+    
+    def _apply_prereduction(self, result: SummaryResult, request: SummaryRequest, stats: Dict[str, Any]) -> None:
+        """응답에는 원문 기준 정보를 유지하고 사전 축소 통계를 추가"""
+        result.original_text = request.text
+        result.original_length = len(request.text.split())
+        result.prereduction = stats
+    
     def get_summary_methods(self) -> Dict[str, Any]:
         """지원하는 요약 방법 반환"""
         try:
-            methods = self.openai_service.get_summary_methods()
+            methods = {
+                **OpenAIService.get_summary_methods(),
+                **self.extractive_service.get_summary_methods()
+            }
             return {
                 "success": True,
                 "methods": methods
@@ -66,7 +194,7 @@ class SummaryController:
             raise ValueError("요약할 텍스트가 비어있습니다.")
         
         # 요약 방법 검증
-        valid_methods = ['gpt', 'brief']
+        valid_methods = [method.value for method in SummaryMethod]
         method = data.get('method', 'gpt')
         if method not in valid_methods:
             raise ValueError(f"지원하지 않는 요약 방법입니다: {method}")
@@ -79,3 +207,12 @@ class SummaryController:
                 raise ValueError("문장 수는 1-10 사이여야 합니다.")
         except (ValueError, TypeError):
             raise ValueError("문장 수는 숫자여야 합니다.")
+        
+        # 토큰 예산 검증
+        if data.get('token_budget') is not None:
+            try:
+                token_budget = int(data['token_budget'])
+            except (ValueError, TypeError):
+                raise ValueError("토큰 예산은 숫자여야 합니다.")
+            if token_budget < 1:
+                raise ValueError("토큰 예산은 1 이상이어야 합니다.")
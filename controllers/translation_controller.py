@@ -1,6 +1,13 @@
-from typing import Dict, Any
+from typing import Dict, Any, Optional
 from models.translation import TranslationRequest, TranslationResult, Language
-from services.openai_service import OpenAIService
+from services.openai_service import OpenAIService, AsyncOpenAIService
+from services.text_normalizer import TextNormalizer
+from services.translation_memory import translation_memory, TranslationPlan
+from services.checkpoint_store import checkpoint_store, checkpoint_key
+from services.segment_executor import SegmentExecutor, run_sync
+from services.tenant_identity import is_verified_tenant
+from controllers.request_options import parse_flag, normalize_text_input, attach_normalization, request_tenant
+from config.settings import Settings
 from views.error_handler import ErrorHandler
 
 class TranslationController:
@@ -9,36 +16,137 @@ class TranslationController:
     def __init__(self):
         """번역 컨트롤러 초기화"""
         self.openai_service = OpenAIService()
+        self._async_openai_service = None
+        self.text_normalizer = TextNormalizer()
+        self.translation_memory = translation_memory
+        self.checkpoint_store = checkpoint_store
+    
+    @property
+    def async_openai_service(self) -> AsyncOpenAIService:
+        """비동기 서비스 (처음 사용할 때 생성)"""
+        if self._async_openai_service is None:
+            self._async_openai_service = AsyncOpenAIService()
+        return self._async_openai_service
     
     def translate_text(self, data: Dict[str, Any]) -> Dict[str, Any]:
         """텍스트 번역 처리"""
         try:
-            # 요청 데이터 검증
-            self._validate_translation_request(data)
-            
-            # TranslationRequest 객체 생성
-            request = TranslationRequest(
-                text=data['text'],
-                source_language=Language(data.get('source_lang', 'auto')),
-                target_language=Language(data['target_lang'])
-            )
+            data, normalization = normalize_text_input(data, self.text_normalizer)
+            request = self._build_translation_request(data)
             
             # 번역 실행
-            result = self.openai_service.translate_text(request)
+            result = self.translate_request(request, self.memory_scope(data), request_tenant(data))
             
             # 결과 반환
-            return {
-                "success": True,
-                "original_text": result.original_text,
-                "translated_text": result.translated_text,
-                "source_language": result.source_language.value,
-                "target_language": result.target_language.value,
-                "model": result.model
-            }
+            return attach_normalization(result.to_dict(), normalization)
             
         except Exception as e:
             return ErrorHandler.get_error_response(e)
     
+    async def translate_text_async(self, data: Dict[str, Any]) -> Dict[str, Any]:
+        """텍스트 번역 처리 (비동기)"""
+        try:
+            data, normalization = normalize_text_input(data, self.text_normalizer)
+            request = self._build_translation_request(data)
+            
+            # 번역 실행 (번역 메모리에서 재사용할 수 있는 문단은 LLM 호출 제외, 긴 문서는 구간별 체크포인트)
+            plan = self._build_plan(request, self.memory_scope(data))
+            executor = SegmentExecutor.threaded(self.async_openai_service.translate_text)
+            result = await self._execute_plan(plan, request_tenant(data), executor)
+            
+            # 결과 반환
+            return attach_normalization(result.to_dict(), normalization)
+            
+        except Exception as e:
+            return ErrorHandler.get_error_response(e)
+    
+    async def aclose(self) -> None:
+        """비동기 서비스 연결 정리"""
+        if self._async_openai_service is not None:
+            await self._async_openai_service.close()
+    
+    def translate_request(self, request: TranslationRequest, memory_scope: Optional[str] = None,
+                          tenant_id: Optional[str] = None, checkpoint: bool = False) -> TranslationResult:
+        """번역 요청 실행 (memory_scope 테넌트의 번역 메모리에서 재사용할 수 있는 문단은 LLM 호출 제외,
+        긴 문서는 tenant_id별 구간 체크포인트)
+
+        checkpoint이면 구간 수와 관계없이 체크포인트합니다 (문서 파이프라인처럼 호출한 쪽에서 문서를 나눈 경우).
+        """
+        plan = self._build_plan(request, memory_scope)
+        executor = SegmentExecutor.sync(self.openai_service.translate_text)
+        return run_sync(self._execute_plan(plan, tenant_id, executor, checkpoint))
+    
+    async def _execute_plan(self, plan: TranslationPlan, tenant_id: Optional[str],
+                            executor: SegmentExecutor, checkpoint: bool = False) -> TranslationResult:
+        """번역 계획 실행 (체크포인트가 있는 구간은 재사용하고 나머지 구간만 번역)"""
+        for index, segment in plan.pending_requests():
+            key = self._checkpoint_key(plan, segment, tenant_id, checkpoint)
+            cached = await executor.run_blocking(self.checkpoint_store.load, key) if key else None
+            if cached is not None:
+                plan.complete(index, self._restore_checkpoint(segment, cached), reused=True)
+                continue
+            segment_result = await executor.call(segment)
+            if key:
+                await executor.run_blocking(self.checkpoint_store.save, key, "translation", {
+                    "translated_text": segment_result.translated_text,
+                    "model": segment_result.model,
+                    "usage": segment_result.usage
+                })
+            plan.complete(index, segment_result)
+        return plan.build_result()
+    
+    def _restore_checkpoint(self, segment: TranslationRequest, cached: Dict[str, Any]) -> TranslationResult:
+        """체크포인트(번역문과 사용량만 저장)에서 구간 결과 복원"""
+        return TranslationResult(
+            original_text=segment.text,
+            translated_text=cached["translated_text"],
+            source_language=segment.source_language,
+            target_language=segment.target_language,
+            model=cached.get("model") or Settings.OPENAI_MODEL,
+            usage=cached.get("usage")
+        )
+    
+    def memory_scope(self, data: Dict[str, Any]) -> Optional[str]:
+        """번역 메모리 범위 (검증된 테넌트만 자기 메모리를 사용, 요청에서 use_memory=false로 끌 수 있음)
+
+        IP로만 식별한 요청은 같은 IP의 다른 사용자와 원문/번역이 섞일 수 있으므로 메모리를 쓰지 않습니다.
+        """
+        tenant_id = request_tenant(data)
+        if not parse_flag(data, 'use_memory', True) or not is_verified_tenant(tenant_id):
+            return None
+        return tenant_id
+    
+    def _build_plan(self, request: TranslationRequest, memory_scope: Optional[str]) -> TranslationPlan:
+        """번역 계획 생성"""
+        if not Settings.TRANSLATION_MEMORY_ENABLED:
+            memory_scope = None
+        return TranslationPlan(request, self.translation_memory, scope=memory_scope)
+    
+    def _checkpoint_key(self, plan: TranslationPlan, segment: TranslationRequest,
+                        tenant_id: Optional[str], checkpoint: bool = False) -> Optional[str]:
+        """테넌트별 구간 체크포인트 키 (체크포인트 대상이 아니면 None)"""
+        if not Settings.CHECKPOINT_ENABLED or not (checkpoint or plan.checkpointed):
+            return None
+        return checkpoint_key("translation", self.openai_service.translation_checkpoint_params(segment),
+                              segment.text, tenant_id)
+    
+    def get_translation_memory_stats(self) -> Dict[str, Any]:
+        """번역 메모리 조회 지연 시간 및 적중률 반환"""
+        try:
+            return {"success": True, **self.translation_memory.stats()}
+        except Exception as e:
+            return ErrorHandler.get_error_response(e)
+    
+    def _build_translation_request(self, data: Dict[str, Any]) -> TranslationRequest:
+        """요청 데이터 검증 후 TranslationRequest 객체 생성"""
+        self._validate_translation_request(data)
+        
+        return TranslationRequest(
+            text=data['text'],
+            source_language=Language(data.get('source_lang', 'auto')),
+            target_language=Language(data['target_lang'])
+        )
+    
     def get_supported_languages(self) -> Dict[str, Any]:
         """지원하는 언어 목록 반환"""
         try:
@@ -63,6 +171,10 @@ class TranslationController:
         if len(data['text'].strip()) == 0:
             raise ValueError("번역할 텍스트가 비어있습니다.")
         
+        self.validate_languages(data)
+    
+    def validate_languages(self, data: Dict[str, Any]) -> None:
+        """원본/대상 언어 코드 검증"""
         # 언어 코드 검증
         valid_languages = list(self.openai_service.get_supported_languages().keys()) + ['auto']
         if data['target_lang'] not in valid_languages:
@@ -0,0 +1,117 @@
+import base64
+import binascii
+from typing import Dict, Any
+from controllers.document_controller import DocumentController
+from controllers.request_options import parse_flag, request_tenant
+from services.upload_session import UploadSessionService
+from views.error_handler import ErrorHandler
+
+class UploadSessionController:
+    """분할 업로드 컨트롤러 클래스 (세션 생성 → 청크 전송 → 상태 조회/이어받기 → 완료)"""
+
+    def __init__(self):
+        """분할 업로드 컨트롤러 초기화"""
+        self.upload_service = UploadSessionService()
+        self.document_controller = DocumentController()
+
+    def init_upload(self, data: Dict[str, Any]) -> Dict[str, Any]:
+        """업로드 세션 생성"""
+        try:
+            for field in ['file_name', 'file_type', 'file_size']:
+                if field not in data or not data[field]:
+                    raise ValueError(f"필수 필드가 누락되었습니다: {field}")
+
+            if not isinstance(data['file_size'], int) or isinstance(data['file_size'], bool):
+                raise ValueError("파일 크기는 정수여야 합니다.")
+
+            if not data['file_name'].strip():
+                raise ValueError("파일명이 비어있습니다.")
+
+            sha256 = data.get('sha256')
+            session = self.upload_service.create_session(
+                file_name=data['file_name'],
+                file_type=data['file_type'],
+                file_size=data['file_size'],
+                sha256=sha256.lower() if isinstance(sha256, str) else None,
+                owner=request_tenant(data)
+            )
+
+            return {"success": True, **session.to_status_dict()}
+
+        except Exception as e:
+            return ErrorHandler.get_error_response(e)
+
+    def upload_chunk(self, data: Dict[str, Any]) -> Dict[str, Any]:
+        """청크 업로드 (chunk_data는 Base64 문자열 또는 원본 바이트)"""
+        try:
+            for field in ['upload_id', 'index', 'chunk_data', 'sha256']:
+                if field not in data or data[field] is None or data[field] == "":
+                    raise ValueError(f"필수 필드가 누락되었습니다: {field}")
+
+            if not isinstance(data['index'], int) or isinstance(data['index'], bool):
+                raise ValueError("청크 번호는 정수여야 합니다.")
+
+            chunk_data = data['chunk_data']
+            if isinstance(chunk_data, str):
+                try:
+                    chunk_data = base64.b64decode(chunk_data, validate=True)
+                except (binascii.Error, ValueError):
+                    raise ValueError("청크 데이터는 Base64 문자열이어야 합니다.")
+            elif not isinstance(chunk_data, bytes):
+                raise ValueError("청크 데이터는 Base64 문자열이어야 합니다.")
+
+            session = self.upload_service.put_chunk(
+                upload_id=data['upload_id'],
+                index=data['index'],
+                data=chunk_data,
+                sha256=str(data['sha256']),
+                owner=request_tenant(data)
+            )
+
+            return {"success": True, **session.to_status_dict()}
+
+        except Exception as e:
+            return ErrorHandler.get_error_response(e)
+
+    def get_upload_status(self, data: Dict[str, Any]) -> Dict[str, Any]:
+        """업로드 진행 상태 조회 (다음에 보낼 청크 번호 포함)"""
+        try:
+            if not data.get('upload_id'):
+                raise ValueError("필수 필드가 누락되었습니다: upload_id")
+
+            session = self.upload_service.get_session(data['upload_id'], request_tenant(data))
+            return {"success": True, **session.to_status_dict()}
+
+        except Exception as e:
+            return ErrorHandler.get_error_response(e)
+
+    def finalize_upload(self, data: Dict[str, Any]) -> Dict[str, Any]:
+        """청크를 합친 스풀 파일을 문서로 처리하고 세션 정리"""
+        try:
+            if not data.get('upload_id'):
+                raise ValueError("필수 필드가 누락되었습니다: upload_id")
+
+            owner = request_tenant(data)
+            session = self.upload_service.get_session(data['upload_id'], owner)
+
+            # 같은 세션의 finalize가 동시에 들어오면 하나만 청크를 합치고 처리
+            with self.upload_service.finalize_lock(session.upload_id):
+                file_path = self.upload_service.finalize(session.upload_id, owner)
+
+                result = self.document_controller.process_spooled_document(
+                    file_path=file_path,
+                    file_type=session.file_type,
+                    file_name=session.file_name,
+                    normalize=parse_flag(data, 'normalize'),
+                    translation=data if data.get('target_lang') else None
+                )
+
+                # 처리에 성공했거나 파일 형식, 크기처럼 다시 시도해도 결과가 같은 검증 오류(400)이면 세션 삭제
+                # (메모리 예산 부족, OpenAI 오류, 내부 오류는 세션을 남겨 업로드 없이 finalize만 다시 호출할 수 있게 함)
+                if result.get('success') or result.get('status_code') == 400:
+                    self.upload_service.delete_session(session.upload_id)
+
+            return {**result, "upload_id": session.upload_id}
+
+        except Exception as e:
+            return ErrorHandler.get_error_response(e)
@@ -1,5 +1,6 @@
+import io
 from dataclasses import dataclass
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, List, BinaryIO
 from enum import Enum
 
 class FileType(Enum):
@@ -22,12 +23,28 @@ class Document:
     file_data: bytes
     extracted_text: Optional[str] = None
     text_length: Optional[int] = None
+    normalization: Optional[Dict[str, Any]] = None
+    page_stats: Optional[List[Dict[str, Any]]] = None
+    file_path: Optional[str] = None  # 스풀된 파일 경로 (있으면 file_data 대신 파일에서 직접 읽음)
     
     def __post_init__(self):
         """초기화 후 처리"""
         if self.extracted_text:
             self.text_length = len(self.extracted_text.split())
     
+    def open_stream(self) -> BinaryIO:
+        """파일 데이터를 읽는 스트림 (스풀된 파일은 메모리에 올리지 않고 파일에서 직접 읽음)"""
+        if self.file_path is not None:
+            return open(self.file_path, 'rb')
+        return io.BytesIO(self.file_data)
+    
+    def read_bytes(self) -> bytes:
+        """파일 전체 바이트 (이미지/텍스트처럼 전체 데이터가 필요한 형식에서만 사용)"""
+        if self.file_path is not None:
+            with open(self.file_path, 'rb') as f:
+                return f.read()
+        return self.file_data
+    
     def to_dict(self) -> Dict[str, Any]:
         """딕셔너리로 변환"""
         return {
@@ -35,7 +52,9 @@ class Document:
             "file_type": self.file_type.value,
             "file_size": self.file_size,
             "extracted_text": self.extracted_text,
-            "text_length": self.text_length
+            "text_length": self.text_length,
+            "normalization": self.normalization,
+            "page_stats": self.page_stats
         }
     
     @classmethod
@@ -47,5 +66,7 @@ class Document:
             file_size=data["file_size"],
             file_data=data["file_data"],
             extracted_text=data.get("extracted_text"),
-            text_length=data.get("text_length")
+            text_length=data.get("text_length"),
+            normalization=data.get("normalization"),
+            page_stats=data.get("page_stats")
         )
@@ -5,6 +5,8 @@ from enum import Enum
 class SummaryMethod(Enum):
     GPT_DETAILED = "gpt"
     GPT_BRIEF = "brief"
+    TEXTRANK = "textrank"
+    LSA = "lsa"
 
 @dataclass
 class SummaryRequest:
@@ -12,6 +14,8 @@ class SummaryRequest:
     text: str
     method: SummaryMethod
     sentences_count: int
+    prereduce: bool = False
+    token_budget: Optional[int] = None
     
     def __post_init__(self):
         """유효성 검사"""
@@ -20,6 +24,9 @@ class SummaryRequest:
         
         if self.sentences_count < 1 or self.sentences_count > 10:
             raise ValueError("문장 수는 1-10 사이여야 합니다.")
+        
+        if self.token_budget is not None and self.token_budget < 1:
+            raise ValueError("토큰 예산은 1 이상이어야 합니다.")
 
 @dataclass
 class SummaryResult:
@@ -32,10 +39,13 @@ class SummaryResult:
     summary_length: int
     model: str = "gpt-4o"
     success: bool = True
+    prereduction: Optional[Dict[str, Any]] = None
+    usage: Optional[Dict[str, Any]] = None
+    checkpoint: Optional[Dict[str, Any]] = None
     
     def to_dict(self) -> Dict[str, Any]:
         """딕셔너리로 변환"""
-        return {
+        data = {
             "success": self.success,
             "original_text": self.original_text,
             "summary": self.summary,
@@ -45,6 +55,13 @@ class SummaryResult:
             "summary_length": self.summary_length,
             "model": self.model
         }
+        if self.prereduction is not None:
+            data["prereduction"] = self.prereduction
+        if self.usage is not None:
+            data["usage"] = self.usage
+        if self.checkpoint is not None:
+            data["checkpoint"] = self.checkpoint
+        return data
     
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> 'SummaryResult':
@@ -57,5 +74,8 @@ class SummaryResult:
             original_length=data["original_length"],
             summary_length=data["summary_length"],
             model=data.get("model", "gpt-4o"),
-            success=data.get("success", True)
+            success=data.get("success", True),
+            prereduction=data.get("prereduction"),
+            usage=data.get("usage"),
+            checkpoint=data.get("checkpoint")
         )
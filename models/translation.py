@@ -1,5 +1,5 @@
 from dataclasses import dataclass
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, List, Tuple
 from enum import Enum
 
 class Language(Enum):
@@ -19,6 +19,7 @@ class TranslationRequest:
     text: str
     source_language: Language
     target_language: Language
+    reference_translations: Optional[List[Tuple[str, str]]] = None  # (이전 원문, 이전 번역) 참고 쌍
     
     def __post_init__(self):
         """유효성 검사"""
@@ -37,10 +38,13 @@ class TranslationResult:
     target_language: Language
     model: str = "gpt-4o"
     success: bool = True
+    usage: Optional[Dict[str, Any]] = None
+    memory: Optional[Dict[str, Any]] = None
+    checkpoint: Optional[Dict[str, Any]] = None
     
     def to_dict(self) -> Dict[str, Any]:
         """딕셔너리로 변환"""
-        return {
+        data = {
             "success": self.success,
             "original_text": self.original_text,
             "translated_text": self.translated_text,
@@ -48,6 +52,13 @@ class TranslationResult:
             "target_language": self.target_language.value,
             "model": self.model
         }
+        if self.usage is not None:
+            data["usage"] = self.usage
+        if self.memory is not None:
+            data["memory"] = self.memory
+        if self.checkpoint is not None:
+            data["checkpoint"] = self.checkpoint
+        return data
     
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> 'TranslationResult':
@@ -58,5 +69,8 @@ class TranslationResult:
             source_language=Language(data["source_language"]),
             target_language=Language(data["target_language"]),
             model=data.get("model", "gpt-4o"),
-            success=data.get("success", True)
+            success=data.get("success", True),
+            usage=data.get("usage"),
+            memory=data.get("memory"),
+            checkpoint=data.get("checkpoint")
         )
@@ -0,0 +1,73 @@
+from dataclasses import dataclass, field
+from typing import Optional, Dict, Any, List
+
+@dataclass
+class UploadSession:
+    """분할 업로드 세션 모델"""
+    upload_id: str
+    file_name: str
+    file_type: str
+    file_size: int
+    chunk_size: int
+    created_at: float
+    sha256: Optional[str] = None
+    owner: Optional[str] = None  # 세션을 만든 테넌트 ID (다른 테넌트는 세션에 접근할 수 없음)
+    received_chunks: List[int] = field(default_factory=list)
+
+    @property
+    def total_chunks(self) -> int:
+        """전체 청크 수"""
+        return max(1, -(-self.file_size // self.chunk_size))
+
+    @property
+    def missing_chunks(self) -> List[int]:
+        """아직 받지 않은 청크 번호 목록"""
+        received = set(self.received_chunks)
+        return [index for index in range(self.total_chunks) if index not in received]
+
+    def expected_chunk_size(self, index: int) -> int:
+        """청크 번호별 기대 크기 (마지막 청크는 나머지 크기)"""
+        if index == self.total_chunks - 1:
+            return self.file_size - self.chunk_size * index
+        return self.chunk_size
+
+    def to_dict(self) -> Dict[str, Any]:
+        """딕셔너리로 변환 (메타데이터 파일 저장용)"""
+        return {
+            "upload_id": self.upload_id,
+            "file_name": self.file_name,
+            "file_type": self.file_type,
+            "file_size": self.file_size,
+            "chunk_size": self.chunk_size,
+            "created_at": self.created_at,
+            "sha256": self.sha256,
+            "owner": self.owner
+        }
+
+    def to_status_dict(self) -> Dict[str, Any]:
+        """업로드 진행 상태 딕셔너리 (이어받기 위치 포함)"""
+        missing = self.missing_chunks
+        status = self.to_dict()
+        status.pop("owner")
+        return {
+            **status,
+            "total_chunks": self.total_chunks,
+            "received_chunks": len(self.received_chunks),
+            "missing_chunks": missing,
+            "next_chunk": missing[0] if missing else None,
+            "complete": not missing
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> 'UploadSession':
+        """딕셔너리에서 생성"""
+        return cls(
+            upload_id=data["upload_id"],
+            file_name=data["file_name"],
+            file_type=data["file_type"],
+            file_size=data["file_size"],
+            chunk_size=data["chunk_size"],
+            created_at=data["created_at"],
+            sha256=data.get("sha256"),
+            owner=data.get("owner")
+        )
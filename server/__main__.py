@@ -0,0 +1,27 @@
+"""
+자체 호스팅 서버 실행
+
+사용법: python -m server
+"""
+import uvicorn
+from config.settings import Settings
+from server import runner
+
+
+def main():
+    """멀티 워커 uvicorn 서버 실행 (종료 신호를 받으면 readiness 해제 후 대기)"""
+    Settings.validate()
+    config = uvicorn.Config(
+        "server.app:app",
+        host=Settings.SERVER_HOST,
+        port=Settings.SERVER_PORT,
+        workers=Settings.SERVER_WORKERS,
+        timeout_keep_alive=Settings.SERVER_KEEP_ALIVE,
+        timeout_graceful_shutdown=Settings.SERVER_GRACEFUL_SHUTDOWN_TIMEOUT,
+        proxy_headers=True
+    )
+    runner.run(config, "server.app:start_draining", Settings.SERVER_READINESS_DRAIN_SECONDS)
+
+
+if __name__ == "__main__":
+    main()
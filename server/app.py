@@ -0,0 +1,342 @@
+"""
+자체 호스팅용 ASGI 애플리케이션
+
+Vercel Serverless Functions(api/*.py)와 같은 컨트롤러를 FastAPI 라우트로 제공합니다.
+"""
+import os
+from contextlib import asynccontextmanager
+from typing import Any, Callable, Dict, Optional, Tuple
+from fastapi import FastAPI, Request
+from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import JSONResponse
+from fastapi.staticfiles import StaticFiles
+from starlette.concurrency import run_in_threadpool
+from config.settings import Settings
+from controllers.document_controller import DocumentController
+from controllers.summary_controller import SummaryController
+from controllers.translation_controller import TranslationController
+from controllers.upload_session_controller import UploadSessionController
+from controllers.request_options import TENANT_FIELD
+from models.document import FileType
+from services.checkpoint_store import checkpoint_store
+from services.admission_controller import AdmissionController, AdmissionRejectedError
+from services.fair_scheduler import tenant_quota, tenant_weight
+from services.memory_budget import memory_budget
+from services.ocr_engine import ocr_pool
+from services.tenant_identity import tenant_resolver
+from services.token_estimator import estimate_tokens
+
+PUBLIC_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "public")
+# 텍스트 추출 전 번역 비용 추정에 쓰는 형식별 토큰당 바이트 수
+# (텍스트는 한글 1자(3바이트)가 약 1토큰, PDF/DOCX/이미지는 압축, 글꼴, 이미지 데이터가 섞여 있음)
+TEXT_BYTES_PER_TOKEN = 3
+DOCUMENT_BYTES_PER_TOKEN = 16
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """워커 시작 시 컨트롤러를 한 번만 생성하고 종료 시 준비 상태 해제"""
+    app.state.translation_controller = TranslationController()
+    app.state.summary_controller = SummaryController()
+    app.state.document_controller = DocumentController()
+    app.state.upload_session_controller = UploadSessionController()
+    app.state.admission = AdmissionController()
+    app.state.tenant_resolver = tenant_resolver
+    app.state.ready = True
+    yield
+    app.state.ready = False
+    await app.state.translation_controller.aclose()
+    await app.state.summary_controller.aclose()
+    ocr_pool.shutdown()
+
+
+app = FastAPI(title="문서 번역요약 서비스", lifespan=lifespan)
+app.state.draining = False
+
+
+def start_draining() -> None:
+    """readiness 해제 (종료 신호를 받은 워커에서 server.runner.DrainingServer가 호출)"""
+    app.state.draining = True
+
+
+app.add_middleware(
+    CORSMiddleware,
+    allow_origins=Settings.CORS_ORIGINS,
+    allow_methods=["GET", "POST", "PUT", "OPTIONS"],
+    allow_headers=["Content-Type", "Authorization", "X-API-Key", "X-Workload", "X-Chunk-SHA256"]
+)
+
+
+def _json_response(result: Dict[str, Any], default_error: str) -> JSONResponse:
+    """컨트롤러 결과를 api/*.py 핸들러와 같은 형식의 JSON 응답으로 변환"""
+    if result.get('success'):
+        return JSONResponse(result)
+
+    status_code = result.get('status_code', 500)
+    headers = {"Retry-After": str(result['retry_after'])} if result.get('retry_after') else None
+    return JSONResponse(
+        {
+            "success": False,
+            "error": result.get('error', default_error),
+            "status_code": status_code
+        },
+        status_code=status_code,
+        headers=headers
+    )
+
+
+async def _call(func: Callable[..., Dict[str, Any]], *args: Any) -> Dict[str, Any]:
+    """동기 컨트롤러 메서드를 스레드 풀에서 실행"""
+    return await run_in_threadpool(func, *args)
+
+
+async def _parse_json(request: Request) -> Dict[str, Any]:
+    """JSON 요청 파싱"""
+    try:
+        data = await request.json()
+    except Exception as e:
+        raise ValueError(f"JSON 파싱 오류: {str(e)}")
+    if not isinstance(data, dict):
+        raise ValueError("JSON 파싱 오류: 요청 본문은 객체여야 합니다.")
+    return data
+
+
+def _error_response(message: str, status_code: int) -> JSONResponse:
+    """오류 응답 생성"""
+    return JSONResponse({"success": False, "error": message, "status_code": status_code}, status_code=status_code)
+
+
+def _overloaded_response(error: AdmissionRejectedError) -> JSONResponse:
+    """부하 차단 응답 생성 (503, 할당량 초과는 429 + Retry-After)"""
+    status_code = 429 if error.reason == "quota_exceeded" else 503
+    return JSONResponse(
+        {
+            "success": False,
+            "error": str(error),
+            "error_type": "overloaded",
+            "reason": error.reason,
+            "retry_after": error.retry_after,
+            "status_code": status_code
+        },
+        status_code=status_code,
+        headers={"Retry-After": str(error.retry_after)}
+    )
+
+
+async def _tenant(request: Request) -> Tuple[str, str, bool]:
+    """요청의 테넌트 식별 (검증된 API 키 > 검증된 Google ID 토큰 > 클라이언트 IP)
+
+    반환값: (테넌트 ID, 대기열 레이블, 배치 작업 여부)
+    """
+    client_host = request.client.host if request.client else None
+    tenant_id = await run_in_threadpool(request.app.state.tenant_resolver.resolve_headers, request.headers, client_host)
+
+    batch = request.headers.get("x-workload", "").lower() == "batch"
+    return tenant_id, tenant_id + "/batch" if batch else tenant_id, batch
+
+
+async def _with_tenant(request: Request, data: Dict[str, Any]) -> Dict[str, Any]:
+    """요청 데이터에 검증한 테넌트 ID 추가 (클라이언트가 보낸 값은 덮어씀)"""
+    tenant_id, _, _ = await _tenant(request)
+    return {**data, TENANT_FIELD: tenant_id}
+
+
+async def _admitted(request: Request, data: Dict[str, Any], handler: Callable[..., Any],
+                    cost: Optional[int] = None) -> Dict[str, Any]:
+    """테넌트별 공정 스케줄링과 승인 제어를 거쳐 LLM 호출 핸들러 실행 (비용은 예상 토큰 수, 기본값은 text 기준)"""
+    if cost is None:
+        text = data.get('text')
+        cost = estimate_tokens(text) if isinstance(text, str) else 0
+    tenant_id, label, batch = await _tenant(request)
+    async with request.app.state.admission.slot(cost, label, tenant_weight(tenant_id, batch),
+                                                tenant_quota(tenant_id), quota_key=tenant_id):
+        return await handler({**data, TENANT_FIELD: tenant_id})
+
+
+def _document_cost(file_size: int, file_type: Any) -> int:
+    """업로드 문서 번역의 예상 토큰 수 (추출 전이므로 파일 크기 기준, 추출 텍스트 한도 이내)"""
+    bytes_per_token = TEXT_BYTES_PER_TOKEN if file_type == FileType.TXT.value else DOCUMENT_BYTES_PER_TOKEN
+    return min(max(0, int(file_size)) // bytes_per_token + 1, Settings.MAX_EXTRACTED_CHARS)
+
+
+async def _translated_document(request: Request, data: Dict[str, Any], func: Callable[..., Dict[str, Any]],
+                               file_size: int, file_type: Any, default_error: str) -> JSONResponse:
+    """번역을 함께 요청한 문서 처리 (LLM을 호출하므로 텍스트 번역과 같은 승인 제어와 테넌트 할당량 적용)"""
+    async def handler(admitted: Dict[str, Any]) -> Dict[str, Any]:
+        return await _call(func, admitted)
+
+    try:
+        result = await _admitted(request, data, handler, _document_cost(file_size, file_type))
+    except AdmissionRejectedError as e:
+        return _overloaded_response(e)
+    return _json_response(result, default_error)
+
+
+@app.get("/healthz")
+async def healthz():
+    """프로세스 생존 확인"""
+    return {"status": "ok"}
+
+
+@app.get("/readyz")
+async def readyz(request: Request):
+    """요청 처리 가능 여부 확인"""
+    if getattr(request.app.state, "ready", False) and not request.app.state.draining:
+        return {"status": "ready"}
+    return JSONResponse({"status": "unavailable"}, status_code=503)
+
+
+@app.get("/api/admission")
+async def admission(request: Request):
+    """LLM 승인 제어 상태 (대기열 깊이, 거절 횟수, 테넌트별 대기 시간, 메모리 예산, OCR 작업 풀 등)"""
+    return {
+        "success": True,
+        **request.app.state.admission.stats(),
+        "memory_budget": memory_budget.stats(),
+        "ocr": ocr_pool.stats()
+    }
+
+
+@app.get("/api/prompt-cache")
+async def prompt_cache(request: Request):
+    """프롬프트 템플릿별 토큰 사용량 및 캐시 적중률"""
+    stats = request.app.state.translation_controller.openai_service.get_prompt_cache_stats()
+    return {"success": True, "templates": stats}
+
+
+@app.get("/api/translation-memory")
+async def translation_memory_stats(request: Request):
+    """번역 메모리 조회 지연 시간 및 적중률"""
+    result = request.app.state.translation_controller.get_translation_memory_stats()
+    return _json_response(result, '번역 메모리 통계를 가져오는 중 오류가 발생했습니다.')
+
+
+@app.get("/api/checkpoints")
+async def checkpoints(request: Request):
+    """긴 문서 구간 체크포인트 재사용 통계"""
+    return {"success": True, **checkpoint_store.stats()}
+
+
+@app.post("/api/translate")
+async def translate(request: Request):
+    """텍스트 번역"""
+    try:
+        data = await _parse_json(request)
+    except ValueError as e:
+        return _error_response(str(e), 400)
+    try:
+        result = await _admitted(request, data, request.app.state.translation_controller.translate_text_async)
+    except AdmissionRejectedError as e:
+        return _overloaded_response(e)
+    return _json_response(result, '번역 처리 중 오류가 발생했습니다.')
+
+
+@app.get("/api/translate")
+@app.get("/api/languages")
+async def languages(request: Request):
+    """지원하는 언어 목록"""
+    result = request.app.state.translation_controller.get_supported_languages()
+    return _json_response(result, '언어 목록을 가져오는 중 오류가 발생했습니다.')
+
+
+@app.post("/api/summarize")
+async def summarize(request: Request):
+    """텍스트 요약"""
+    try:
+        data = await _parse_json(request)
+    except ValueError as e:
+        return _error_response(str(e), 400)
+    controller = request.app.state.summary_controller
+    # 로컬 추출 요약은 LLM을 호출하지 않으므로 승인 제어 대상이 아님
+    if data.get('method') in ('textrank', 'lsa'):
+        result = await controller.summarize_text_async(data)
+    else:
+        try:
+            result = await _admitted(request, data, controller.summarize_text_async)
+        except AdmissionRejectedError as e:
+            return _overloaded_response(e)
+    return _json_response(result, '요약 처리 중 오류가 발생했습니다.')
+
+
+@app.get("/api/summarize")
+@app.get("/api/methods")
+async def methods(request: Request):
+    """지원하는 요약 방법 목록"""
+    result = request.app.state.summary_controller.get_summary_methods()
+    return _json_response(result, '요약 방법 목록을 가져오는 중 오류가 발생했습니다.')
+
+
+@app.post("/api/upload")
+async def upload(request: Request):
+    """파일 업로드 및 텍스트 추출"""
+    try:
+        data = await _parse_json(request)
+    except ValueError as e:
+        return _error_response(str(e), 400)
+    controller = request.app.state.document_controller
+    if data.get('target_lang'):
+        file_data = data.get('file_data')
+        # Base64 4자당 원본 3바이트
+        file_size = len(file_data) * 3 // 4 if isinstance(file_data, str) else 0
+        return await _translated_document(request, data, controller.process_document, file_size,
+                                          data.get('file_type'), '문서 처리 중 오류가 발생했습니다.')
+    result = await _call(controller.process_document, await _with_tenant(request, data))
+    return _json_response(result, '문서 처리 중 오류가 발생했습니다.')
+
+
+@app.post("/api/uploads")
+async def init_upload(request: Request):
+    """분할 업로드 세션 생성"""
+    try:
+        data = await _parse_json(request)
+    except ValueError as e:
+        return _error_response(str(e), 400)
+    result = await _call(request.app.state.upload_session_controller.init_upload, await _with_tenant(request, data))
+    return _json_response(result, '업로드 세션 생성 중 오류가 발생했습니다.')
+
+
+@app.get("/api/uploads/{upload_id}")
+async def upload_status(request: Request, upload_id: str):
+    """분할 업로드 진행 상태 (이어받을 청크 번호)"""
+    data = await _with_tenant(request, {"upload_id": upload_id})
+    result = await _call(request.app.state.upload_session_controller.get_upload_status, data)
+    return _json_response(result, '업로드 상태 조회 중 오류가 발생했습니다.')
+
+
+@app.put("/api/uploads/{upload_id}/chunks/{index}")
+async def upload_chunk(request: Request, upload_id: str, index: int):
+    """청크 업로드 (본문은 원본 바이트, 해시는 X-Chunk-SHA256 헤더)"""
+    data = await _with_tenant(request, {
+        "upload_id": upload_id,
+        "index": index,
+        "chunk_data": await request.body(),
+        "sha256": request.headers.get("x-chunk-sha256")
+    })
+    result = await _call(request.app.state.upload_session_controller.upload_chunk, data)
+    return _json_response(result, '청크 업로드 중 오류가 발생했습니다.')
+
+
+@app.post("/api/uploads/{upload_id}/finalize")
+async def finalize_upload(request: Request, upload_id: str):
+    """청크를 합쳐 문서 처리"""
+    body = await request.body()
+    try:
+        data = await _parse_json(request) if body else {}
+    except ValueError as e:
+        return _error_response(str(e), 400)
+    data = await _with_tenant(request, {**data, "upload_id": upload_id})
+    controller = request.app.state.upload_session_controller
+    if data.get('target_lang'):
+        # 승인 비용은 세션에 등록된 파일 크기와 형식으로 추정
+        status = await _call(controller.get_upload_status, data)
+        if not status.get('success'):
+            return _json_response(status, '업로드 상태 조회 중 오류가 발생했습니다.')
+        return await _translated_document(request, data, controller.finalize_upload,
+                                          status["file_size"], status["file_type"], '문서 처리 중 오류가 발생했습니다.')
+    result = await _call(controller.finalize_upload, data)
+    return _json_response(result, '문서 처리 중 오류가 발생했습니다.')
+
+
+# API 이외의 경로는 정적 프론트엔드 제공
+if os.path.isdir(PUBLIC_DIR):
+    app.mount("/", StaticFiles(directory=PUBLIC_DIR, html=True), name="public")
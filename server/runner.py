@@ -0,0 +1,73 @@
+"""
+종료 전 readiness 해제 대기를 지원하는 uvicorn 실행기
+
+uvicorn.run 대신 Server/Multiprocess 하위 클래스로 서버를 실행하므로, 같은 프로세스의 다른
+uvicorn 서버(테스트 포함)에는 영향을 주지 않습니다.
+"""
+import asyncio
+import logging
+import os
+import sys
+from types import FrameType
+from typing import Optional
+import uvicorn
+from uvicorn.importer import import_from_string
+from uvicorn.main import STARTUP_FAILURE
+from uvicorn.supervisors.multiprocess import Multiprocess
+
+logger = logging.getLogger("uvicorn.error")
+
+
+class DrainingServer(uvicorn.Server):
+    """종료 신호를 받으면 바로 readiness를 해제하고, 로드밸런서가 이를 확인할 시간만큼 기다린 뒤 연결 정리 시작
+
+    uvicorn은 신호를 받는 즉시 새 연결을 받지 않고 진행 중인 연결을 정리하며, lifespan 종료 단계는
+    그 뒤에 실행되므로 lifespan에서 readiness를 해제하면 정리 중에는 503을 볼 수 없습니다.
+    readiness 해제 함수는 워커 프로세스에서 불러올 수 있도록 "모듈:함수" 문자열로 받습니다.
+    두 번째 신호는 기다리지 않고 바로 종료합니다.
+    """
+
+    def __init__(self, config: uvicorn.Config, drain_hook: str, drain_seconds: float):
+        super().__init__(config)
+        self.drain_hook = drain_hook
+        self.drain_seconds = drain_seconds
+        self.drain_scheduled = False
+
+    def handle_exit(self, sig: int, frame: Optional[FrameType]) -> None:
+        import_from_string(self.drain_hook)()
+        if self.drain_scheduled or self.drain_seconds <= 0:
+            super().handle_exit(sig, frame)
+            return
+        self.drain_scheduled = True
+        asyncio.get_event_loop().call_later(self.drain_seconds, super().handle_exit, sig, frame)
+
+
+class DrainingMultiprocess(Multiprocess):
+    """모든 워커에 종료 신호를 먼저 보낸 뒤 기다리는 멀티 프로세스 관리자
+
+    uvicorn 기본 구현은 워커를 하나씩 종료하고 기다리므로, 앞 워커가 readiness를 해제하고
+    정리하는 동안 나머지 워커는 계속 준비 상태로 보이고 종료 시간도 워커 수만큼 늘어납니다.
+    """
+
+    def shutdown(self) -> None:
+        for process in self.processes:
+            process.terminate()
+        for process in self.processes:
+            process.join()
+        logger.info("Stopping parent process [%d]", os.getpid())
+
+
+def run(config: uvicorn.Config, drain_hook: str, drain_seconds: float) -> None:
+    """DrainingServer로 서버 실행 (워커가 여럿이면 DrainingMultiprocess가 관리)"""
+    server = DrainingServer(config, drain_hook, drain_seconds)
+    if config.workers > 1:
+        if not isinstance(config.app, str):
+            logger.error("워커를 여러 개 실행하려면 애플리케이션을 import 문자열로 지정해야 합니다.")
+            sys.exit(1)
+        DrainingMultiprocess(config, target=server.run, sockets=[config.bind_socket()]).run()
+    else:
+        server.run()
+    if config.uds and os.path.exists(config.uds):
+        os.remove(config.uds)
+    if config.workers == 1 and not server.started:
+        sys.exit(STARTUP_FAILURE)
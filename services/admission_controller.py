@@ -0,0 +1,141 @@
+import asyncio
+import math
+import time
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, Dict, Optional
+from config.settings import Settings
+from services.fair_scheduler import FairScheduler
+
+
+class AdmissionRejectedError(Exception):
+    """대기열이 가득 찼거나 대기 시간이 초과되어 요청이 거절된 경우"""
+
+    def __init__(self, message: str, retry_after: int, reason: str):
+        super().__init__(message)
+        self.retry_after = retry_after
+        self.reason = reason
+
+
+class AdmissionController:
+    """LLM 호출 동시 실행 수 제한 및 부하 차단 클래스 (워커 프로세스 단위)
+
+    동시에 실행되는 LLM 호출 수를 제한하고, 초과 요청은 제한된 크기의 대기열에서
+    기다립니다. 대기 중인 요청은 FairScheduler가 테넌트별 가중치에 따라 배정하며,
+    같은 테넌트 안에서는 짧은 요청이 먼저 처리됩니다. 대기열이 가득 차거나 대기
+    기한을 넘기면 즉시 거절하여 지연 시간이 한없이 늘어나지 않도록 합니다.
+    """
+
+    def __init__(self, max_in_flight: Optional[int] = None, max_queue: Optional[int] = None,
+                 queue_timeout: Optional[float] = None):
+        """동시 실행 한도, 대기열 크기, 대기 기한(초) 설정"""
+        self.max_in_flight = max_in_flight or Settings.LLM_MAX_IN_FLIGHT
+        self.max_queue = max_queue if max_queue is not None else Settings.LLM_MAX_QUEUE
+        self.queue_timeout = queue_timeout or Settings.LLM_QUEUE_TIMEOUT
+
+        self.in_flight = 0
+        self.waiting = 0
+        self.scheduler = FairScheduler()
+        self._average_service_time = 1.0
+
+        self.admitted = 0
+        self.rejected_queue_full = 0
+        self.rejected_timeout = 0
+        self.rejected_quota = 0
+        self.total_wait_time = 0.0
+
+    @asynccontextmanager
+    async def slot(self, cost: int, tenant: str = "anonymous", weight: float = 1.0,
+                   quota_per_minute: Optional[int] = None, quota_key: Optional[str] = None) -> AsyncIterator[None]:
+        """LLM 호출 슬롯 획득 (비용은 예상 토큰 수, quota_key가 같은 대기열은 할당량 공유)"""
+        await self.acquire(cost, tenant, weight, quota_per_minute, quota_key)
+        started = time.monotonic()
+        try:
+            yield
+        finally:
+            elapsed = time.monotonic() - started
+            self._average_service_time = 0.9 * self._average_service_time + 0.1 * elapsed
+            self.release()
+
+    async def acquire(self, cost: int, tenant: str = "anonymous", weight: float = 1.0,
+                      quota_per_minute: Optional[int] = None, quota_key: Optional[str] = None) -> None:
+        """슬롯이 생길 때까지 대기하거나 거절"""
+        state = self.scheduler.tenant(tenant, weight, quota_per_minute, quota_key)
+        quota_retry_after = self.scheduler.charge_quota(state, cost)
+        if quota_retry_after is not None:
+            self.rejected_quota += 1
+            raise AdmissionRejectedError(
+                "토큰 사용 한도를 초과했습니다. 잠시 후 다시 시도해주세요.",
+                quota_retry_after, "quota_exceeded"
+            )
+
+        if self.in_flight < self.max_in_flight and self.waiting == 0:
+            self.in_flight += 1
+            self.admitted += 1
+            self.scheduler.start(state, cost, 0.0)
+            return
+
+        if self.waiting >= self.max_queue:
+            self.scheduler.refund_quota(state, cost)
+            self.rejected_queue_full += 1
+            raise AdmissionRejectedError(
+                "요청이 많아 처리할 수 없습니다. 잠시 후 다시 시도해주세요.",
+                self.retry_after(), "queue_full"
+            )
+
+        future = asyncio.get_running_loop().create_future()
+        self.scheduler.push(state, cost, future)
+        self.waiting += 1
+        enqueued = time.monotonic()
+        try:
+            await asyncio.wait_for(future, self.queue_timeout)
+        except asyncio.TimeoutError:
+            self.waiting -= 1
+            self.scheduler.refund_quota(state, cost)
+            self.rejected_timeout += 1
+            raise AdmissionRejectedError(
+                "대기 시간이 초과되었습니다. 잠시 후 다시 시도해주세요.",
+                self.retry_after(), "queue_timeout"
+            )
+        except asyncio.CancelledError:
+            # 클라이언트 연결 종료 등으로 취소된 경우, 이미 넘겨받은 슬롯은 반환
+            if future.done() and not future.cancelled():
+                self.release()
+            else:
+                self.waiting -= 1
+                self.scheduler.refund_quota(state, cost)
+            raise
+
+        self.admitted += 1
+        self.total_wait_time += time.monotonic() - enqueued
+
+    def release(self) -> None:
+        """슬롯 반환 후 대기 중인 다음 요청에 전달"""
+        future = self.scheduler.pop()
+        if future is not None:
+            # in_flight는 그대로 두고 슬롯을 대기자에게 넘김
+            self.waiting -= 1
+            future.set_result(None)
+            return
+        self.in_flight -= 1
+
+    def retry_after(self) -> int:
+        """대기열이 비워지는 데 걸릴 예상 시간(초)"""
+        estimate = self._average_service_time * (self.waiting + 1) / self.max_in_flight
+        return max(1, math.ceil(estimate))
+
+    def stats(self) -> Dict[str, Any]:
+        """현재 상태 및 누적 통계 반환"""
+        return {
+            "in_flight": self.in_flight,
+            "max_in_flight": self.max_in_flight,
+            "queue_depth": self.waiting,
+            "max_queue": self.max_queue,
+            "queue_timeout": self.queue_timeout,
+            "admitted": self.admitted,
+            "rejected_queue_full": self.rejected_queue_full,
+            "rejected_timeout": self.rejected_timeout,
+            "rejected_quota": self.rejected_quota,
+            "average_wait_ms": round(self.total_wait_time / self.admitted * 1000, 2) if self.admitted else 0.0,
+            "average_service_ms": round(self._average_service_time * 1000, 2),
+            "tenants": self.scheduler.stats()
+        }
@@ -0,0 +1,112 @@
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+from typing import Any, Dict, Optional
+from config.settings import Settings
+
+
+def checkpoint_key(kind: str, params: Dict[str, Any], text: str, scope: Optional[str]) -> str:
+    """구간 결과 식별 키 (작업 종류 + 파라미터(템플릿 버전, 모델 포함) + 구간 텍스트 + 테넌트의 해시)
+
+    테넌트가 키에 포함되므로 같은 텍스트와 파라미터로 요청해도 다른 테넌트의 결과는 재사용하지 않습니다.
+    """
+    payload = json.dumps({"kind": kind, "params": params, "text": text, "scope": scope or ""},
+                         ensure_ascii=False, sort_keys=True)
+    return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+
+
+class CheckpointStore:
+    """긴 문서 작업의 구간별 결과를 보관하는 sqlite 체크포인트 저장소 클래스
+
+    구간 결과는 LLM 응답을 받은 즉시 저장되므로, 중간 구간에서 시간 초과나 5xx로 요청이
+    실패해도 같은 문서와 파라미터로 다시 요청하면 끝난 구간은 다시 호출하지 않습니다.
+    원문은 저장하지 않고 구간 번역문/요약문과 토큰 사용량만 저장합니다.
+    여러 워커 프로세스가 같은 파일을 공유할 수 있도록 WAL 모드를 사용합니다.
+    """
+
+    def __init__(self, path: Optional[str] = None, ttl: Optional[int] = None):
+        """저장소 경로와 보관 기간(초) 설정"""
+        self.path = path or Settings.CHECKPOINT_DB_PATH
+        self.ttl = ttl if ttl is not None else Settings.CHECKPOINT_TTL
+        self.hits = 0
+        self.misses = 0
+        self.saved = 0
+        self._local = threading.local()
+        self._init_lock = threading.Lock()
+        self._stats_lock = threading.Lock()
+        self._initialized = False
+
+    def load(self, key: str) -> Optional[Dict[str, Any]]:
+        """구간 결과 조회 (없거나 보관 기간이 지났으면 None)"""
+        row = self._connection().execute(
+            "SELECT result FROM checkpoints WHERE key = ? AND created_at >= ?",
+            (key, time.time() - self.ttl)
+        ).fetchone()
+        with self._stats_lock:
+            if row is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+        return json.loads(row[0]) if row is not None else None
+
+    def save(self, key: str, kind: str, result: Dict[str, Any]) -> None:
+        """구간 결과 저장"""
+        connection = self._connection()
+        with connection:
+            connection.execute(
+                "INSERT OR REPLACE INTO checkpoints (key, kind, result, created_at) VALUES (?, ?, ?, ?)",
+                (key, kind, json.dumps(result, ensure_ascii=False), time.time())
+            )
+        with self._stats_lock:
+            self.saved += 1
+
+    def prune(self) -> int:
+        """보관 기간이 지난 체크포인트 삭제 후 삭제한 개수 반환"""
+        connection = self._connection()
+        with connection:
+            cursor = connection.execute("DELETE FROM checkpoints WHERE created_at < ?", (time.time() - self.ttl,))
+        return cursor.rowcount
+
+    def stats(self) -> Dict[str, Any]:
+        """체크포인트 재사용 통계"""
+        with self._stats_lock:
+            hits, misses, saved = self.hits, self.misses, self.saved
+        lookups = hits + misses
+        return {
+            "path": self.path,
+            "hits": hits,
+            "misses": misses,
+            "saved": saved,
+            "hit_ratio": round(hits / lookups, 4) if lookups else 0.0
+        }
+
+    def _connection(self) -> sqlite3.Connection:
+        """스레드별 sqlite 연결 반환 (최초 연결 시 테이블 생성 및 만료 항목 정리)"""
+        connection = getattr(self._local, "connection", None)
+        if connection is not None:
+            return connection
+
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        connection = sqlite3.connect(self.path, timeout=10)
+        connection.execute("PRAGMA journal_mode=WAL")
+        connection.execute("PRAGMA synchronous=NORMAL")
+        with self._init_lock:
+            if not self._initialized:
+                with connection:
+                    connection.execute(
+                        "CREATE TABLE IF NOT EXISTS checkpoints ("
+                        "key TEXT PRIMARY KEY, kind TEXT NOT NULL, result TEXT NOT NULL, created_at REAL NOT NULL)"
+                    )
+                    connection.execute("DELETE FROM checkpoints WHERE created_at < ?", (time.time() - self.ttl,))
+                self._initialized = True
+        self._local.connection = connection
+        return connection
+
+
+# 전역 체크포인트 저장소 (프로세스 단위 연결, 파일은 워커 간 공유)
+checkpoint_store = CheckpointStore()
@@ -0,0 +1,205 @@
+import queue
+import threading
+import time
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Tuple
+from config.settings import Settings
+from models.document import Document, FileType
+from models.translation import TranslationResult
+from services.file_processor import FileProcessorService
+from services.memory_budget import memory_budget, estimate_document_memory
+from services.request_profiler import profile_stage
+from services.text_normalizer import NormalizationStats
+from services.text_segmenter import split_paragraphs, join_paragraphs
+from services.token_estimator import estimate_tokens
+
+# 단계 종료 표시
+_DONE = object()
+
+
+class _StageFailure:
+    """앞 단계에서 발생한 예외를 다음 단계로 전달하는 래퍼"""
+
+    def __init__(self, error: BaseException):
+        self.error = error
+
+
+class _Cancelled(Exception):
+    """다음 단계가 중단되어 더 이상 진행할 필요가 없음"""
+
+
+class DocumentPipeline:
+    """문서 추출 → 정규화 → 번역을 겹쳐 실행하는 파이프라인 클래스
+
+    추출 스레드가 페이지를 꺼내는 동안 정규화 스레드가 앞쪽 페이지를 정규화하여 번역 구간으로 묶고,
+    호출한 스레드는 구간이 준비되는 대로 번역합니다. 전체 소요 시간은 추출과 번역 시간의 합 대신
+    둘 중 긴 쪽에 가까워집니다. 단계 사이의 큐는 크기가 제한되어 있어 번역이 밀리면 추출도 멈추므로
+    대기 중인 페이지가 메모리에 쌓이지 않습니다. 추출 메모리 예산은 추출 단계가 끝나면 바로 반환하므로
+    남은 구간을 번역하는 동안 다른 업로드를 막지 않습니다.
+    """
+
+    def __init__(self, file_processor: FileProcessorService, queue_size: Optional[int] = None,
+                 segment_tokens: Optional[int] = None):
+        """파이프라인 설정 (큐 크기, 번역 구간 토큰 예산)"""
+        self.file_processor = file_processor
+        self.queue_size = max(1, queue_size or Settings.DOCUMENT_PIPELINE_QUEUE_SIZE)
+        self.segment_tokens = segment_tokens or Settings.TRANSLATION_SEGMENT_TOKENS
+
+    def run(self, document: Document, normalize: bool,
+            translate: Callable[[str], TranslationResult]) -> Tuple[List[TranslationResult], Dict[str, Any]]:
+        """문서를 추출하면서 구간별로 번역 (document에 추출 텍스트, 정규화/페이지 통계 반영)
+
+        Returns:
+            (구간별 번역 결과 목록, 파이프라인 단계별 소요 시간 통계)
+        """
+        pages_queue: queue.Queue = queue.Queue(self.queue_size)
+        segments_queue: queue.Queue = queue.Queue(self.queue_size)
+        stop = threading.Event()
+        page_stats = [] if document.file_type == FileType.PDF else None
+        normalization = NormalizationStats() if normalize else None
+        pages: List[str] = []
+        timings: Dict[str, float] = {}
+        started = time.perf_counter()
+
+        stages = [
+            threading.Thread(
+                target=self._extract_stage,
+                args=(document, page_stats, pages_queue, stop, timings, started),
+                name="document-pipeline-extract", daemon=True
+            ),
+            threading.Thread(
+                target=self._segment_stage,
+                args=(document, normalization, pages_queue, segments_queue, pages, stop),
+                name="document-pipeline-segment", daemon=True
+            )
+        ]
+
+        results: List[TranslationResult] = []
+        translate_seconds = 0.0
+        first_segment_ms = None
+        with profile_stage("pipeline"):
+            for stage in stages:
+                stage.start()
+            try:
+                for segment in self._drain(segments_queue, stop):
+                    if first_segment_ms is None:
+                        first_segment_ms = (time.perf_counter() - started) * 1000
+                    translate_started = time.perf_counter()
+                    results.append(translate(segment))
+                    translate_seconds += time.perf_counter() - translate_started
+            finally:
+                # 번역이 실패하면 앞 단계도 중단
+                stop.set()
+                for stage in stages:
+                    stage.join()
+
+        if normalize:
+            document.extracted_text = join_paragraphs([page for page in pages if page])
+            document.normalization = normalization.to_dict()
+        else:
+            document.extracted_text = "\n".join(pages).strip()
+        document.page_stats = page_stats
+
+        total_ms = (time.perf_counter() - started) * 1000
+        extract_ms = timings.get("extract_ms", total_ms)
+        translate_ms = translate_seconds * 1000
+        return results, {
+            "pages": len(pages),
+            "segments": len(results),
+            "queue_size": self.queue_size,
+            "extract_ms": round(extract_ms, 2),
+            "translate_ms": round(translate_ms, 2),
+            "first_segment_ms": round(first_segment_ms, 2) if first_segment_ms is not None else None,
+            "total_ms": round(total_ms, 2),
+            # 추출과 번역이 겹친 시간 (순차 실행 대비 절약한 시간)
+            "overlap_ms": round(max(0.0, extract_ms + translate_ms - total_ms), 2)
+        }
+
+    def _extract_stage(self, document: Document, page_stats: Optional[List[Dict[str, Any]]],
+                       pages_queue: queue.Queue, stop: threading.Event,
+                       timings: Dict[str, float], started: float) -> None:
+        """추출 단계: 추출 메모리 예산을 확보하고 페이지를 추출하는 대로 큐에 넣음"""
+        try:
+            with memory_budget.reserve(estimate_document_memory(document)):
+                for page in self.file_processor.iter_document_pages(document, page_stats):
+                    self._put(pages_queue, page, stop)
+            self._put(pages_queue, _DONE, stop)
+        except _Cancelled:
+            # 중단되어도 다음 단계가 기다리지 않도록 종료 표시 전달 (큐가 가득 차 있으면 다음 단계도 중단 확인)
+            self._offer(pages_queue, _DONE)
+        except BaseException as e:
+            self._put_failure(pages_queue, e, stop)
+        finally:
+            timings["extract_ms"] = (time.perf_counter() - started) * 1000
+
+    def _segment_stage(self, document: Document, normalization: Optional[NormalizationStats],
+                       pages_queue: queue.Queue, segments_queue: queue.Queue,
+                       pages: List[str], stop: threading.Event) -> None:
+        """정규화 단계: 페이지를 정규화하고 문단을 번역 구간 토큰 예산 이내로 묶어 큐에 넣음"""
+        try:
+            page_iter: Iterable[str] = self._drain(pages_queue, stop)
+            if normalization is not None:
+                # DOCX 문단은 이미 문단 단위이므로 줄 재배치 제외
+                page_iter = self.file_processor.text_normalizer.iter_normalized(
+                    page_iter, normalization,
+                    reflow=document.file_type not in (FileType.DOCX, FileType.DOC),
+                    page_numbers=self.file_processor.has_page_numbers(document)
+                )
+
+            segment: List[str] = []
+            used = 0
+            for page in page_iter:
+                pages.append(page)
+                for paragraph in split_paragraphs(page):
+                    tokens = estimate_tokens(paragraph)
+                    if segment and used + tokens > self.segment_tokens:
+                        self._put(segments_queue, join_paragraphs(segment), stop)
+                        segment, used = [], 0
+                    segment.append(paragraph)
+                    used += tokens
+            if segment:
+                self._put(segments_queue, join_paragraphs(segment), stop)
+            self._put(segments_queue, _DONE, stop)
+        except _Cancelled:
+            self._offer(segments_queue, _DONE)
+        except BaseException as e:
+            self._put_failure(segments_queue, e, stop)
+
+    def _drain(self, source: queue.Queue, stop: threading.Event) -> Iterator[Any]:
+        """종료 표시가 나올 때까지 큐 항목 반환 (앞 단계 예외는 그대로 다시 발생, 파이프라인이 중단되면 _Cancelled)"""
+        while True:
+            try:
+                item = source.get(timeout=0.1)
+            except queue.Empty:
+                if stop.is_set():
+                    raise _Cancelled()
+                continue
+            if item is _DONE:
+                return
+            if isinstance(item, _StageFailure):
+                raise item.error
+            yield item
+
+    def _put(self, target: queue.Queue, item: Any, stop: threading.Event) -> None:
+        """큐에 항목 추가 (가득 차 있으면 대기, 파이프라인이 중단되면 _Cancelled)"""
+        while True:
+            if stop.is_set():
+                raise _Cancelled()
+            try:
+                target.put(item, timeout=0.1)
+                return
+            except queue.Full:
+                continue
+
+    def _put_failure(self, target: queue.Queue, error: BaseException, stop: threading.Event) -> None:
+        """다음 단계로 예외 전달"""
+        try:
+            self._put(target, _StageFailure(error), stop)
+        except _Cancelled:
+            self._offer(target, _DONE)
+
+    def _offer(self, target: queue.Queue, item: Any) -> None:
+        """대기하지 않고 큐에 항목 추가 (가득 차 있으면 생략)"""
+        try:
+            target.put_nowait(item)
+        except queue.Full:
+            pass
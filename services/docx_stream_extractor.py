@@ -0,0 +1,132 @@
+import re
+import zipfile
+import xml.etree.ElementTree as ET
+from typing import Iterator, List, IO, Optional, Union
+
+W_NS = "{http://schemas.openxmlformats.org/wordprocessingml/2006/main}"
+W_P = W_NS + "p"
+W_T = W_NS + "t"
+W_TAB = W_NS + "tab"
+W_BR = W_NS + "br"
+W_CR = W_NS + "cr"
+W_TBL = W_NS + "tbl"
+W_TR = W_NS + "tr"
+W_TC = W_NS + "tc"
+W_BODY = W_NS + "body"
+
+DOCUMENT_PART = "word/document.xml"
+HEADER_PART_PATTERN = re.compile(r"^word/header(\d*)\.xml$")
+FOOTER_PART_PATTERN = re.compile(r"^word/footer(\d*)\.xml$")
+
+
+def _numbered_parts(names: List[str], pattern: 're.Pattern[str]') -> List[str]:
+    """패턴에 맞는 파트를 파일명의 번호 순서로 정렬 (header2.xml이 header10.xml보다 앞)"""
+    numbered = []
+    for name in names:
+        match = pattern.match(name)
+        if match:
+            numbered.append((int(match.group(1) or 0), name))
+    return [name for _, name in sorted(numbered)]
+
+
+class DocxStreamExtractor:
+    """DOCX 스트리밍 텍스트 추출 클래스 (zip 파트를 증분 XML 파싱)"""
+
+    def __init__(self, source: Union[str, IO[bytes]], max_uncompressed_bytes: Optional[int] = None,
+                 max_chars: Optional[int] = None):
+        """추출기 초기화 (파일 경로 또는 바이너리 스트림, 압축 해제 크기/문자 수 한도)"""
+        self.source = source
+        self.max_uncompressed_bytes = max_uncompressed_bytes
+        self.max_chars = max_chars
+
+    def iter_blocks(self) -> Iterator[str]:
+        """머리글, 본문, 바닥글 순서로 문단/표 행 텍스트 반환
+
+        머리글/바닥글 파트는 각각 파일명 번호 순서(header1, header2, ..., header10)로 본문 앞뒤에 두고,
+        본문과 각 파트 안에서는 문서 순서대로 문단과 표 행(셀은 탭으로 구분)을 반환합니다.
+        """
+        try:
+            with zipfile.ZipFile(self.source) as archive:
+                names = archive.namelist()
+                if DOCUMENT_PART not in names:
+                    raise ValueError("word/document.xml 파트가 없습니다.")
+
+                headers = _numbered_parts(names, HEADER_PART_PATTERN)
+                footers = _numbered_parts(names, FOOTER_PART_PATTERN)
+                parts = headers + [DOCUMENT_PART] + footers
+
+                # 압축 폭탄 방지: 압축 해제 후 크기 합계를 미리 검사
+                if self.max_uncompressed_bytes is not None:
+                    uncompressed = sum(archive.getinfo(part).file_size for part in parts)
+                    if uncompressed > self.max_uncompressed_bytes:
+                        raise ValueError(
+                            f"DOCX 압축 해제 크기({uncompressed // 1024 // 1024}MB)가 허용 한도를 초과합니다."
+                        )
+
+                total_chars = 0
+                for part in parts:
+                    with archive.open(part) as stream:
+                        for block in self._iter_part(stream):
+                            total_chars += len(block) + 1
+                            if self.max_chars is not None and total_chars > self.max_chars:
+                                raise ValueError(f"추출된 텍스트가 최대 {self.max_chars}자를 초과합니다.")
+                            yield block
+        except zipfile.BadZipFile:
+            raise ValueError("올바른 DOCX(zip) 파일이 아닙니다.")
+
+    def extract_text(self) -> str:
+        """전체 텍스트 추출"""
+        return "\n".join(self.iter_blocks()).strip()
+
+    def _iter_part(self, stream: IO[bytes]) -> Iterator[str]:
+        """XML 파트 하나를 증분 파싱하여 블록 텍스트 반환"""
+        paragraph: List[str] = []
+        # 중첩 표를 위한 스택: 표마다 [현재 행 셀 목록, 현재 셀 문단 목록]
+        tables: List[List[List[str]]] = []
+        container = None
+
+        for event, elem in ET.iterparse(stream, events=("start", "end")):
+            tag = elem.tag
+            if event == "start":
+                if tag == W_TBL:
+                    tables.append([[], []])
+                elif tag == W_TR and tables:
+                    tables[-1][0] = []
+                elif tag == W_TC and tables:
+                    tables[-1][1] = []
+                elif tag == W_BODY or container is None:
+                    container = elem
+                continue
+
+            if tag == W_T:
+                if elem.text:
+                    paragraph.append(elem.text)
+            elif tag == W_TAB:
+                paragraph.append("\t")
+            elif tag in (W_BR, W_CR):
+                paragraph.append("\n")
+            elif tag == W_P:
+                text = "".join(paragraph)
+                paragraph = []
+                if tables:
+                    tables[-1][1].append(text)
+                elif text.strip():
+                    yield text
+                elem.clear()
+            elif tag == W_TC and tables:
+                tables[-1][0].append(" ".join(t for t in tables[-1][1] if t.strip()))
+            elif tag == W_TR and tables:
+                row = "\t".join(tables[-1][0])
+                if len(tables) > 1:
+                    # 중첩 표의 행은 바깥 셀의 내용으로 편입
+                    tables[-2][1].append(row)
+                elif row.strip():
+                    yield row
+                elem.clear()
+            elif tag == W_TBL and tables:
+                tables.pop()
+                elem.clear()
+
+            # 처리가 끝난 최상위 블록은 트리에서 제거하여 메모리 사용량을 일정하게 유지
+            if container is not None and not tables and tag in (W_P, W_TBL):
+                container.clear()
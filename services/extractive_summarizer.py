@@ -0,0 +1,197 @@
+import re
+import time
+import numpy as np
+from scipy import sparse
+from scipy.sparse.linalg import svds
+from typing import List, Tuple, Dict, Any
+from config.settings import Settings
+from models.summary import SummaryRequest, SummaryResult, SummaryMethod
+from services.token_estimator import estimate_tokens
+
+# 문장 경계: 종결 부호 뒤 공백 또는 줄바꿈
+SENTENCE_SPLIT_PATTERN = re.compile(r'(?<=[.!?。！？])\s+|\n+')
+# 단어 토큰: 한글/영문/숫자 연속 문자열
+WORD_PATTERN = re.compile(r'\w+', re.UNICODE)
+
+
+class ExtractiveSummarizerService:
+    """로컬 추출 요약 서비스 클래스 (TextRank / LSA)"""
+
+    def __init__(self):
+        """추출 요약 서비스 초기화"""
+        self.damping = Settings.TEXTRANK_DAMPING
+        self.max_iterations = Settings.TEXTRANK_MAX_ITERATIONS
+        self.tolerance = Settings.TEXTRANK_TOLERANCE
+        self.mmr_lambda = Settings.PREREDUCE_MMR_LAMBDA
+
+    def summarize_text(self, request: SummaryRequest) -> SummaryResult:
+        """텍스트 추출 요약"""
+        try:
+            sentences = self.split_sentences(request.text)
+
+            if len(sentences) <= request.sentences_count:
+                selected = sentences
+            else:
+                if request.method == SummaryMethod.LSA:
+                    scores = self.lsa_scores(sentences, request.sentences_count)
+                else:  # TEXTRANK
+                    scores = self.textrank_scores(sentences)
+                selected = self.select_sentences(sentences, scores, request.sentences_count)
+
+            summary_text = " ".join(selected)
+
+            return SummaryResult(
+                original_text=request.text,
+                summary=summary_text,
+                method=request.method,
+                sentences_count=request.sentences_count,
+                original_length=len(request.text.split()),
+                summary_length=len(summary_text.split()),
+                model=request.method.value
+            )
+
+        except Exception as e:
+            raise Exception(f"추출 요약 중 오류가 발생했습니다: {str(e)}")
+
+    def split_sentences(self, text: str) -> List[str]:
+        """텍스트를 문장 단위로 분리"""
+        return [s.strip() for s in SENTENCE_SPLIT_PATTERN.split(text) if s and s.strip()]
+
+    def term_matrix(self, sentences: List[str]) -> sparse.csr_matrix:
+        """문장 x 단어 희소 TF-IDF 행렬 생성 (행 단위 L2 정규화)
+
+        메모리가 문장 수 x 어휘 수가 아니라 실제 등장한 단어 수에 비례하도록 희소 행렬을 사용합니다.
+        """
+        vocabulary = {}
+        rows, cols = [], []
+        for i, sentence in enumerate(sentences):
+            for token in WORD_PATTERN.findall(sentence.lower()):
+                rows.append(i)
+                cols.append(vocabulary.setdefault(token, len(vocabulary)))
+
+        shape = (len(sentences), max(len(vocabulary), 1))
+        matrix = sparse.csr_matrix(
+            (np.ones(len(rows)), (np.asarray(rows, dtype=np.int64), np.asarray(cols, dtype=np.int64))),
+            shape=shape
+        )
+        matrix.sum_duplicates()
+
+        # IDF 가중치
+        document_frequency = np.bincount(matrix.indices, minlength=shape[1])
+        idf = np.log((1.0 + len(sentences)) / (1.0 + document_frequency)) + 1.0
+        matrix.data *= idf[matrix.indices]
+
+        norms = np.sqrt(np.asarray(matrix.multiply(matrix).sum(axis=1)).ravel())
+        norms[norms == 0] = 1.0
+        return sparse.csr_matrix(sparse.diags(1.0 / norms) @ matrix)
+
+    def textrank_scores(self, sentences: List[str]) -> np.ndarray:
+        """TextRank 점수 계산 (거듭제곱 반복)
+
+        문장 간 코사인 유사도 행렬 S = M·Mᵀ(대각 제외)를 만들지 않고 M·(Mᵀ·x)로 곱하여
+        문장 수의 제곱에 비례하는 메모리와 연산을 피합니다.
+        """
+        matrix = self.term_matrix(sentences)
+        n = len(sentences)
+        self_similarity = np.asarray(matrix.multiply(matrix).sum(axis=1)).ravel()
+
+        def similarity_dot(x: np.ndarray) -> np.ndarray:
+            return matrix @ (matrix.T @ x) - self_similarity * x
+
+        # 행 정규화한 전이 행렬, 연결이 없는 문장은 균등 분포로 대체
+        row_sums = similarity_dot(np.ones(n))
+        # 대각 성분을 빼면서 생기는 부동소수점 오차는 연결 없음으로 처리
+        connected = row_sums > 1e-9
+        inverse_row_sums = np.divide(1.0, row_sums, out=np.zeros(n), where=connected)
+
+        scores = np.full(n, 1.0 / n)
+        teleport = (1.0 - self.damping) / n
+        for _ in range(self.max_iterations):
+            # 유사도 행렬은 대칭이므로 전이 행렬의 전치 곱은 S·(scores / row_sums)
+            spread = similarity_dot(scores * inverse_row_sums) + scores[~connected].sum() / n
+            updated = teleport + self.damping * spread
+            if np.abs(updated - scores).sum() < self.tolerance:
+                scores = updated
+                break
+            scores = updated
+        return scores
+
+    def lsa_scores(self, sentences: List[str], sentences_count: int) -> np.ndarray:
+        """LSA 점수 계산 (SVD 기반 Steinberger-Ježek 방식, 필요한 차원만 희소 SVD로 계산)"""
+        matrix = self.term_matrix(sentences).T
+        dimensions = max(1, min(sentences_count, min(matrix.shape)))
+        if dimensions < min(matrix.shape) - 1:
+            _, singular_values, vt = svds(matrix, k=dimensions, random_state=0)
+            order = np.argsort(-singular_values)
+            singular_values, vt = singular_values[order], vt[order]
+        else:
+            # 행렬이 작아 희소 SVD를 쓸 수 없으면 전체 SVD
+            _, singular_values, vt = np.linalg.svd(matrix.toarray(), full_matrices=False)
+
+        weighted = (singular_values[:dimensions, np.newaxis] * vt[:dimensions]) ** 2
+        return np.sqrt(weighted.sum(axis=0))
+
+    def select_sentences(self, sentences: List[str], scores: np.ndarray, count: int) -> List[str]:
+        """점수 상위 문장을 원문 순서대로 반환"""
+        top_indices = np.sort(np.argsort(-scores, kind="stable")[:count])
+        return [sentences[i] for i in top_indices]
+
+    def reduce_text(self, text: str, token_budget: int) -> Tuple[str, Dict[str, Any]]:
+        """LLM 요약 전 중심성/중복도 기반으로 문장을 선별하여 토큰 예산 이내로 축소"""
+        started = time.perf_counter()
+        sentences = self.split_sentences(text)
+        original_tokens = estimate_tokens(text)
+
+        applied = original_tokens > token_budget and len(sentences) > 1
+        if applied:
+            indices = self.select_within_budget(sentences, token_budget)
+            reduced_text = "\n".join(sentences[i] for i in indices)
+            kept = len(indices)
+        else:
+            reduced_text = text
+            kept = len(sentences)
+
+        reduced_tokens = estimate_tokens(reduced_text)
+        stats = {
+            "applied": applied,
+            "token_budget": token_budget,
+            "original_tokens": original_tokens,
+            "reduced_tokens": reduced_tokens,
+            "tokens_saved": original_tokens - reduced_tokens,
+            "sentences_total": len(sentences),
+            "sentences_kept": kept,
+            "elapsed_ms": round((time.perf_counter() - started) * 1000, 2)
+        }
+        return reduced_text, stats
+
+    def select_within_budget(self, sentences: List[str], token_budget: int) -> List[int]:
+        """MMR 방식으로 중심성이 높고 중복이 적은 문장을 예산 안에서 선택 (원문 순서 유지)"""
+        matrix = self.term_matrix(sentences)
+        centrality = self.textrank_scores(sentences)
+        centrality = centrality / centrality.max()
+        costs = np.array([estimate_tokens(s) for s in sentences])
+
+        selected = []
+        used = 0
+        max_similarity = np.zeros(len(sentences), dtype=np.float32)
+        available = costs <= token_budget
+        while available.any():
+            mmr = self.mmr_lambda * centrality - (1.0 - self.mmr_lambda) * max_similarity
+            mmr[~available] = -np.inf
+            best = int(np.argmax(mmr))
+            selected.append(best)
+            used += costs[best]
+            similarity = (matrix @ matrix[best].T).toarray().ravel()
+            similarity[best] = 0.0
+            max_similarity = np.maximum(max_similarity, similarity)
+            available[best] = False
+            available &= costs <= token_budget - used
+
+        return sorted(selected)
+
+    def get_summary_methods(self) -> dict:
+        """지원하는 추출 요약 방법 반환"""
+        return {
+            "textrank": "TextRank 기반 추출 요약 - 로컬 처리, API 호출 없음",
+            "lsa": "LSA(SVD) 기반 추출 요약 - 로컬 처리, API 호출 없음"
+        }
@@ -0,0 +1,195 @@
+import asyncio
+import heapq
+import itertools
+import math
+import time
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional, Tuple
+from config.settings import Settings
+
+
+@dataclass
+class QuotaBucket:
+    """테넌트별 분당 토큰 할당량 (일반/배치 대기열이 함께 사용)"""
+    capacity: float
+    tokens: float
+    updated: float = field(default_factory=time.monotonic)
+
+    def refill(self) -> None:
+        """분당 할당량을 초당 비율로 보충"""
+        now = time.monotonic()
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.capacity / 60.0)
+        self.updated = now
+
+
+@dataclass
+class TenantState:
+    """테넌트별 대기열 및 통계"""
+    weight: float
+    queue: List[Tuple[float, int, int, float, asyncio.Future]] = field(default_factory=list)
+    finish_tag: float = 0.0
+    quota: Optional[QuotaBucket] = None
+    served: int = 0
+    tokens: int = 0
+    rejected_quota: int = 0
+    total_wait: float = 0.0
+    max_wait: float = 0.0
+
+    def to_dict(self) -> Dict[str, Any]:
+        """딕셔너리로 변환"""
+        return {
+            "weight": self.weight,
+            "queued": sum(1 for *_, future in self.queue if not future.done()),
+            "served": self.served,
+            "tokens": self.tokens,
+            "rejected_quota": self.rejected_quota,
+            "average_wait_ms": round(self.total_wait / self.served * 1000, 2) if self.served else 0.0,
+            "max_wait_ms": round(self.max_wait * 1000, 2),
+            "quota_remaining": int(self.quota.tokens) if self.quota is not None else None
+        }
+
+
+class FairScheduler:
+    """테넌트(사용자/API 키) 간 가중 공정 큐잉 스케줄러
+
+    테넌트마다 대기열을 두고, 가상 시간 기반 종료 태그(비용 / 가중치)가 가장 작은
+    테넌트의 요청부터 슬롯을 배정합니다. 같은 테넌트 안에서는 짧은 요청이 먼저
+    처리되며, 한 테넌트가 대량 작업을 넣어도 다른 테넌트의 대기 시간은 가중치
+    비율만큼만 늘어납니다. 경쟁자가 없으면 한 테넌트가 전체 용량을 사용합니다.
+
+    짧은 요청이 계속 들어와도 큰 요청이 대기 기한까지 밀리지 않도록, 대기한 시간(초)마다
+    비용을 aging_rate 토큰만큼 적게 취급합니다. 같은 대기열 안에서는 현재 시각 항이 모두 같으므로
+    (비용 + aging_rate × 대기 시작 시각) 순서와 같아 힙 키를 다시 계산할 필요가 없습니다.
+    """
+
+    def __init__(self, aging_rate: Optional[float] = None):
+        """스케줄러 초기화 (aging_rate는 대기 1초당 줄어드는 우선순위 비용)"""
+        self.aging_rate = aging_rate if aging_rate is not None else Settings.LLM_QUEUE_AGING_TOKENS_PER_SECOND
+        self.tenants: Dict[str, TenantState] = {}
+        self.quotas: Dict[str, QuotaBucket] = {}
+        self.virtual_time = 0.0
+        self._sequence = itertools.count()
+
+    def tenant(self, tenant_id: str, weight: float, quota_per_minute: Optional[int] = None,
+               quota_key: Optional[str] = None) -> TenantState:
+        """테넌트 상태 조회 (없으면 생성, quota_key가 같은 대기열은 할당량을 공유)"""
+        if not weight > 0:
+            raise ValueError(f"테넌트 가중치는 0보다 커야 합니다: {weight}")
+        state = self.tenants.get(tenant_id)
+        if state is None:
+            if len(self.tenants) >= Settings.TENANT_MAX_TRACKED:
+                self._prune_idle()
+            state = TenantState(weight=weight, finish_tag=self.virtual_time)
+            self.tenants[tenant_id] = state
+        state.weight = weight
+        state.quota = self._quota_bucket(quota_key or tenant_id, quota_per_minute)
+        return state
+
+    def _quota_bucket(self, quota_key: str, quota_per_minute: Optional[int]) -> Optional[QuotaBucket]:
+        """할당량 버킷 조회 (없거나 한도가 바뀌면 새로 생성, 무제한이면 None)"""
+        if not quota_per_minute:
+            self.quotas.pop(quota_key, None)
+            return None
+        bucket = self.quotas.get(quota_key)
+        if bucket is None or bucket.capacity != quota_per_minute:
+            bucket = QuotaBucket(capacity=float(quota_per_minute), tokens=float(quota_per_minute),
+                                 updated=time.monotonic())
+            self.quotas[quota_key] = bucket
+        return bucket
+
+    def charge_quota(self, state: TenantState, cost: int) -> Optional[int]:
+        """토큰 할당량 차감, 부족하면 다시 시도할 수 있을 때까지의 시간(초) 반환"""
+        bucket = state.quota
+        if bucket is None:
+            return None
+
+        # 분당 할당량을 초당 비율로 보충하는 토큰 버킷
+        bucket.refill()
+        required = min(cost, bucket.capacity)
+        if bucket.tokens < required:
+            state.rejected_quota += 1
+            return max(1, math.ceil((required - bucket.tokens) / (bucket.capacity / 60.0)))
+
+        bucket.tokens -= required
+        return None
+
+    def refund_quota(self, state: TenantState, cost: int) -> None:
+        """처리되지 못한 요청의 할당량 반환"""
+        bucket = state.quota
+        if bucket is not None:
+            bucket.tokens = min(bucket.capacity, bucket.tokens + min(cost, bucket.capacity))
+
+    def push(self, state: TenantState, cost: int, future: asyncio.Future) -> None:
+        """요청을 테넌트 대기열에 추가 (테넌트 안에서는 짧은 요청 우선, 오래 기다린 요청일수록 앞으로)"""
+        self._discard_cancelled(state)
+        if not state.queue:
+            # 대기열이 비어 있던 테넌트는 현재 가상 시간에서 시작 (쉬는 동안의 몫을 몰아서 쓰지 않도록)
+            state.finish_tag = max(state.finish_tag, self.virtual_time)
+        cost = max(cost, 1)
+        enqueued = time.monotonic()
+        priority = cost + self.aging_rate * enqueued
+        heapq.heappush(state.queue, (priority, next(self._sequence), cost, enqueued, future))
+
+    def pop(self) -> Optional[asyncio.Future]:
+        """종료 태그가 가장 작은 테넌트의 다음 요청 반환"""
+        best = None
+        best_finish = math.inf
+        for state in self.tenants.values():
+            self._discard_cancelled(state)
+            if not state.queue:
+                continue
+            # 대기 중인 테넌트의 시작 태그는 대기열에 들어올 때 정해지며, 가상 시간이 흘러도 다시 올리지 않음
+            finish = state.finish_tag + state.queue[0][2] / state.weight
+            if finish < best_finish:
+                best, best_finish = state, finish
+
+        if best is None:
+            return None
+
+        _, _, cost, enqueued, future = heapq.heappop(best.queue)
+        self.start(best, cost, time.monotonic() - enqueued, queued=True)
+        return future
+
+    def _discard_cancelled(self, state: TenantState) -> None:
+        """대기열 앞쪽의 취소/완료된 요청 정리"""
+        while state.queue and state.queue[0][4].done():
+            heapq.heappop(state.queue)
+
+    def start(self, state: TenantState, cost: int, wait: float, queued: bool = False) -> None:
+        """처리 시작: 가상 시간과 종료 태그 갱신 및 통계 기록 (queued는 대기열에서 꺼낸 요청)"""
+        start = state.finish_tag if queued else max(self.virtual_time, state.finish_tag)
+        self.virtual_time = max(self.virtual_time, start)
+        state.finish_tag = start + max(cost, 1) / state.weight
+        state.served += 1
+        state.tokens += cost
+        state.total_wait += wait
+        state.max_wait = max(state.max_wait, wait)
+
+    def _prune_idle(self) -> None:
+        """대기 요청이 없고 가상 시간보다 뒤처진 테넌트 정리"""
+        idle = [tenant_id for tenant_id, state in self.tenants.items()
+                if not state.queue and state.finish_tag <= self.virtual_time]
+        for tenant_id in idle:
+            del self.tenants[tenant_id]
+
+        # 남은 테넌트가 쓰지 않고 다 채워진 할당량 버킷 정리 (일부 사용한 버킷은 유지하여 할당량 초기화 방지)
+        in_use = {id(state.quota) for state in self.tenants.values()}
+        for quota_key, bucket in list(self.quotas.items()):
+            bucket.refill()
+            if id(bucket) not in in_use and bucket.tokens >= bucket.capacity:
+                del self.quotas[quota_key]
+
+    def stats(self) -> Dict[str, Any]:
+        """테넌트별 통계 반환"""
+        return {tenant_id: state.to_dict() for tenant_id, state in self.tenants.items()}
+
+
+def tenant_weight(tenant_id: str, batch: bool) -> float:
+    """설정에 따른 테넌트 가중치 (배치 작업은 낮은 가중치로 백그라운드 처리)"""
+    weight = float(Settings.TENANT_WEIGHTS.get(tenant_id, Settings.TENANT_DEFAULT_WEIGHT))
+    return weight * Settings.TENANT_BATCH_WEIGHT_FACTOR if batch else weight
+
+
+def tenant_quota(tenant_id: str) -> int:
+    """설정에 따른 테넌트 분당 토큰 할당량 (0이면 무제한)"""
+    return int(Settings.TENANT_TOKEN_QUOTAS.get(tenant_id, Settings.TENANT_DEFAULT_TOKEN_QUOTA))
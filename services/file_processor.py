@@ -1,12 +1,44 @@
 import base64
 import io
+import math
+import os
+import time
 import PyPDF2
-from docx import Document
-import pytesseract
+from collections import deque
+from concurrent.futures import Future
 from PIL import Image
-from typing import Optional
+from typing import BinaryIO, Iterator, Optional, List, Dict, Any, Tuple
 from models.document import Document, FileType
 from config.settings import Settings
+from services.docx_stream_extractor import DocxStreamExtractor
+from services.memory_budget import memory_budget, estimate_document_memory
+from services.ocr_engine import ocr_pool, recognize
+from services.request_profiler import profile_stage
+from services.text_normalizer import TextNormalizer
+
+# PIL 자체 보호 한도도 설정과 맞춤 (한도의 2배를 넘으면 DecompressionBombError)
+Image.MAX_IMAGE_PIXELS = Settings.MAX_IMAGE_PIXELS
+
+
+def _ocr_image_bytes(file_bytes: bytes) -> str:
+    """이미지 바이트를 검사/축소한 뒤 OCR (OCR 작업 프로세스에서 실행)"""
+    processor = FileProcessorService()
+    try:
+        return processor._ocr_image(processor._open_image_for_ocr(file_bytes))
+    except ValueError:
+        raise
+    except Exception as e:
+        # 부모 프로세스에서 복원할 수 없는 예외(예: TesseractNotFoundError)는 풀 전체를 손상시키므로 메시지만 전달
+        raise RuntimeError(str(e)) from None
+
+
+def _ocr_pdf_page(images: List[bytes]) -> Tuple[str, float]:
+    """PDF 페이지의 내장 이미지를 OCR (OCR 작업 프로세스에서 실행)"""
+    started = time.perf_counter()
+    texts = [_ocr_image_bytes(data) for data in images]
+    text = "\n".join(t for t in texts if t)
+    return text, time.perf_counter() - started
+
 
 class FileProcessorService:
     """파일 처리 서비스 클래스"""
@@ -15,12 +47,19 @@ class FileProcessorService:
         """파일 처리 서비스 초기화"""
         self.max_file_size = Settings.MAX_FILE_SIZE
         self.allowed_types = Settings.ALLOWED_FILE_TYPES
+        self.text_normalizer = TextNormalizer()
     
-    def validate_file(self, file_data: bytes, file_type: str, file_name: str) -> bool:
+    def validate_file(self, file_data: bytes, file_type: str, file_name: str,
+                      max_file_size: Optional[int] = None) -> bool:
         """파일 유효성 검사"""
+        return self._validate_file_info(len(file_data), file_type, max_file_size)
+    
+    def _validate_file_info(self, file_size: int, file_type: str, max_file_size: Optional[int] = None) -> bool:
+        """파일 크기와 형식 검사"""
         # 파일 크기 검사
-        if len(file_data) > self.max_file_size:
-            raise ValueError(f"파일 크기가 {self.max_file_size // 1024 // 1024}MB를 초과합니다.")
+        max_file_size = max_file_size or self.max_file_size
+        if file_size > max_file_size:
+            raise ValueError(f"파일 크기가 {max_file_size // 1024 // 1024}MB를 초과합니다.")
         
         # 파일 타입 검사
         if file_type not in self.allowed_types:
@@ -37,86 +76,279 @@ class FileProcessorService:
             # 파일 유효성 검사
             self.validate_file(file_bytes, file_type, file_name)
             
-            # FileType 열거형으로 변환
-            try:
-                file_type_enum = FileType(file_type)
-            except ValueError:
-                raise ValueError(f"지원하지 않는 파일 형식입니다: {file_type}")
+            return self._create_document(file_bytes, file_type, file_name)
             
-            # Document 객체 생성
-            document = Document(
-                file_name=file_name,
-                file_type=file_type_enum,
-                file_size=len(file_bytes),
-                file_data=file_bytes
-            )
+        except ValueError:
+            raise
+        except Exception as e:
+            raise Exception(f"파일 처리 중 오류가 발생했습니다: {str(e)}")
+    
+    def create_document_from_file(self, file_path: str, file_type: str, file_name: str) -> Document:
+        """분할 업로드로 스풀된 파일로부터 Document 객체 생성
+        
+        파일 내용은 메모리에 올리지 않고, 추출 단계에서 PDF/DOCX는 파일을 스트림으로 직접 읽습니다.
+        """
+        try:
+            # 파일 유효성 검사
+            file_size = os.path.getsize(file_path)
+            self._validate_file_info(file_size, file_type, max_file_size=Settings.MAX_UPLOAD_SESSION_SIZE)
             
-            return document
+            return self._create_document(b"", file_type, file_name, file_path=file_path)
             
+        except ValueError:
+            raise
         except Exception as e:
             raise Exception(f"파일 처리 중 오류가 발생했습니다: {str(e)}")
     
-    def extract_text_from_document(self, document: Document) -> str:
+    def _create_document(self, file_bytes: bytes, file_type: str, file_name: str,
+                         file_path: Optional[str] = None) -> Document:
+        """검증된 파일 바이트(또는 스풀된 파일 경로)로 Document 객체 생성"""
+        # FileType 열거형으로 변환
+        try:
+            file_type_enum = FileType(file_type)
+        except ValueError:
+            raise ValueError(f"지원하지 않는 파일 형식입니다: {file_type}")
+        
+        # Document 객체 생성
+        return Document(
+            file_name=file_name,
+            file_type=file_type_enum,
+            file_size=os.path.getsize(file_path) if file_path is not None else len(file_bytes),
+            file_data=file_bytes,
+            file_path=file_path
+        )
+    
+    def extract_text_from_document(self, document: Document,
+                                   page_stats: Optional[List[Dict[str, Any]]] = None) -> str:
         """문서에서 텍스트 추출"""
         try:
-            file_bytes = document.file_data
             file_type = document.file_type
             
             if file_type == FileType.PDF:
-                return self._extract_from_pdf(file_bytes)
+                return self._extract_from_pdf(document, page_stats)
             elif file_type in [FileType.DOCX, FileType.DOC]:
-                return self._extract_from_docx(file_bytes)
+                return self._extract_from_docx(document)
             elif file_type in [FileType.PNG, FileType.JPG, FileType.JPEG, FileType.GIF, FileType.BMP]:
-                return self._extract_from_image(file_bytes)
+                return self._extract_from_image(document.read_bytes())
             elif file_type == FileType.TXT:
-                return file_bytes.decode('utf-8')
+                # 한도를 넘는 텍스트 파일은 읽기 전에 거절
+                self._check_extracted_chars(document.file_size)
+                return self._extract_from_txt(document.read_bytes())
             else:
                 raise ValueError(f"지원하지 않는 파일 형식입니다: {file_type}")
                 
+        except ValueError:
+            raise
         except Exception as e:
             raise Exception(f"텍스트 추출 중 오류가 발생했습니다: {str(e)}")
     
-    def _extract_from_pdf(self, file_bytes: bytes) -> str:
+    def has_page_numbers(self, document: Document) -> bool:
+        """정규화할 때 쪽 번호 줄을 제거할 형식인지 (페이지 구분이 있는 PDF/DOCX만)"""
+        return document.file_type in (FileType.PDF, FileType.DOCX, FileType.DOC)
+    
+    def iter_document_pages(self, document: Document,
+                            page_stats: Optional[List[Dict[str, Any]]] = None) -> Iterator[str]:
+        """문서 텍스트를 페이지 단위로 반환 (PDF 이외의 형식은 한 페이지)"""
+        if document.file_type == FileType.PDF:
+            return self._iter_pdf_pages(document, page_stats)
+        return iter([self.extract_text_from_document(document)])
+    
+    def _extract_from_pdf(self, document: Document,
+                          page_stats: Optional[List[Dict[str, Any]]] = None) -> str:
         """PDF에서 텍스트 추출"""
+        return "\n".join(self._iter_pdf_pages(document, page_stats)).strip()
+    
+    def _iter_pdf_pages(self, document: Document,
+                        page_stats: Optional[List[Dict[str, Any]]] = None) -> Iterator[str]:
+        """PDF 페이지별 텍스트 추출 (텍스트 레이어가 없는 페이지는 병렬 OCR, 페이지 순서 유지)"""
+        with document.open_stream() as pdf_file:
+            yield from self._iter_pdf_reader_pages(pdf_file, page_stats)
+    
+    def _iter_pdf_reader_pages(self, pdf_file: BinaryIO,
+                               page_stats: Optional[List[Dict[str, Any]]]) -> Iterator[str]:
+        """열린 PDF 스트림의 페이지별 텍스트 추출"""
         try:
-            pdf_file = io.BytesIO(file_bytes)
             pdf_reader = PyPDF2.PdfReader(pdf_file)
-            text = ""
-            for page in pdf_reader.pages:
-                text += page.extract_text() + "\n"
-            return text.strip()
+            
+            # 페이지 수 제한
+            page_count = len(pdf_reader.pages)
+            if page_count > Settings.MAX_PDF_PAGES:
+                raise ValueError(f"PDF 페이지 수({page_count})가 최대 {Settings.MAX_PDF_PAGES}페이지를 초과합니다.")
+            
+            # OCR 결과를 기다리는 페이지 수를 제한하여 이미지 바이트가 메모리에 쌓이지 않도록 함
+            window = max(1, Settings.OCR_WORKERS) * 2
+            pending = deque()
+            total_chars = 0
+            for page_number, page in enumerate(pdf_reader.pages, start=1):
+                started = time.perf_counter()
+                page_text = page.extract_text() or ""
+                entry = {"page": page_number, "text": page_text, "future": None,
+                         "elapsed": time.perf_counter() - started}
+                if Settings.OCR_PDF_FALLBACK and len(page_text.strip()) < Settings.OCR_MIN_PAGE_CHARS:
+                    entry["future"] = self._submit_page_ocr(page, entry)
+                pending.append(entry)
+                
+                # 앞쪽 페이지가 준비되는 대로 순서대로 내보냄
+                while pending and (len(pending) > window or self._page_ready(pending[0])):
+                    page_text = self._finish_page(pending.popleft(), page_stats)
+                    total_chars += len(page_text)
+                    self._check_extracted_chars(total_chars)
+                    yield page_text
+            
+            while pending:
+                page_text = self._finish_page(pending.popleft(), page_stats)
+                total_chars += len(page_text)
+                self._check_extracted_chars(total_chars)
+                yield page_text
+        except ValueError:
+            raise
         except Exception as e:
             raise Exception(f"PDF 텍스트 추출 실패: {str(e)}")
     
-    def _extract_from_docx(self, file_bytes: bytes) -> str:
-        """DOCX에서 텍스트 추출"""
+    def _submit_page_ocr(self, page, entry: Dict[str, Any]) -> Optional[Future]:
+        """페이지 내장 이미지를 꺼내 OCR 작업으로 제출 (이미지가 없으면 None)"""
+        started = time.perf_counter()
         try:
-            doc_file = io.BytesIO(file_bytes)
-            doc = Document(doc_file)
-            text = ""
-            for paragraph in doc.paragraphs:
-                text += paragraph.text + "\n"
-            return text.strip()
+            images = [image.data for image in page.images]
+        except Exception as e:
+            entry["error"] = f"이미지 추출 실패: {str(e)}"
+            images = []
+        entry["elapsed"] += time.perf_counter() - started
+        if not images:
+            return None
+        return ocr_pool.submit(_ocr_pdf_page, images)
+    
+    def _page_ready(self, entry: Dict[str, Any]) -> bool:
+        """페이지 결과가 대기 없이 준비되었는지 여부"""
+        return entry["future"] is None or entry["future"].done()
+    
+    def _finish_page(self, entry: Dict[str, Any],
+                     page_stats: Optional[List[Dict[str, Any]]]) -> str:
+        """페이지 OCR 결과를 기다려 텍스트를 확정하고 페이지별 소요 시간 기록"""
+        source = "text"
+        page_text = entry["text"]
+        if entry["future"] is not None:
+            try:
+                ocr_text, ocr_elapsed = entry["future"].result()
+                entry["elapsed"] += ocr_elapsed
+                if len(ocr_text.strip()) > len(page_text.strip()):
+                    page_text = ocr_text
+                    source = "ocr"
+            except Exception as e:
+                # OCR 엔진이 없거나 실패하면, 또는 내장 이미지가 해상도 한도를 넘으면(ValueError)
+                # 이 페이지만 기존 텍스트 레이어 결과를 그대로 사용
+                entry["error"] = f"OCR 실패: {str(e)}"
+        
+        if page_stats is not None:
+            stat = {
+                "page": entry["page"],
+                "source": source,
+                "chars": len(page_text),
+                "elapsed_ms": round(entry["elapsed"] * 1000, 2)
+            }
+            if "error" in entry:
+                stat["error"] = entry["error"]
+            page_stats.append(stat)
+        return page_text
+    
+    def _extract_from_docx(self, document: Document) -> str:
+        """DOCX에서 텍스트 추출 (머리글/표/바닥글 포함, 스트리밍 파싱)"""
+        try:
+            with document.open_stream() as stream:
+                extractor = DocxStreamExtractor(
+                    stream,
+                    max_uncompressed_bytes=Settings.MAX_DOCX_UNCOMPRESSED_BYTES,
+                    max_chars=Settings.MAX_EXTRACTED_CHARS
+                )
+                return extractor.extract_text()
+        except ValueError:
+            raise
         except Exception as e:
             raise Exception(f"DOCX 텍스트 추출 실패: {str(e)}")
     
     def _extract_from_image(self, file_bytes: bytes) -> str:
-        """이미지에서 OCR로 텍스트 추출"""
+        """이미지에서 OCR로 텍스트 추출 (언어 데이터를 미리 로드한 OCR 작업 프로세스에서 실행)"""
         try:
-            image = Image.open(io.BytesIO(file_bytes))
-            # OCR 실행
-            text = pytesseract.image_to_string(image, lang='kor+eng')
-            return text.strip()
+            return ocr_pool.submit(_ocr_image_bytes, file_bytes).result()
+        except ValueError:
+            raise
         except Exception as e:
             raise Exception(f"이미지 OCR 실패: {str(e)}")
     
-    def process_document(self, file_data: str, file_type: str, file_name: str) -> Document:
+    def _ocr_image(self, image: Image.Image) -> str:
+        """이미지 OCR 실행"""
+        return recognize(image)
+    
+    def _extract_from_txt(self, file_bytes: bytes) -> str:
+        """텍스트 파일 디코딩"""
+        self._check_extracted_chars(len(file_bytes))
+        return file_bytes.decode('utf-8')
+    
+    def _open_image_for_ocr(self, file_bytes: bytes) -> Image.Image:
+        """픽셀 수를 검사하고 OCR 한도 이하로 축소한 이미지 반환"""
+        # Image.open은 헤더만 읽으므로 디코딩 전에 크기를 검사할 수 있음
+        try:
+            image = Image.open(io.BytesIO(file_bytes))
+        except Image.DecompressionBombError as e:
+            raise ValueError(f"이미지 해상도가 허용 한도를 초과합니다: {str(e)}")
+        width, height = image.size
+        pixels = width * height
+        if pixels > Settings.MAX_IMAGE_PIXELS:
+            raise ValueError(
+                f"이미지 해상도({width}x{height})가 허용 한도({Settings.MAX_IMAGE_PIXELS} 픽셀)를 초과합니다."
+            )
+        
+        if pixels > Settings.OCR_MAX_PIXELS:
+            scale = math.sqrt(Settings.OCR_MAX_PIXELS / pixels)
+            target = (max(1, int(width * scale)), max(1, int(height * scale)))
+            # JPEG는 디코딩 단계에서 축소하여 전체 해상도 버퍼를 만들지 않음
+            image.draft(image.mode, target)
+            image.thumbnail(target)
+        
+        return image
+    
+    def _check_extracted_chars(self, total_chars: int) -> None:
+        """추출된 전체 문자 수 제한 검사"""
+        if total_chars > Settings.MAX_EXTRACTED_CHARS:
+            raise ValueError(f"추출된 텍스트가 최대 {Settings.MAX_EXTRACTED_CHARS}자를 초과합니다.")
+    
+    def process_document(self, file_data: str, file_type: str, file_name: str,
+                         normalize: Optional[bool] = None) -> Document:
         """문서 처리 전체 과정"""
         # Document 객체 생성
-        document = self.create_document_from_upload(file_data, file_type, file_name)
+        with profile_stage("decode"):
+            document = self.create_document_from_upload(file_data, file_type, file_name)
         
-        # 텍스트 추출
-        extracted_text = self.extract_text_from_document(document)
+        return self.process_loaded_document(document, normalize)
+    
+    def process_spooled_file(self, file_path: str, file_type: str, file_name: str,
+                             normalize: Optional[bool] = None) -> Document:
+        """분할 업로드로 스풀된 파일 처리 전체 과정"""
+        with profile_stage("decode"):
+            document = self.create_document_from_file(file_path, file_type, file_name)
+        
+        return self.process_loaded_document(document, normalize)
+    
+    def process_loaded_document(self, document: Document, normalize: Optional[bool]) -> Document:
+        """Document 텍스트 추출 및 정규화"""
+        if normalize is None:
+            normalize = Settings.NORMALIZE_UPLOADS
+        
+        # PDF는 페이지별 추출 방식(텍스트/OCR)과 소요 시간을 기록
+        page_stats = [] if document.file_type == FileType.PDF else None
+        
+        # 예상 메모리만큼 전역 예산을 확보한 뒤 텍스트 추출
+        with memory_budget.reserve(estimate_document_memory(document)), profile_stage("extract"):
+            if normalize:
+                # 페이지를 추출하는 대로 정규화 (DOCX 문단은 이미 문단 단위이므로 줄 재배치 제외)
+                extracted_text, document.normalization = self.text_normalizer.normalize_pages(
+                    self.iter_document_pages(document, page_stats),
+                    reflow=document.file_type not in (FileType.DOCX, FileType.DOC),
+                    page_numbers=self.has_page_numbers(document)
+                )
+            else:
+                extracted_text = self.extract_text_from_document(document, page_stats)
         document.extracted_text = extracted_text
+        document.page_stats = page_stats
         
         return document
@@ -0,0 +1,114 @@
+import threading
+import time
+from contextlib import contextmanager
+from typing import Any, Dict, Iterator, Optional
+from PIL import Image
+from config.settings import Settings
+from models.document import Document, FileType
+
+IMAGE_TYPES = (FileType.PNG, FileType.JPG, FileType.JPEG, FileType.GIF, FileType.BMP)
+
+
+class MemoryBudgetExceededError(Exception):
+    """전역 메모리 예산이 부족하여 문서 처리를 시작할 수 없는 경우"""
+
+    def __init__(self, message: str, retry_after: int):
+        super().__init__(message)
+        self.retry_after = retry_after
+
+
+class MemoryBudget:
+    """처리 중인 문서의 예상 메모리 사용량을 추적하는 전역 예산 클래스 (프로세스 단위)
+
+    예산이 부족하면 최대 대기 시간 동안 다른 문서의 처리가 끝나기를 기다리고,
+    그래도 부족하면 거절합니다.
+    """
+
+    def __init__(self, budget_bytes: Optional[int] = None, wait_timeout: Optional[float] = None):
+        """전체 예산(바이트)과 대기 시간(초) 설정"""
+        self.budget_bytes = budget_bytes or Settings.MEMORY_BUDGET_BYTES
+        self.wait_timeout = wait_timeout if wait_timeout is not None else Settings.MEMORY_BUDGET_WAIT_TIMEOUT
+        self.reserved_bytes = 0
+        self.in_flight = 0
+        self.deferred = 0
+        self.rejected = 0
+        self._condition = threading.Condition()
+
+    @contextmanager
+    def reserve(self, nbytes: int) -> Iterator[None]:
+        """예상 메모리만큼 예산 확보 후 처리, 종료 시 반환"""
+        if nbytes > self.budget_bytes:
+            raise ValueError(
+                f"문서 처리에 필요한 메모리({nbytes // 1024 // 1024}MB)가 "
+                f"허용 한도({self.budget_bytes // 1024 // 1024}MB)를 초과합니다."
+            )
+
+        with self._condition:
+            if self.reserved_bytes + nbytes > self.budget_bytes:
+                self.deferred += 1
+                deadline = time.monotonic() + self.wait_timeout
+                while self.reserved_bytes + nbytes > self.budget_bytes:
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        self.rejected += 1
+                        raise MemoryBudgetExceededError(
+                            "처리 중인 문서가 많아 지금은 처리할 수 없습니다. 잠시 후 다시 시도해주세요.",
+                            max(1, int(self.wait_timeout))
+                        )
+                    self._condition.wait(remaining)
+            self.reserved_bytes += nbytes
+            self.in_flight += 1
+
+        try:
+            yield
+        finally:
+            with self._condition:
+                self.reserved_bytes -= nbytes
+                self.in_flight -= 1
+                self._condition.notify_all()
+
+    def stats(self) -> Dict[str, Any]:
+        """현재 예산 사용 현황 반환"""
+        with self._condition:
+            return {
+                "budget_bytes": self.budget_bytes,
+                "reserved_bytes": self.reserved_bytes,
+                "in_flight": self.in_flight,
+                "deferred": self.deferred,
+                "rejected": self.rejected
+            }
+
+
+def estimate_document_memory(document: Document) -> int:
+    """문서 처리 시 예상 최대 메모리 사용량(바이트)"""
+    if document.file_type in IMAGE_TYPES:
+        try:
+            # 헤더만 읽어 크기 확인 (픽셀 데이터는 디코딩하지 않음)
+            with document.open_stream() as stream, Image.open(stream) as image:
+                pixels = image.width * image.height
+                is_jpeg = image.format == "JPEG"
+        except Exception:
+            pixels, is_jpeg = Settings.MAX_IMAGE_PIXELS, False
+        pixels = min(pixels, Settings.MAX_IMAGE_PIXELS)
+        ocr_pixels = min(pixels, Settings.OCR_MAX_PIXELS)
+        if is_jpeg:
+            # JPEG는 draft로 1/2^n 단위 축소 디코딩하므로 축소 기준의 4배 미만
+            decoded_pixels = min(pixels, ocr_pixels * 4)
+        else:
+            # PNG/GIF/BMP는 원본 해상도로 전부 디코딩한 뒤 thumbnail로 축소
+            decoded_pixels = pixels
+        # 축소 시 2단계 리샘플링의 중간 버퍼(축소 후 너비 x 원본 높이)도 디코딩 버퍼 이하로 잡음
+        resize_pixels = decoded_pixels if pixels > Settings.OCR_MAX_PIXELS else 0
+        # 원본 바이트 + OCR 작업 프로세스로 보내는 사본(직렬화 버퍼와 작업 프로세스 쪽 사본)
+        # + 작업 프로세스의 디코딩/리샘플링 버퍼(픽셀당 최대 4바이트)와 축소한 OCR용 사본
+        return document.file_size * 3 + (decoded_pixels + resize_pixels + ocr_pixels) * 4
+
+    if document.file_type == FileType.PDF:
+        return document.file_size * Settings.PDF_MEMORY_FACTOR + Settings.MAX_EXTRACTED_CHARS * 4
+
+    # DOCX는 스트리밍 파싱, 텍스트는 디코딩 사본 정도
+    return document.file_size * 2 + min(document.file_size * 4, Settings.MAX_EXTRACTED_CHARS * 4)
+
+
+# 프로세스 전역 예산 (스레드 풀에서 처리되는 요청들이 공유)
+memory_budget = MemoryBudget()
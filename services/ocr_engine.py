@@ -0,0 +1,156 @@
+import logging
+import multiprocessing
+import threading
+from concurrent.futures import Future, ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Any, Callable, Dict, Optional
+import pytesseract
+from PIL import Image
+from config.settings import Settings
+
+try:
+    import tesserocr
+except ImportError:  # libtesseract가 없어 설치하지 못한 환경에서만 pytesseract 사용
+    tesserocr = None
+
+logger = logging.getLogger(__name__)
+
+# tesseract 엔진은 스레드 안전하지 않으므로 스레드마다 하나씩 유지
+_local = threading.local()
+
+
+def ocr_backend() -> str:
+    """사용 중인 OCR 백엔드 이름"""
+    return "tesserocr" if tesserocr is not None else "pytesseract"
+
+
+def _engine():
+    """현재 스레드의 tesseract 엔진 반환 (언어 데이터는 처음 한 번만 로드)"""
+    api = getattr(_local, "api", None)
+    if api is None:
+        api = tesserocr.PyTessBaseAPI(lang=Settings.OCR_LANGUAGES)
+        _local.api = api
+    return api
+
+
+def recognize(image: Image.Image) -> str:
+    """이미지 OCR 실행
+
+    tesserocr가 있으면 프로세스 안에 로드된 엔진에 이미지를 메모리로 전달하고,
+    없으면 pytesseract로 호출마다 tesseract 프로세스를 실행합니다.
+    """
+    if tesserocr is not None:
+        api = _engine()
+        try:
+            api.SetImage(image)
+            text = api.GetUTF8Text()
+        finally:
+            api.Clear()
+    else:
+        text = pytesseract.image_to_string(image, lang=Settings.OCR_LANGUAGES)
+    return text.strip()
+
+
+def _warm_up() -> None:
+    """작업 프로세스 시작 시 엔진을 미리 로드"""
+    if tesserocr is None:
+        return
+    try:
+        _engine()
+    except Exception:
+        # 초기화 예외는 풀 전체를 사용할 수 없게 만드므로 첫 OCR 호출에서 오류를 보고
+        pass
+
+
+def _mp_context() -> multiprocessing.context.BaseContext:
+    """작업 프로세스 시작 방식
+
+    서버 프로세스는 이벤트 루프와 스레드 풀 스레드가 실행 중이므로, 잠금을 쥔 상태로 복제될 수 있는
+    fork 대신 단일 스레드 forkserver(지원하지 않으면 spawn)에서 작업 프로세스를 만듭니다.
+    """
+    methods = multiprocessing.get_all_start_methods()
+    return multiprocessing.get_context("forkserver" if "forkserver" in methods else "spawn")
+
+
+class OcrWorkerPool:
+    """언어 데이터를 한 번만 로드하고 재사용하는 OCR 작업 프로세스 풀 클래스
+
+    작업 함수와 인자(이미지 바이트)는 파이프로 전달되어 임시 파일을 만들지 않습니다.
+    프로세스 풀을 만들 수 없는 환경(/dev/shm이 없는 서버리스 등)이나 OCR_WORKERS=0이면
+    호출한 스레드에서 바로 실행합니다.
+    """
+
+    def __init__(self, max_workers: Optional[int] = None):
+        """작업 프로세스 수 설정 (기본값은 OCR_WORKERS)"""
+        self.max_workers = max_workers if max_workers is not None else Settings.OCR_WORKERS
+        self.submitted = 0
+        self.restarts = 0
+        self.inline = self.max_workers <= 0
+        self._executor: Optional[ProcessPoolExecutor] = None
+        self._lock = threading.Lock()
+        self._backend_logged = False
+
+    def submit(self, fn: Callable[..., Any], *args: Any) -> Future:
+        """OCR 작업 제출 (작업 프로세스가 비정상 종료되어 풀이 손상되었으면 새로 생성)"""
+        self.submitted += 1
+        executor = self._get_executor()
+        if executor is None:
+            return self._run_inline(fn, *args)
+        try:
+            return executor.submit(fn, *args)
+        except BrokenProcessPool:
+            with self._lock:
+                if self._executor is executor:
+                    self._executor = None
+                    self.restarts += 1
+            executor = self._get_executor()
+            if executor is None:
+                return self._run_inline(fn, *args)
+            return executor.submit(fn, *args)
+
+    def shutdown(self) -> None:
+        """작업 프로세스 종료"""
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=True, cancel_futures=True)
+
+    def stats(self) -> Dict[str, Any]:
+        """풀 상태 통계"""
+        return {
+            "backend": ocr_backend(),
+            "workers": 0 if self.inline else self.max_workers,
+            "inline": self.inline,
+            "submitted": self.submitted,
+            "restarts": self.restarts
+        }
+
+    def _get_executor(self) -> Optional[ProcessPoolExecutor]:
+        """프로세스 풀 반환 (최초 호출 시 생성, 생성할 수 없으면 None)"""
+        with self._lock:
+            # 작업 프로세스도 이 모듈을 불러오므로 import 시점이 아닌 풀을 처음 사용할 때 한 번만 기록
+            if not self._backend_logged:
+                self._backend_logged = True
+                if tesserocr is None:
+                    logger.warning("tesserocr를 불러올 수 없어 pytesseract로 OCR합니다 (이미지마다 tesseract 프로세스 실행).")
+            if self._executor is None and not self.inline:
+                try:
+                    self._executor = ProcessPoolExecutor(
+                        max_workers=self.max_workers, mp_context=_mp_context(), initializer=_warm_up
+                    )
+                except (OSError, NotImplementedError):
+                    self.inline = True
+            return self._executor
+
+    def _run_inline(self, fn: Callable[..., Any], *args: Any) -> Future:
+        """현재 스레드에서 실행한 결과를 Future로 반환"""
+        future = Future()
+        try:
+            future.set_result(fn(*args))
+        except BaseException as e:
+            future.set_exception(e)
+        return future
+
+
+# 전역 OCR 작업 풀 (프로세스 단위)
+ocr_pool = OcrWorkerPool()
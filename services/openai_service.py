@@ -1,95 +1,217 @@
-from openai import OpenAI
-from typing import Optional
+import httpx
+from contextlib import contextmanager
+from openai import OpenAI, AsyncOpenAI
+from typing import Iterator, Optional
 from config.settings import Settings
 from models.translation import TranslationRequest, TranslationResult, Language
 from models.summary import SummaryRequest, SummaryResult, SummaryMethod
+from services.request_profiler import profile_stage
+from services.prompt_templates import prompt_registry
 
-class OpenAIService:
-    """OpenAI API 서비스 클래스"""
+class OpenAIServiceBase:
+    """OpenAI 서비스 공통 클래스 (요청 파라미터 생성, 호출 구간 처리 및 결과 변환)
+
+    동기/비동기 서비스는 클라이언트 호출만 다르고 나머지는 모두 이 클래스를 공유합니다.
+    """
+    
+    SUMMARY_MAX_TOKENS = 1000  # 요약 응답 최대 토큰 수
     
     def __init__(self):
-        """OpenAI 클라이언트 초기화"""
+        """공통 설정 초기화"""
         Settings.validate()
-        self.client = OpenAI(api_key=Settings.OPENAI_API_KEY)
         self.config = Settings.get_openai_config()
     
-    def translate_text(self, request: TranslationRequest) -> TranslationResult:
-        """텍스트 번역"""
-        try:
-            # 언어 코드를 언어명으로 변환
-            lang_names = Settings.SUPPORTED_LANGUAGES
-            target_lang_name = lang_names.get(request.target_language.value, request.target_language.value)
-            source_lang_name = lang_names.get(request.source_language.value, request.source_language.value) if request.source_language != Language.AUTO else '자동 감지'
-            
-            # 번역 프롬프트 생성
-            prompt = f"다음 텍스트를 {target_lang_name}로 번역해주세요. 원문의 의미와 뉘앙스를 정확히 전달하되 자연스러운 {target_lang_name}로 번역해주세요:\n\n{request.text}"
-            
-            # OpenAI API 호출
-            response = self.client.chat.completions.create(
-                model=self.config["model"],
-                messages=[
-                    {"role": "system", "content": f"당신은 전문 번역가입니다. 주어진 텍스트를 정확하고 자연스럽게 {target_lang_name}로 번역합니다."},
-                    {"role": "user", "content": prompt}
-                ],
-                max_tokens=self.config["max_tokens"],
-                temperature=self.config["temperature"]
-            )
-            
-            translated_text = response.choices[0].message.content.strip()
-            
-            return TranslationResult(
-                original_text=request.text,
-                translated_text=translated_text,
-                source_language=request.source_language,
-                target_language=request.target_language,
-                model=self.config["model"]
+    def _build_translation_messages(self, request: TranslationRequest) -> list:
+        """번역 요청 메시지 생성 (고정 system 접두부 + 가변 user 메시지)"""
+        # 언어 코드를 언어명으로 변환
+        lang_names = Settings.SUPPORTED_LANGUAGES
+        target_lang_name = lang_names.get(request.target_language.value, request.target_language.value)
+        source_lang_name = lang_names.get(request.source_language.value, request.source_language.value) if request.source_language != Language.AUTO else '자동 감지'
+        
+        variables = {
+            "target_language": request.target_language.value,
+            "target_language_name": target_lang_name,
+            "source_language_name": source_lang_name,
+            "text": request.text
+        }
+        if request.reference_translations:
+            variables["references"] = "\n\n".join(
+                f"[참고 원문 {i}]\n{source}\n[참고 번역 {i}]\n{translation}"
+                for i, (source, translation) in enumerate(request.reference_translations, start=1)
             )
-            
-        except Exception as e:
-            raise Exception(f"번역 중 오류가 발생했습니다: {str(e)}")
+        return prompt_registry.get(self._translation_template_name(request)).render(**variables)
     
-    def summarize_text(self, request: SummaryRequest) -> SummaryResult:
-        """텍스트 요약"""
+    def _translation_kwargs(self, request: TranslationRequest) -> dict:
+        """번역 chat.completions.create 파라미터"""
+        return {
+            "model": self.config["model"],
+            "messages": self._build_translation_messages(request),
+            "max_tokens": self.config["max_tokens"],
+            "temperature": self.config["temperature"]
+        }
+    
+    def _summary_kwargs(self, request: SummaryRequest) -> dict:
+        """요약 chat.completions.create 파라미터"""
+        return {
+            "model": self.config["model"],
+            "messages": self._build_summary_messages(request),
+            "max_tokens": self.SUMMARY_MAX_TOKENS,
+            "temperature": self.config["temperature"]
+        }
+    
+    @contextmanager
+    def _api_call(self, action: str) -> Iterator[None]:
+        """OpenAI API 호출 구간 (프로파일 단계 기록, 오류는 작업명을 붙여 다시 발생)"""
         try:
-            # 요약 방법에 따른 프롬프트 설정
-            if request.method == SummaryMethod.GPT_BRIEF:
-                prompt = f"다음 텍스트를 {request.sentences_count}문장으로 간단히 요약해주세요. 핵심 내용만 포함하여 요약해주세요:\n\n{request.text}"
-            else:  # GPT_DETAILED
-                prompt = f"다음 텍스트를 {request.sentences_count}문장으로 상세하고 정확하게 요약해주세요. 중요한 정보와 맥락을 모두 포함하여 요약해주세요:\n\n{request.text}"
-            
-            # OpenAI API 호출
-            response = self.client.chat.completions.create(
-                model=self.config["model"],
-                messages=[
-                    {"role": "system", "content": "당신은 전문 요약가입니다. 주어진 텍스트를 요청된 문장 수로 정확하고 명확하게 요약합니다."},
-                    {"role": "user", "content": prompt}
-                ],
-                max_tokens=1000,
-                temperature=self.config["temperature"]
-            )
-            
-            summary_text = response.choices[0].message.content.strip()
-            
-            return SummaryResult(
-                original_text=request.text,
-                summary=summary_text,
-                method=request.method,
-                sentences_count=request.sentences_count,
-                original_length=len(request.text.split()),
-                summary_length=len(summary_text.split()),
-                model=self.config["model"]
-            )
-            
+            with profile_stage("openai"):
+                yield
         except Exception as e:
-            raise Exception(f"요약 중 오류가 발생했습니다: {str(e)}")
+            raise Exception(f"{action} 중 오류가 발생했습니다: {str(e)}")
+    
+    def _translation_template_name(self, request: TranslationRequest) -> str:
+        """번역 요청에 사용할 프롬프트 템플릿 이름"""
+        return "translation_reference" if request.reference_translations else "translation"
+    
+    def translation_checkpoint_params(self, request: TranslationRequest) -> dict:
+        """번역 결과에 영향을 주는 파라미터 (체크포인트 키용, 템플릿 버전과 모델 포함)"""
+        return {
+            "template": prompt_registry.get(self._translation_template_name(request)).key,
+            "model": self.config["model"],
+            "temperature": self.config.get("temperature"),
+            "source_language": request.source_language.value,
+            "target_language": request.target_language.value,
+            "references": request.reference_translations or []
+        }
+    
+    def summary_checkpoint_params(self, request: SummaryRequest) -> dict:
+        """요약 결과에 영향을 주는 파라미터 (체크포인트 키용, 템플릿 버전과 모델 포함)"""
+        return {
+            "template": prompt_registry.get("summary").key,
+            "model": self.config["model"],
+            "temperature": self.config.get("temperature"),
+            "method": request.method.value,
+            "sentences_count": request.sentences_count
+        }
+    
+    def _build_translation_result(self, request: TranslationRequest, response) -> TranslationResult:
+        """번역 응답을 결과 모델로 변환"""
+        translated_text = response.choices[0].message.content.strip()
+        
+        return TranslationResult(
+            original_text=request.text,
+            translated_text=translated_text,
+            source_language=request.source_language,
+            target_language=request.target_language,
+            model=self.config["model"],
+            usage=self._record_usage(self._translation_template_name(request), response)
+        )
+    
+    def _build_summary_messages(self, request: SummaryRequest) -> list:
+        """요약 요청 메시지 생성 (고정 system 접두부 + 가변 user 메시지)"""
+        # 요약 방법에 따른 방식 설명
+        if request.method == SummaryMethod.GPT_BRIEF:
+            style = "간단 요약 - 핵심 내용만 포함"
+        else:  # GPT_DETAILED
+            style = "상세 요약 - 중요한 정보와 맥락을 모두 포함"
+        
+        return prompt_registry.get("summary").render(
+            style=style,
+            sentences_count=request.sentences_count,
+            text=request.text
+        )
+    
+    def _build_summary_result(self, request: SummaryRequest, response) -> SummaryResult:
+        """요약 응답을 결과 모델로 변환"""
+        summary_text = response.choices[0].message.content.strip()
+        
+        return SummaryResult(
+            original_text=request.text,
+            summary=summary_text,
+            method=request.method,
+            sentences_count=request.sentences_count,
+            original_length=len(request.text.split()),
+            summary_length=len(summary_text.split()),
+            model=self.config["model"],
+            usage=self._record_usage("summary", response)
+        )
+    
+    def _record_usage(self, template_name: str, response) -> Optional[dict]:
+        """응답의 토큰 사용량(캐시된 프롬프트 토큰 포함) 기록"""
+        usage = getattr(response, "usage", None)
+        if usage is None:
+            return None
+        return prompt_registry.record_usage(prompt_registry.get(template_name), usage)
+    
+    def get_prompt_cache_stats(self) -> dict:
+        """프롬프트 템플릿별 토큰 사용량 및 캐시 적중률 반환"""
+        return prompt_registry.usage_stats()
     
     def get_supported_languages(self) -> dict:
         """지원하는 언어 목록 반환"""
         return Settings.SUPPORTED_LANGUAGES
     
-    def get_summary_methods(self) -> dict:
+    @staticmethod
+    def get_summary_methods() -> dict:
         """지원하는 요약 방법 반환"""
         return {
             "gpt": "GPT 기반 상세 요약 - 맥락과 세부사항 포함",
             "brief": "GPT 기반 간단 요약 - 핵심 내용만"
         }
+
+class OpenAIService(OpenAIServiceBase):
+    """OpenAI API 서비스 클래스 (동기)"""
+    
+    def __init__(self):
+        """OpenAI 클라이언트 초기화"""
+        super().__init__()
+        self.client = OpenAI(
+            api_key=Settings.OPENAI_API_KEY,
+            max_retries=Settings.OPENAI_MAX_RETRIES,
+            timeout=httpx.Timeout(Settings.OPENAI_TIMEOUT, connect=5.0)
+        )
+    
+    def translate_text(self, request: TranslationRequest) -> TranslationResult:
+        """텍스트 번역"""
+        with self._api_call("번역"):
+            response = self.client.chat.completions.create(**self._translation_kwargs(request))
+            return self._build_translation_result(request, response)
+    
+    def summarize_text(self, request: SummaryRequest) -> SummaryResult:
+        """텍스트 요약"""
+        with self._api_call("요약"):
+            response = self.client.chat.completions.create(**self._summary_kwargs(request))
+            return self._build_summary_result(request, response)
+
+class AsyncOpenAIService(OpenAIServiceBase):
+    """OpenAI API 서비스 클래스 (비동기, 하나의 워커에서 다수의 호출을 동시에 처리)"""
+    
+    def __init__(self):
+        """AsyncOpenAI 클라이언트 초기화"""
+        super().__init__()
+        self.client = AsyncOpenAI(
+            api_key=Settings.OPENAI_API_KEY,
+            max_retries=Settings.OPENAI_MAX_RETRIES,
+            http_client=httpx.AsyncClient(
+                limits=httpx.Limits(
+                    max_connections=Settings.OPENAI_MAX_CONNECTIONS,
+                    max_keepalive_connections=Settings.OPENAI_MAX_KEEPALIVE_CONNECTIONS
+                ),
+                timeout=httpx.Timeout(Settings.OPENAI_TIMEOUT, connect=5.0)
+            )
+        )
+    
+    async def translate_text(self, request: TranslationRequest) -> TranslationResult:
+        """텍스트 번역"""
+        with self._api_call("번역"):
+            response = await self.client.chat.completions.create(**self._translation_kwargs(request))
+            return self._build_translation_result(request, response)
+    
+    async def summarize_text(self, request: SummaryRequest) -> SummaryResult:
+        """텍스트 요약"""
+        with self._api_call("요약"):
+            response = await self.client.chat.completions.create(**self._summary_kwargs(request))
+            return self._build_summary_result(request, response)
+    
+    async def close(self) -> None:
+        """HTTP 연결 풀 정리"""
+        await self.client.close()
@@ -0,0 +1,120 @@
+import logging
+import os
+import random
+import sys
+import threading
+import time
+import uuid
+from collections import Counter
+from contextlib import contextmanager
+from typing import Dict, Iterator, List, Optional
+from config.settings import Settings
+
+# 스레드 ID -> 실행 중인 프로파일러 (프로파일링 중인 요청만 등록)
+_active_profilers: Dict[int, "RequestProfiler"] = {}
+
+
+class RequestProfiler:
+    """샘플링 방식 요청 프로파일러 클래스
+
+    별도 스레드가 일정 간격으로 요청 스레드의 호출 스택을 수집하고,
+    flamegraph.pl / speedscope에서 읽을 수 있는 folded stack 형식으로 저장합니다.
+    각 스택 앞에는 route와 단계(stage) 레이블이 붙습니다.
+    """
+
+    def __init__(self, route: str, interval: Optional[float] = None):
+        """프로파일러 초기화 (샘플링 간격은 초 단위)"""
+        self.route = route
+        self.interval = interval or Settings.PROFILE_INTERVAL_MS / 1000.0
+        self.profile_id = uuid.uuid4().hex[:12]
+        self.thread_id = threading.get_ident()
+        self.stages: List[str] = []
+        self.samples: Counter = Counter()
+        self.started = 0.0
+        self.elapsed = 0.0
+        self._stop = threading.Event()
+        self._sampler: Optional[threading.Thread] = None
+
+    def start(self) -> None:
+        """샘플링 시작"""
+        self.started = time.perf_counter()
+        _active_profilers[self.thread_id] = self
+        self._sampler = threading.Thread(target=self._run, name=f"profiler-{self.profile_id}", daemon=True)
+        self._sampler.start()
+
+    def stop(self) -> None:
+        """샘플링 종료"""
+        self._stop.set()
+        if self._sampler is not None:
+            self._sampler.join()
+        _active_profilers.pop(self.thread_id, None)
+        self.elapsed = time.perf_counter() - self.started
+
+    def _run(self) -> None:
+        """샘플링 루프"""
+        while not self._stop.wait(self.interval):
+            frame = sys._current_frames().get(self.thread_id)
+            if frame is None:
+                continue
+            stack = []
+            while frame is not None:
+                code = frame.f_code
+                stack.append(f"{code.co_name} ({os.path.basename(code.co_filename)}:{frame.f_lineno})")
+                frame = frame.f_back
+            stack.reverse()
+            labels = [f"route:{self.route}"] + [f"stage:{stage}" for stage in self.stages]
+            self.samples[";".join(labels + stack)] += 1
+
+    def save(self) -> str:
+        """folded stack 파일로 저장하고 경로 반환"""
+        os.makedirs(Settings.PROFILE_OUTPUT_DIR, exist_ok=True)
+        timestamp = time.strftime("%Y%m%d-%H%M%S")
+        path = os.path.join(Settings.PROFILE_OUTPUT_DIR, f"{timestamp}_{self.route}_{self.profile_id}.folded")
+        with open(path, "w", encoding="utf-8") as f:
+            for stack, count in self.samples.most_common():
+                f.write(f"{stack} {count}\n")
+        return path
+
+
+def should_profile(headers=None) -> bool:
+    """요청 헤더 또는 샘플링 비율에 따라 프로파일링 여부 결정"""
+    token = Settings.PROFILE_HEADER_TOKEN
+    if token and headers is not None and headers.get("X-Profile") == token:
+        return True
+    rate = Settings.PROFILE_SAMPLE_RATE
+    return rate > 0 and random.random() < rate
+
+
+@contextmanager
+def profile_request(route: str, headers=None) -> Iterator[Optional[RequestProfiler]]:
+    """요청 처리 전체를 프로파일링 (대상이 아니면 아무 작업도 하지 않음)"""
+    if not should_profile(headers):
+        yield None
+        return
+
+    profiler = RequestProfiler(route)
+    profiler.start()
+    try:
+        yield profiler
+    finally:
+        profiler.stop()
+        try:
+            path = profiler.save()
+            logging.info(f"Profile saved: route={route} elapsed={profiler.elapsed * 1000:.1f}ms path={path}")
+        except OSError as e:
+            logging.error(f"Profile save failed: {str(e)}")
+
+
+@contextmanager
+def profile_stage(name: str) -> Iterator[None]:
+    """현재 요청이 프로파일링 중이면 단계 레이블 추가"""
+    profiler = _active_profilers.get(threading.get_ident()) if _active_profilers else None
+    if profiler is None:
+        yield
+        return
+
+    profiler.stages.append(name)
+    try:
+        yield
+    finally:
+        profiler.stages.pop()
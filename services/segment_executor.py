@@ -0,0 +1,41 @@
+import asyncio
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable, Coroutine, TypeVar
+
+T = TypeVar("T")
+
+
+@dataclass
+class SegmentExecutor:
+    """구간 계획 실행 방식 (LLM 호출 함수와 체크포인트 저장소 같은 블로킹 입출력 실행 방식)
+
+    구간 반복 로직은 코루틴 하나로 작성하고, 동기 경로는 sync(), 비동기 경로는 threaded()로
+    만든 실행기를 넘깁니다. 동기 경로는 run_sync()로 호출한 스레드에서 코루틴을 끝까지 실행합니다.
+    """
+    call: Callable[[Any], Awaitable[Any]]
+    run_blocking: Callable[..., Awaitable[Any]]
+
+    @classmethod
+    def sync(cls, call: Callable[[Any], Any]) -> 'SegmentExecutor':
+        """호출한 스레드에서 바로 실행하는 실행기"""
+        async def call_now(request: Any) -> Any:
+            return call(request)
+
+        async def run_now(func: Callable[..., Any], *args: Any) -> Any:
+            return func(*args)
+
+        return cls(call_now, run_now)
+
+    @classmethod
+    def threaded(cls, call: Callable[[Any], Awaitable[Any]]) -> 'SegmentExecutor':
+        """비동기 LLM 호출과 스레드에서 실행하는 블로킹 입출력을 사용하는 실행기"""
+        return cls(call, asyncio.to_thread)
+
+
+def run_sync(coroutine: Coroutine[Any, Any, T]) -> T:
+    """구간 계획 코루틴을 호출한 스레드의 새 이벤트 루프에서 끝까지 실행
+
+    동기 실행기만 사용하면 코루틴이 중간에 대기하지 않지만, 계획 안에서 실제로 대기하는 작업이 있어도
+    이벤트 루프가 처리하므로 멈추지 않습니다. 이벤트 루프가 실행 중인 스레드에서는 호출할 수 없습니다.
+    """
+    return asyncio.run(coroutine)
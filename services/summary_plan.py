@@ -0,0 +1,82 @@
+from dataclasses import replace
+from typing import Any, Dict, List, Optional, Tuple
+from config.settings import Settings
+from models.summary import SummaryRequest, SummaryResult
+from services.text_segmenter import split_paragraphs, join_paragraphs, group_segments
+from services.token_estimator import estimate_tokens
+
+
+class SummaryPlan:
+    """긴 문서 요약 계획 클래스 (구간별로 요약한 뒤 구간 요약을 모아 다시 요약)
+
+    구간 토큰 예산 이하의 텍스트, 그리고 체크포인트를 끈 경우(CHECKPOINT_ENABLED=false)에는
+    구간을 나누지 않고 기존처럼 한 번에 요약합니다.
+    """
+
+    def __init__(self, request: SummaryRequest, segment_tokens: Optional[int] = None):
+        """요청 텍스트를 구간으로 분할"""
+        self.request = request
+        self.segment_tokens = segment_tokens or Settings.SUMMARY_SEGMENT_TOKENS
+        if Settings.CHECKPOINT_ENABLED and estimate_tokens(request.text) > self.segment_tokens:
+            self.segments = group_segments(split_paragraphs(request.text), self.segment_tokens)
+        else:
+            self.segments = [[request.text]]
+        self.partials: List[Optional[str]] = [None] * len(self.segments)
+        self.reused_segments = 0
+        self._results: List[SummaryResult] = []
+
+    @property
+    def segmented(self) -> bool:
+        """구간별 요약이 필요한지 여부"""
+        return len(self.segments) > 1
+
+    def pending_requests(self) -> List[Tuple[int, SummaryRequest]]:
+        """구간별 요약 요청 목록 (구간 번호, 요청)"""
+        return [
+            (index, replace(self.request, text=join_paragraphs(segment), prereduce=False))
+            for index, segment in enumerate(self.segments)
+            if self.partials[index] is None
+        ]
+
+    def complete(self, index: int, result: SummaryResult, reused: bool = False) -> None:
+        """구간 요약 결과 반영 (reused는 체크포인트에서 복원한 결과)"""
+        self.partials[index] = result.summary
+        self._record(result, reused)
+
+    def reduce_request(self) -> SummaryRequest:
+        """구간 요약을 모아 최종 요약할 요청"""
+        if any(partial is None for partial in self.partials):
+            raise ValueError("요약되지 않은 구간이 남아 있습니다.")
+        return replace(self.request, text=join_paragraphs(self.partials), prereduce=False)
+
+    def build_result(self, final: SummaryResult, reused: bool = False) -> SummaryResult:
+        """최종 요약 결과에 원문 기준 정보와 구간 처리 통계 반영"""
+        self._record(final, reused)
+        return replace(
+            final,
+            original_text=self.request.text,
+            original_length=len(self.request.text.split()),
+            usage=self._merged_usage(),
+            checkpoint={
+                "segments": len(self.segments) + 1,  # 구간 요약 + 최종 요약
+                "reused": self.reused_segments,
+                "processed": len(self._results)
+            }
+        )
+
+    def _record(self, result: SummaryResult, reused: bool) -> None:
+        """호출 결과 기록"""
+        if reused:
+            self.reused_segments += 1
+        else:
+            self._results.append(result)
+
+    def _merged_usage(self) -> Optional[Dict[str, Any]]:
+        """이번 요청에서 호출한 구간의 토큰 사용량 합계 (체크포인트에서 복원한 구간 제외)"""
+        usages = [result.usage for result in self._results if result.usage]
+        if not usages:
+            return None
+        merged = {"prompt_template": usages[-1].get("prompt_template")}
+        for name in ("prompt_tokens", "cached_tokens", "completion_tokens"):
+            merged[name] = sum(usage.get(name, 0) for usage in usages)
+        return merged
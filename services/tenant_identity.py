@@ -0,0 +1,91 @@
+import hashlib
+import hmac
+import threading
+from typing import Dict, Mapping, Optional
+import jwt
+from config.settings import Settings
+
+GOOGLE_CERTS_URL = "https://www.googleapis.com/oauth2/v3/certs"
+GOOGLE_ISSUERS = ["accounts.google.com", "https://accounts.google.com"]
+# 자격 증명이 없거나 검증되지 않은 요청의 테넌트 ID 접두사 (같은 IP의 여러 사용자가 공유)
+ANONYMOUS_PREFIX = "ip:"
+
+
+def is_verified_tenant(tenant_id: Optional[str]) -> bool:
+    """검증된 자격 증명(API 키, Google ID 토큰)으로 식별한 테넌트인지 여부"""
+    return bool(tenant_id) and not tenant_id.startswith(ANONYMOUS_PREFIX)
+
+
+class TenantResolver:
+    """요청 자격 증명을 검증하여 안정적인 테넌트 ID로 변환하는 클래스
+
+    API 키는 설정된 키의 SHA-256 해시와 비교하여 등록된 테넌트 이름으로, Bearer JWT는
+    Google ID 토큰(서명, audience, 발급자, 만료)으로 검증하여 "google:<sub>"로 변환합니다.
+    검증되지 않은 자격 증명은 무시하고 클라이언트 IP 테넌트로 처리하므로, 요청마다 임의의
+    키를 보내도 새 테넌트(새 할당량, 앞선 종료 태그)가 생기지 않습니다.
+    """
+
+    def __init__(self, api_keys: Optional[Dict[str, str]] = None, google_client_id: Optional[str] = None):
+        """등록된 API 키 해시와 Google 클라이언트 ID 설정"""
+        self.api_keys = {digest.lower(): tenant_id for digest, tenant_id in
+                         (api_keys if api_keys is not None else Settings.TENANT_API_KEYS).items()}
+        self.google_client_id = google_client_id if google_client_id is not None else Settings.GOOGLE_CLIENT_ID
+        self._jwk_client: Optional[jwt.PyJWKClient] = None
+        self._lock = threading.Lock()
+
+    def resolve(self, api_key: Optional[str], bearer: Optional[str], client_host: Optional[str]) -> str:
+        """테넌트 ID 반환 (API 키 > Bearer 토큰 > 클라이언트 IP)
+
+        Google 공개 키를 처음 한 번 내려받을 수 있으므로 이벤트 루프 밖에서 호출합니다.
+        """
+        for credential in (api_key, bearer):
+            tenant_id = self._from_api_key(credential) if credential else None
+            if tenant_id:
+                return tenant_id
+        if bearer and bearer.count(".") == 2:
+            tenant_id = self._from_google_token(bearer)
+            if tenant_id:
+                return tenant_id
+        return ANONYMOUS_PREFIX + (client_host or "unknown")
+
+    def resolve_headers(self, headers: Mapping[str, str], client_host: Optional[str]) -> str:
+        """요청 헤더(X-API-Key, Authorization: Bearer)로 테넌트 ID 반환"""
+        authorization = headers.get("authorization") or ""
+        bearer = authorization[7:].strip() if authorization.lower().startswith("bearer ") else None
+        return self.resolve(headers.get("x-api-key"), bearer, client_host)
+
+    def _from_api_key(self, key: str) -> Optional[str]:
+        """등록된 API 키의 테넌트 이름 (해시 비교)"""
+        digest = hashlib.sha256(key.encode('utf-8')).hexdigest()
+        for registered, tenant_id in self.api_keys.items():
+            if hmac.compare_digest(registered, digest):
+                return tenant_id
+        return None
+
+    def _from_google_token(self, token: str) -> Optional[str]:
+        """Google ID 토큰 검증 후 사용자 ID (검증 실패 시 None)"""
+        if not self.google_client_id:
+            return None
+        try:
+            signing_key = self._jwks().get_signing_key_from_jwt(token)
+            payload = jwt.decode(
+                token, signing_key.key, algorithms=["RS256"],
+                audience=self.google_client_id, options={"require": ["exp", "iss", "sub"]}
+            )
+        except (jwt.PyJWTError, ValueError):
+            return None
+        # PyJWT 2.8은 발급자 목록을 지원하지 않으므로 직접 비교
+        if payload["iss"] not in GOOGLE_ISSUERS:
+            return None
+        return "google:" + str(payload["sub"])
+
+    def _jwks(self) -> jwt.PyJWKClient:
+        """Google 공개 키 클라이언트 (키 목록은 캐시)"""
+        with self._lock:
+            if self._jwk_client is None:
+                self._jwk_client = jwt.PyJWKClient(GOOGLE_CERTS_URL, cache_keys=True, lifespan=3600)
+            return self._jwk_client
+
+
+# 전역 테넌트 식별기 (프로세스 단위, Google 공개 키 캐시 공유)
+tenant_resolver = TenantResolver()
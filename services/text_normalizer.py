@@ -0,0 +1,214 @@
+import re
+import time
+from collections import Counter
+from dataclasses import dataclass
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Set, Tuple
+from config.settings import Settings
+from services.token_estimator import estimate_tokens
+
+# 쪽 번호만 있는 줄: "3", "- 3 -", "Page 3", "Page 3 of 10", "3 / 10", "3쪽", "p. 3"
+PAGE_NUMBER_PATTERN = re.compile(
+    r'^\s*(?:[-–—]\s*)?(?:page\s*|p\.\s*)?\d{1,4}(?:\s*(?:/|of)\s*\d{1,4})?(?:\s*(?:쪽|페이지|頁|页))?(?:\s*[-–—])?\s*$',
+    re.IGNORECASE
+)
+LIST_ITEM_PATTERN = re.compile(r'^\s*(?:[-•·▪●○■□*]|\d{1,3}[.)]|[a-zA-Z][.)]|[가-힣][.)]|\(\d{1,3}\))\s+')
+SENTENCE_END_PATTERN = re.compile(r'[.!?。！？:：]["\'”’)\]]*$')
+HYPHENATED_END_PATTERN = re.compile(r'[A-Za-zÀ-ÿА-я]-$')
+SPACES_PATTERN = re.compile(r'[ \u00a0\u3000]+')
+TABS_PATTERN = re.compile(r'\s*\t\s*')
+DIGITS_PATTERN = re.compile(r'\d+')
+# 머리글/바닥글로 볼 수 있는 최대 길이, 숫자를 무시하고 비교할 짧은 줄의 최대 길이
+BOILERPLATE_MAX_CHARS = 100
+COUNTER_LINE_MAX_CHARS = 40
+# 공백 없이 이어 쓰는 문자 (한자, 가나)
+CJK_PATTERN = re.compile(r'[\u3040-\u30ff\u3400-\u4dbf\u4e00-\u9fff]')
+
+
+@dataclass
+class NormalizationStats:
+    """정규화 통계"""
+    pages: int = 0
+    original_chars: int = 0
+    normalized_chars: int = 0
+    original_tokens: int = 0
+    normalized_tokens: int = 0
+    boilerplate_lines_removed: int = 0
+    elapsed_ms: float = 0.0
+
+    def to_dict(self) -> Dict[str, Any]:
+        """딕셔너리로 변환"""
+        return {
+            "pages": self.pages,
+            "original_chars": self.original_chars,
+            "normalized_chars": self.normalized_chars,
+            "original_tokens": self.original_tokens,
+            "normalized_tokens": self.normalized_tokens,
+            "tokens_saved": self.original_tokens - self.normalized_tokens,
+            "boilerplate_lines_removed": self.boilerplate_lines_removed,
+            "elapsed_ms": round(self.elapsed_ms, 2)
+        }
+
+
+class TextNormalizer:
+    """추출 텍스트 정규화 클래스 (줄 재배치, 하이픈 복원, 공백 정리, 반복 머리글/바닥글 제거)
+
+    페이지 단위로 스트리밍 처리합니다. 반복되는 머리글과 바닥글은 앞쪽 일부 페이지만
+    버퍼링하여 학습하고, 이후 페이지는 들어오는 대로 정규화하여 내보냅니다. 숫자만 있는
+    가장자리 줄(쪽 번호)은 연도나 금액일 수도 있으므로 page_numbers를 켠 여러 페이지 문서에서만 제거합니다.
+    """
+
+    def __init__(self, sample_pages: Optional[int] = None, edge_lines: Optional[int] = None,
+                 min_ratio: Optional[float] = None):
+        """머리글/바닥글 학습 페이지 수, 페이지 위아래 검사 줄 수, 반복 비율 기준 설정"""
+        self.sample_pages = sample_pages or Settings.NORMALIZE_BOILERPLATE_SAMPLE_PAGES
+        self.edge_lines = edge_lines or Settings.NORMALIZE_BOILERPLATE_EDGE_LINES
+        self.min_ratio = min_ratio or Settings.NORMALIZE_BOILERPLATE_MIN_RATIO
+
+    def normalize_text(self, text: str, reflow: bool = True) -> Tuple[str, Dict[str, Any]]:
+        """텍스트 정규화 (폼 피드 문자로 페이지 구분, 숫자만 있는 줄은 유지)"""
+        return self.normalize_pages(text.split("\f"), reflow)
+
+    def normalize_pages(self, pages: Iterable[str], reflow: bool = True,
+                        page_numbers: bool = False) -> Tuple[str, Dict[str, Any]]:
+        """페이지 목록을 정규화하여 하나의 텍스트와 통계 반환"""
+        stats = NormalizationStats()
+        text = "\n\n".join(page for page in self.iter_normalized(pages, stats, reflow, page_numbers) if page)
+        return text, stats.to_dict()
+
+    def iter_normalized(self, pages: Iterable[str], stats: NormalizationStats,
+                        reflow: bool = True, page_numbers: bool = False) -> Iterator[str]:
+        """페이지를 정규화하여 순서대로 반환 (통계는 stats에 누적)
+
+        page_numbers가 켜져 있고 페이지가 두 개 이상일 때만 쪽 번호 줄을 제거합니다.
+        """
+        started = time.perf_counter()
+        page_iter = iter(pages)
+
+        # 앞쪽 페이지를 버퍼링하여 반복되는 머리글/바닥글 학습 (여러 페이지인지 알 수 있도록 최소 두 페이지)
+        buffered: List[List[str]] = []
+        for page in page_iter:
+            self._count_original(page, stats)
+            buffered.append(page.splitlines())
+            if len(buffered) >= max(2, self.sample_pages):
+                break
+        boilerplate = self._detect_boilerplate(buffered)
+        page_numbers = page_numbers and len(buffered) > 1
+
+        for lines in buffered:
+            yield self._emit(lines, boilerplate, stats, reflow, page_numbers)
+        buffered = []
+
+        for page in page_iter:
+            self._count_original(page, stats)
+            yield self._emit(page.splitlines(), boilerplate, stats, reflow, page_numbers)
+
+        stats.elapsed_ms = (time.perf_counter() - started) * 1000
+
+    def _count_original(self, page: str, stats: NormalizationStats) -> None:
+        """원본 페이지 통계 누적"""
+        stats.pages += 1
+        stats.original_chars += len(page)
+        stats.original_tokens += estimate_tokens(page)
+
+    def _emit(self, lines: List[str], boilerplate: Set[str], stats: NormalizationStats, reflow: bool,
+              page_numbers: bool) -> str:
+        """페이지 하나를 정규화하고 통계 누적"""
+        lines = self._strip_boilerplate(lines, boilerplate, stats, page_numbers)
+        lines = [self._collapse_whitespace(line) for line in lines]
+        text = self._reflow(lines) if reflow else "\n".join(line for line in lines if line)
+        stats.normalized_chars += len(text)
+        stats.normalized_tokens += estimate_tokens(text)
+        return text
+
+    def _boilerplate_key(self, line: str) -> Optional[str]:
+        """반복 판정용 키 (긴 줄은 본문으로 보고 제외, 짧은 줄의 숫자는 쪽 번호처럼 바뀌므로 통일)"""
+        key = SPACES_PATTERN.sub(" ", line.strip().lower())
+        if not key or len(key) > BOILERPLATE_MAX_CHARS:
+            return None
+        if len(key) <= COUNTER_LINE_MAX_CHARS:
+            key = DIGITS_PATTERN.sub("#", key)
+        return key
+
+    def _edge_indices(self, lines: List[str]) -> List[int]:
+        """페이지 위아래 가장자리의 비어 있지 않은 줄 번호"""
+        non_empty = [i for i, line in enumerate(lines) if line.strip()]
+        edge = non_empty[:self.edge_lines] + non_empty[-self.edge_lines:]
+        return sorted(set(edge))
+
+    def _detect_boilerplate(self, pages: List[List[str]]) -> Set[str]:
+        """여러 페이지 가장자리에 반복되는 줄 찾기"""
+        if len(pages) < 2:
+            return set()
+
+        counts: Counter = Counter()
+        for lines in pages:
+            counts.update({self._boilerplate_key(lines[i]) for i in self._edge_indices(lines)} - {None})
+
+        threshold = max(2, self.min_ratio * len(pages))
+        return {key for key, count in counts.items() if count >= threshold}
+
+    def _strip_boilerplate(self, lines: List[str], boilerplate: Set[str], stats: NormalizationStats,
+                           page_numbers: bool) -> List[str]:
+        """페이지 가장자리의 쪽 번호(page_numbers일 때만)와 반복 머리글/바닥글 제거"""
+        removed = set()
+        for i in self._edge_indices(lines):
+            line = lines[i]
+            if (page_numbers and PAGE_NUMBER_PATTERN.match(line)) or self._boilerplate_key(line) in boilerplate:
+                removed.add(i)
+        stats.boilerplate_lines_removed += len(removed)
+        return [line for i, line in enumerate(lines) if i not in removed]
+
+    def _collapse_whitespace(self, line: str) -> str:
+        """연속 공백 정리 (표 구분용 탭은 하나로 유지)"""
+        if "\t" in line:
+            return TABS_PATTERN.sub("\t", SPACES_PATTERN.sub(" ", line)).strip(" ")
+        return SPACES_PATTERN.sub(" ", line).strip()
+
+    def _reflow(self, lines: List[str]) -> str:
+        """강제 줄바꿈을 문단 단위로 이어 붙이기 (문단은 빈 줄로, 연속된 표 행과 목록 항목은 줄바꿈으로 구분)"""
+        width = max((len(line) for line in lines), default=0)
+        # (텍스트, 표 행 또는 목록 항목 여부)
+        paragraphs: List[Tuple[str, bool]] = []
+        current = ""
+        current_row = False
+
+        for line in lines:
+            if not line:
+                if current:
+                    paragraphs.append((current, current_row))
+                    current = ""
+                continue
+
+            # 표 행과 목록 항목은 별도 줄로 유지
+            if "\t" in line or LIST_ITEM_PATTERN.match(line):
+                if current:
+                    paragraphs.append((current, current_row))
+                current, current_row = line, True
+                if "\t" in line:
+                    paragraphs.append((current, current_row))
+                    current = ""
+                continue
+
+            if not current:
+                current, current_row = line, False
+            elif HYPHENATED_END_PATTERN.search(current[-2:]) and line[0].islower():
+                # 줄 끝에서 하이픈으로 나뉜 단어 복원
+                current = current[:-1] + line
+            elif CJK_PATTERN.match(current[-1]) and CJK_PATTERN.match(line[0]):
+                current += line
+            else:
+                current += " " + line
+
+            # 짧게 끝나는 문장 줄은 문단의 마지막 줄로 판단
+            if len(line) < width * 0.6 and SENTENCE_END_PATTERN.search(line[-8:]):
+                paragraphs.append((current, current_row))
+                current = ""
+
+        if current:
+            paragraphs.append((current, current_row))
+        parts: List[str] = []
+        for i, (text, row) in enumerate(paragraphs):
+            if i:
+                parts.append("\n" if row and paragraphs[i - 1][1] else "\n\n")
+            parts.append(text)
+        return "".join(parts)
@@ -0,0 +1,36 @@
+import re
+from typing import List
+from services.token_estimator import estimate_tokens
+
+# 문단 경계: 빈 줄 (공백만 있는 줄 포함)
+PARAGRAPH_SPLIT_PATTERN = re.compile(r'\n[ \t\r\f\v]*\n+')
+WHITESPACE_PATTERN = re.compile(r'\s+')
+
+
+def split_paragraphs(text: str) -> List[str]:
+    """텍스트를 빈 줄 기준 문단 목록으로 분리 (빈 문단 제외, 문단 안의 줄바꿈은 유지)"""
+    return [p.strip() for p in PARAGRAPH_SPLIT_PATTERN.split(text) if p.strip()]
+
+
+def join_paragraphs(paragraphs: List[str]) -> str:
+    """문단 목록을 빈 줄로 연결"""
+    return "\n\n".join(paragraphs)
+
+
+def group_segments(paragraphs: List[str], token_budget: int) -> List[List[str]]:
+    """연속된 문단을 토큰 예산 이내의 구간으로 묶음 (예산보다 긴 문단은 단독 구간)"""
+    segments: List[List[str]] = []
+    used = 0
+    for paragraph in paragraphs:
+        tokens = estimate_tokens(paragraph)
+        if not segments or used + tokens > token_budget:
+            segments.append([])
+            used = 0
+        segments[-1].append(paragraph)
+        used += tokens
+    return segments
+
+
+def paragraph_key(paragraph: str) -> str:
+    """공백 차이를 무시한 문단 비교 키"""
+    return WHITESPACE_PATTERN.sub(' ', paragraph).strip()
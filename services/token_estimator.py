@@ -0,0 +1,27 @@
+try:
+    import tiktoken
+except ImportError:  # tiktoken은 선택 의존성
+    tiktoken = None
+
+_encoding = None
+
+
+def estimate_tokens(text: str) -> int:
+    """텍스트의 토큰 수 추정 (tiktoken이 없으면 문자 기반 근사치)"""
+    global _encoding
+    if not text:
+        return 0
+
+    if tiktoken is not None and _encoding is not False:
+        if _encoding is None:
+            try:
+                _encoding = tiktoken.get_encoding("o200k_base")
+            except Exception:
+                # 인코딩 파일을 받을 수 없는 환경이면 근사치 사용
+                _encoding = False
+        if _encoding:
+            return len(_encoding.encode(text, disallowed_special=()))
+
+    # ASCII는 약 4자당 1토큰, 한글 등 비ASCII 문자는 약 1자당 1토큰
+    ascii_chars = len(text.encode('ascii', 'ignore'))
+    return ascii_chars // 4 + (len(text) - ascii_chars) + 1
@@ -0,0 +1,397 @@
+import re
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional, Tuple
+import numpy as np
+from config.settings import Settings
+from models.translation import TranslationRequest, TranslationResult
+from services.text_segmenter import split_paragraphs, join_paragraphs, paragraph_key
+from services.token_estimator import estimate_tokens
+
+# 지문 계산 전 정규화: 숫자는 모두 0으로 바꿔 날짜/금액만 다른 문단을 같은 문단으로 취급
+DIGIT_PATTERN = re.compile(r'\d')
+WHITESPACE_PATTERN = re.compile(r'\s+')
+# 문단별 번역 쌍의 대응 검사: 숫자 묶음(천 단위 구분 기호 제외), 문단 경계 위치(누적 길이 비율)의 허용 차이
+NUMBER_PATTERN = re.compile(r'\d+(?:[.,]\d+)*')
+ALIGNMENT_MAX_DRIFT = 0.15
+SHINGLE_SIZE = 4  # 문자 4-gram (띄어쓰기가 적은 한국어/중국어/일본어에도 적용 가능)
+NUM_PERMUTATIONS = 64
+LSH_BANDS = 16  # 밴드당 4개 값: 유사도 0.7 이상은 약 99%, 0.3 이하는 약 12%만 후보가 됨
+LSH_ROWS = NUM_PERMUTATIONS // LSH_BANDS
+
+_rng = np.random.default_rng(20240101)
+_PERMUTATION_A = _rng.integers(1, 2 ** 63, NUM_PERMUTATIONS, dtype=np.uint64) | np.uint64(1)
+_PERMUTATION_B = _rng.integers(0, 2 ** 63, NUM_PERMUTATIONS, dtype=np.uint64)
+
+
+def _mix64(values: np.ndarray) -> np.ndarray:
+    """64비트 정수 해시 혼합 (splitmix64 마무리 단계)"""
+    values = (values ^ (values >> np.uint64(30))) * np.uint64(0xbf58476d1ce4e5b9)
+    values = (values ^ (values >> np.uint64(27))) * np.uint64(0x94d049bb133111eb)
+    return values ^ (values >> np.uint64(31))
+
+
+def minhash_signature(text: str) -> np.ndarray:
+    """문자 n-gram 집합의 MinHash 서명 계산 (두 서명의 일치 비율 ≈ 자카드 유사도)"""
+    normalized = WHITESPACE_PATTERN.sub(' ', DIGIT_PATTERN.sub('0', text.lower())).strip()
+    codes = np.frombuffer(normalized.encode('utf-32-le'), dtype=np.uint32).astype(np.uint64)
+    if len(codes) < SHINGLE_SIZE:
+        codes = np.pad(codes, (0, SHINGLE_SIZE - len(codes)))
+
+    # n-gram 다항식 해시를 벡터 연산으로 계산 (uint64 곱셈은 2^64로 자연스럽게 순환)
+    count = len(codes) - SHINGLE_SIZE + 1
+    shingles = np.zeros(count, dtype=np.uint64)
+    for offset in range(SHINGLE_SIZE):
+        shingles = shingles * np.uint64(0x100000001b3) + codes[offset:offset + count]
+    shingles = _mix64(np.unique(shingles))
+
+    return ((shingles[:, np.newaxis] * _PERMUTATION_A + _PERMUTATION_B) >> np.uint64(32)).min(axis=0)
+
+
+def _numbers(text: str) -> List[str]:
+    """문단 안의 숫자 묶음 (정렬, 천 단위 구분 기호 제거)"""
+    return sorted(number.replace(',', '') for number in NUMBER_PATTERN.findall(text))
+
+
+def paragraphs_aligned(sources: List[str], translations: List[str]) -> bool:
+    """문단별 번역 쌍이 서로 대응하는지 검사
+
+    모델이 문단을 합치고 다른 문단을 나누면 문단 수가 같아도 쌍이 어긋나므로, 문단 수와 함께
+    각 쌍의 숫자가 같은지, 문단 경계가 원문과 번역에서 비슷한 위치(누적 길이 비율)에 있는지 확인합니다.
+    """
+    if len(sources) != len(translations):
+        return False
+    source_total = max(1, sum(map(len, sources)))
+    translation_total = max(1, sum(map(len, translations)))
+    source_position = translation_position = 0
+    for source, translation in zip(sources, translations):
+        if _numbers(source) != _numbers(translation):
+            return False
+        source_position += len(source)
+        translation_position += len(translation)
+        if abs(source_position / source_total - translation_position / translation_total) > ALIGNMENT_MAX_DRIFT:
+            return False
+    return True
+
+
+class MinHashIndex:
+    """밴드 분할 MinHash LSH 근사 중복 색인 클래스
+
+    서명을 LSH_BANDS개 밴드로 나누어 밴드 값별 버킷에 저장하고, 조회 시 한 밴드라도
+    같은 항목만 후보로 삼아 서명 일치 비율(추정 자카드 유사도)을 비교합니다.
+    """
+
+    def __init__(self, min_similarity: float = 0.6):
+        """근사 중복으로 볼 최소 유사도 설정"""
+        self.min_similarity = min_similarity
+        self._buckets: Dict[Tuple[int, bytes], set] = {}
+        self._signatures: Dict[Any, np.ndarray] = {}
+
+    def __len__(self) -> int:
+        return len(self._signatures)
+
+    def add(self, key: Any, signature: np.ndarray) -> None:
+        """서명 추가"""
+        self.remove(key)
+        self._signatures[key] = signature
+        for band_key in self._band_keys(signature):
+            self._buckets.setdefault(band_key, set()).add(key)
+
+    def remove(self, key: Any) -> None:
+        """서명 삭제"""
+        signature = self._signatures.pop(key, None)
+        if signature is None:
+            return
+        for band_key in self._band_keys(signature):
+            bucket = self._buckets.get(band_key)
+            if bucket is not None:
+                bucket.discard(key)
+                if not bucket:
+                    del self._buckets[band_key]
+
+    def query(self, signature: np.ndarray) -> Optional[Tuple[Any, float]]:
+        """가장 유사한 항목의 (키, 추정 유사도) 반환 (최소 유사도 미만이면 None)"""
+        candidates = set()
+        for band_key in self._band_keys(signature):
+            candidates.update(self._buckets.get(band_key, ()))
+
+        best = None
+        for key in candidates:
+            similarity = float(np.count_nonzero(self._signatures[key] == signature)) / NUM_PERMUTATIONS
+            if similarity >= self.min_similarity and (best is None or similarity > best[1]):
+                best = (key, similarity)
+        return best
+
+    def _band_keys(self, signature: np.ndarray) -> List[Tuple[int, bytes]]:
+        """밴드 번호와 밴드 값 목록"""
+        return [(band, signature[band * LSH_ROWS:(band + 1) * LSH_ROWS].tobytes()) for band in range(LSH_BANDS)]
+
+
+@dataclass
+class MemoryMatch:
+    """번역 메모리 조회 결과"""
+    kind: str  # "exact" 또는 "near"
+    source: str
+    translation: str
+    similarity: float = 1.0
+
+
+@dataclass
+class _MemoryEntry:
+    source: str
+    translation: str
+    signature: Optional[np.ndarray]
+
+
+class TranslationMemory:
+    """이전에 번역한 문단을 재사용하는 번역 메모리 클래스 (프로세스 단위, LRU)
+
+    완전히 같은 문단은 저장된 번역을 그대로 반환하고, 날짜/이름 등 일부만 바뀐 문단은
+    MinHash LSH 색인으로 찾아 이전 번역을 모델에 참고 번역으로 전달합니다.
+    항목과 색인은 범위(테넌트)별로 나뉘어 있어 다른 테넌트가 저장한 원문/번역은 조회되지 않습니다.
+    """
+
+    def __init__(self, max_entries: Optional[int] = None, min_similarity: Optional[float] = None,
+                 min_chars: Optional[int] = None):
+        """번역 메모리 초기화"""
+        self.max_entries = max_entries or Settings.TRANSLATION_MEMORY_MAX_ENTRIES
+        self.min_similarity = min_similarity if min_similarity is not None else Settings.TRANSLATION_MEMORY_MIN_SIMILARITY
+        self.min_chars = min_chars if min_chars is not None else Settings.TRANSLATION_MEMORY_MIN_CHARS
+        self._entries: "OrderedDict[Tuple[str, str, str, str], _MemoryEntry]" = OrderedDict()
+        self._indexes: Dict[Tuple[str, str, str], MinHashIndex] = {}
+        self._lock = threading.Lock()
+        self.lookups = 0
+        self.exact_hits = 0
+        self.near_hits = 0
+        self.lookup_seconds = 0.0
+        self.max_lookup_seconds = 0.0
+
+    def lookup(self, paragraph: str, source_language: str, target_language: str,
+               scope: str) -> Optional[MemoryMatch]:
+        """scope(테넌트)에 저장된 문단 조회 (완전 일치 우선, 없으면 근사 중복)"""
+        started = time.perf_counter()
+        key = paragraph_key(paragraph)
+        entry_key = (scope, source_language, target_language, key)
+        match = None
+        with self._lock:
+            entry = self._entries.get(entry_key)
+            if entry is not None:
+                self._entries.move_to_end(entry_key)
+                match = MemoryMatch("exact", entry.source, entry.translation)
+
+        # 서명 계산은 잠금 밖에서 수행
+        signature = self._signature(key) if match is None and entry_key[:3] in self._indexes else None
+        with self._lock:
+            index = self._indexes.get(entry_key[:3])
+            if signature is not None and index is not None:
+                found = index.query(signature)
+                if found is not None:
+                    near = self._entries[found[0]]
+                    match = MemoryMatch("near", near.source, near.translation, round(found[1], 3))
+
+            elapsed = time.perf_counter() - started
+            self.lookups += 1
+            self.lookup_seconds += elapsed
+            self.max_lookup_seconds = max(self.max_lookup_seconds, elapsed)
+            if match is not None:
+                if match.kind == "exact":
+                    self.exact_hits += 1
+                else:
+                    self.near_hits += 1
+        return match
+
+    def store(self, paragraph: str, translation: str, source_language: str, target_language: str,
+              scope: str) -> None:
+        """scope(테넌트)에 문단 번역 저장 (용량을 넘으면 가장 오래 사용하지 않은 항목 삭제)"""
+        key = paragraph_key(paragraph)
+        if not key or not translation.strip():
+            return
+        signature = self._signature(key)
+        entry_key = (scope, source_language, target_language, key)
+        with self._lock:
+            self._entries[entry_key] = _MemoryEntry(paragraph, translation, signature)
+            self._entries.move_to_end(entry_key)
+            if signature is not None:
+                index = self._indexes.setdefault(entry_key[:3], MinHashIndex(self.min_similarity))
+                index.add(entry_key, signature)
+
+            while len(self._entries) > self.max_entries:
+                evicted_key, evicted = self._entries.popitem(last=False)
+                if evicted.signature is not None:
+                    self._remove_signature(evicted_key)
+
+    def stats(self) -> Dict[str, Any]:
+        """조회 지연 시간 및 적중률 통계"""
+        with self._lock:
+            hits = self.exact_hits + self.near_hits
+            return {
+                "entries": len(self._entries),
+                "lookups": self.lookups,
+                "exact_hits": self.exact_hits,
+                "near_hits": self.near_hits,
+                "hit_ratio": round(hits / self.lookups, 4) if self.lookups else 0.0,
+                "exact_hit_ratio": round(self.exact_hits / self.lookups, 4) if self.lookups else 0.0,
+                "avg_lookup_us": round(self.lookup_seconds / self.lookups * 1e6, 1) if self.lookups else 0.0,
+                "max_lookup_us": round(self.max_lookup_seconds * 1e6, 1)
+            }
+
+    def _remove_signature(self, entry_key: Tuple[str, str, str, str]) -> None:
+        """근사 중복 색인에서 항목 삭제 (비어 있는 범위의 색인은 제거)"""
+        index = self._indexes.get(entry_key[:3])
+        if index is None:
+            return
+        index.remove(entry_key)
+        if not len(index):
+            del self._indexes[entry_key[:3]]
+
+    def _signature(self, key: str) -> Optional[np.ndarray]:
+        """근사 중복 비교용 서명 (너무 짧은 문단은 오탐이 많아 제외)"""
+        if len(key) < self.min_chars:
+            return None
+        return minhash_signature(key)
+
+
+@dataclass
+class _PlanPart:
+    paragraphs: List[str]
+    translation: Optional[str] = None
+    references: List[Tuple[str, str]] = field(default_factory=list)
+    tokens: int = 0
+
+
+class TranslationPlan:
+    """번역 메모리 조회 결과와 구간 토큰 예산에 따른 번역 계획 클래스
+
+    완전 일치 문단은 저장된 번역을 쓰고, 그 사이의 연속된 문단은 토큰 예산 이내의 구간으로
+    묶어 LLM에 번역을 요청합니다 (근사 중복 문단의 이전 번역은 참고 번역으로 함께 전달).
+    토큰 예산에 따른 분할은 구간 체크포인트와 함께 동작하므로, 체크포인트를 끄면 나누지 않습니다.
+    """
+
+    def __init__(self, request: TranslationRequest, memory: Optional[TranslationMemory] = None,
+                 segment_tokens: Optional[int] = None, scope: Optional[str] = None):
+        """문단별 조회 후 구간 생성 (memory나 scope(테넌트)가 없으면 구간 분할만 수행)"""
+        started = time.perf_counter()
+        self.memory = memory if scope else None
+        self.scope = scope
+        self.request = request
+        if segment_tokens is None:
+            segment_tokens = Settings.TRANSLATION_SEGMENT_TOKENS if Settings.CHECKPOINT_ENABLED else 0
+        self.segment_tokens = segment_tokens  # 0이면 토큰 예산으로 나누지 않음
+        self.source_language = request.source_language.value
+        self.target_language = request.target_language.value
+        self.parts: List[_PlanPart] = []
+        self.exact_hits = 0
+        self.near_hits = 0
+        self.reused_segments = 0
+        self._results: List[TranslationResult] = []
+
+        paragraphs = split_paragraphs(request.text)
+        for paragraph in paragraphs:
+            match = (self.memory.lookup(paragraph, self.source_language, self.target_language, scope)
+                     if self.memory else None)
+            if match is not None and match.kind == "exact":
+                self.exact_hits += 1
+                self.parts.append(_PlanPart([paragraph], match.translation))
+                continue
+            tokens = estimate_tokens(paragraph)
+            if (not self.parts or self.parts[-1].translation is not None
+                    or (self.segment_tokens and self.parts[-1].tokens + tokens > self.segment_tokens)):
+                self.parts.append(_PlanPart([]))
+            self.parts[-1].paragraphs.append(paragraph)
+            self.parts[-1].tokens += tokens
+            if match is not None:
+                self.near_hits += 1
+                if len(self.parts[-1].references) < Settings.TRANSLATION_MEMORY_MAX_REFERENCES:
+                    self.parts[-1].references.append((match.source, match.translation))
+
+        self.paragraph_count = len(paragraphs)
+        self.segment_count = sum(1 for part in self.parts if part.translation is None)
+        self.lookup_ms = round((time.perf_counter() - started) * 1000, 3)
+
+    @property
+    def checkpointed(self) -> bool:
+        """구간 결과를 체크포인트할지 여부 (LLM 구간이 둘 이상인 긴 문서만)"""
+        return self.segment_count > 1
+
+    def pending_requests(self) -> List[Tuple[int, TranslationRequest]]:
+        """LLM 번역이 필요한 구간 요청 목록 (구간 번호, 요청)"""
+        pending = []
+        for index, part in enumerate(self.parts):
+            if part.translation is not None:
+                continue
+            # 메모리 적중이 전혀 없으면 원문을 그대로 보내 기존 요청과 동일하게 유지
+            text = self.request.text if len(self.parts) == 1 else join_paragraphs(part.paragraphs)
+            pending.append((index, TranslationRequest(
+                text=text,
+                source_language=self.request.source_language,
+                target_language=self.request.target_language,
+                reference_translations=part.references or None
+            )))
+        return pending
+
+    def complete(self, index: int, result: TranslationResult, reused: bool = False) -> None:
+        """구간 번역 결과 반영 및 번역 메모리에 저장 (reused는 체크포인트에서 복원한 결과)"""
+        part = self.parts[index]
+        part.translation = result.translated_text
+        if reused:
+            self.reused_segments += 1
+        else:
+            self._results.append(result)
+        if self.memory is None:
+            return
+
+        # 문단별 대응이 확인되면 문단별로, 아니면 구간 전체를 하나의 항목으로 저장
+        translated = split_paragraphs(result.translated_text)
+        if paragraphs_aligned(part.paragraphs, translated):
+            for source, translation in zip(part.paragraphs, translated):
+                self.memory.store(source, translation, self.source_language, self.target_language, self.scope)
+        else:
+            self.memory.store(join_paragraphs(part.paragraphs), result.translated_text,
+                              self.source_language, self.target_language, self.scope)
+
+    def build_result(self) -> TranslationResult:
+        """구간 번역을 원문 순서대로 합친 결과 생성"""
+        if any(part.translation is None for part in self.parts):
+            raise ValueError("번역되지 않은 구간이 남아 있습니다.")
+
+        if self._results:
+            model = self._results[-1].model
+        else:
+            model = "checkpoint" if self.reused_segments else "translation-memory"
+
+        return TranslationResult(
+            original_text=self.request.text,
+            translated_text=join_paragraphs([part.translation for part in self.parts]),
+            source_language=self.request.source_language,
+            target_language=self.request.target_language,
+            model=model,
+            usage=self._merged_usage(),
+            memory={
+                "paragraphs": self.paragraph_count,
+                "exact_hits": self.exact_hits,
+                "near_hits": self.near_hits,
+                "llm_segments": len(self._results),
+                "lookup_ms": self.lookup_ms
+            } if self.memory is not None else None,
+            checkpoint={
+                "segments": self.segment_count,
+                "reused": self.reused_segments,
+                "processed": len(self._results)
+            } if self.checkpointed else None
+        )
+
+    def _merged_usage(self) -> Optional[Dict[str, Any]]:
+        """이번 요청에서 호출한 구간의 토큰 사용량 합계 (체크포인트에서 복원한 구간 제외)"""
+        usages = [result.usage for result in self._results if result.usage]
+        if not usages:
+            return None
+        merged = {"prompt_template": usages[-1].get("prompt_template")}
+        for name in ("prompt_tokens", "cached_tokens", "completion_tokens"):
+            merged[name] = sum(usage.get(name, 0) for usage in usages)
+        return merged
+
+
+# 전역 번역 메모리 (프로세스 단위)
+translation_memory = TranslationMemory()
@@ -0,0 +1,271 @@
+import hashlib
+import json
+import os
+import re
+import secrets
+import shutil
+import time
+from contextlib import contextmanager
+from typing import Iterator, Optional
+from models.upload_session import UploadSession
+from config.settings import Settings
+
+# 세션 ID는 경로에 사용되므로 16진수 문자열만 허용
+UPLOAD_ID_PATTERN = re.compile(r'^[0-9a-f]{32}$')
+SHA256_PATTERN = re.compile(r'^[0-9a-f]{64}$')
+METADATA_FILE = "session.json"
+SPOOLED_FILE = "upload.bin"
+FINALIZE_LOCK_FILE = "finalize.lock"
+CHUNK_PREFIX = "chunk-"
+
+
+class UploadSessionError(ValueError):
+    """상태 코드가 400이 아닌 업로드 세션 오류 (429 테넌트 한도 초과, 409 완료 처리 중)"""
+
+    def __init__(self, message: str, status_code: int):
+        super().__init__(message)
+        self.status_code = status_code
+
+
+class UploadSessionService:
+    """분할 업로드 세션 서비스 클래스
+
+    세션마다 스풀 디렉터리를 만들고 청크를 개별 파일로 저장합니다.
+    청크 파일은 임시 파일에 쓴 뒤 이름을 바꾸므로, 받은 청크 목록은 디렉터리 내용만으로
+    복원되고 여러 워커 프로세스가 같은 세션을 처리해도 메타데이터 경합이 없습니다.
+    세션은 만든 테넌트에 묶이며, 테넌트마다 동시 세션 수와 선언한 파일 크기 합계가 제한됩니다.
+    """
+
+    def __init__(self, spool_dir: Optional[str] = None):
+        """업로드 세션 서비스 초기화"""
+        self.spool_dir = spool_dir or Settings.UPLOAD_SPOOL_DIR
+        self.chunk_size = Settings.UPLOAD_CHUNK_SIZE
+        self.max_upload_size = Settings.MAX_UPLOAD_SESSION_SIZE
+        self.session_ttl = Settings.UPLOAD_SESSION_TTL
+        self.allowed_types = Settings.ALLOWED_FILE_TYPES
+        self.sessions_per_tenant = Settings.UPLOAD_SESSIONS_PER_TENANT
+        self.bytes_per_tenant = Settings.UPLOAD_SPOOL_BYTES_PER_TENANT
+
+    def create_session(self, file_name: str, file_type: str, file_size: int,
+                       sha256: Optional[str] = None, owner: Optional[str] = None) -> UploadSession:
+        """업로드 세션 생성 (owner 테넌트의 동시 세션 수/파일 크기 합계 한도 검사)"""
+        if file_type not in self.allowed_types:
+            raise ValueError(f"지원하지 않는 파일 형식입니다: {file_type}")
+        if file_size <= 0:
+            raise ValueError("파일 크기는 0보다 커야 합니다.")
+        if file_size > self.max_upload_size:
+            raise ValueError(f"파일 크기가 {self.max_upload_size // 1024 // 1024}MB를 초과합니다.")
+        if sha256 is not None and not SHA256_PATTERN.match(sha256):
+            raise ValueError("파일 해시는 SHA-256 16진수 문자열이어야 합니다.")
+
+        # 새 세션을 만들 때 만료된 세션 정리
+        self.cleanup_expired()
+        self._check_tenant_limits(owner, file_size)
+
+        session = UploadSession(
+            upload_id=secrets.token_hex(16),
+            file_name=file_name,
+            file_type=file_type,
+            file_size=file_size,
+            chunk_size=self.chunk_size,
+            created_at=time.time(),
+            sha256=sha256,
+            owner=owner
+        )
+        session_dir = self._session_dir(session.upload_id)
+        os.makedirs(session_dir)
+        self._write_atomic(os.path.join(session_dir, METADATA_FILE),
+                           json.dumps(session.to_dict(), ensure_ascii=False).encode('utf-8'))
+        return session
+
+    def get_session(self, upload_id: str, owner: Optional[str] = None) -> UploadSession:
+        """업로드 세션 조회 (받은 청크 목록 포함, 다른 테넌트의 세션은 찾을 수 없음으로 처리)"""
+        session_dir = self._session_dir(upload_id)
+        session = self._read_session(upload_id)
+        if session is None or session.owner != owner:
+            raise ValueError(f"업로드 세션을 찾을 수 없습니다: {upload_id}")
+
+        # 마지막 청크를 받은 시점(디렉터리 수정 시각)부터 만료 시간 계산
+        if time.time() - os.path.getmtime(session_dir) > self.session_ttl:
+            shutil.rmtree(session_dir, ignore_errors=True)
+            raise ValueError(f"업로드 세션이 만료되었습니다: {upload_id}")
+
+        session.received_chunks = sorted(
+            int(name[len(CHUNK_PREFIX):]) for name in os.listdir(session_dir)
+            if name.startswith(CHUNK_PREFIX) and name[len(CHUNK_PREFIX):].isdigit()
+        )
+        return session
+
+    def put_chunk(self, upload_id: str, index: int, data: bytes, sha256: str,
+                  owner: Optional[str] = None) -> UploadSession:
+        """청크 저장 (해시 검증, 같은 청크를 다시 보내도 안전)"""
+        session = self.get_session(upload_id, owner)
+        if not 0 <= index < session.total_chunks:
+            raise ValueError(f"청크 번호가 범위를 벗어났습니다: {index} (0-{session.total_chunks - 1})")
+
+        expected_size = session.expected_chunk_size(index)
+        if len(data) != expected_size:
+            raise ValueError(f"청크 {index}의 크기({len(data)})가 기대 크기({expected_size})와 다릅니다.")
+
+        digest = hashlib.sha256(data).hexdigest()
+        if digest != sha256.lower():
+            raise ValueError(f"청크 {index}의 해시가 일치하지 않습니다. 다시 전송해 주세요.")
+
+        self._write_atomic(os.path.join(self._session_dir(upload_id), self._chunk_name(index)), data)
+        if index not in session.received_chunks:
+            session.received_chunks = sorted(session.received_chunks + [index])
+        return session
+
+    def finalize(self, upload_id: str, owner: Optional[str] = None) -> str:
+        """모든 청크를 하나의 스풀 파일로 합치고 경로 반환 (finalize_lock 안에서 호출)"""
+        session = self.get_session(upload_id, owner)
+        session_dir = self._session_dir(upload_id)
+        spooled_path = os.path.join(session_dir, SPOOLED_FILE)
+
+        # 이미 합쳐진 세션은 그대로 반환 (finalize 재시도)
+        if os.path.exists(spooled_path):
+            return spooled_path
+
+        missing = session.missing_chunks
+        if missing:
+            raise ValueError(f"아직 받지 않은 청크가 있습니다: {missing[:10]}")
+
+        digest = hashlib.sha256()
+        temp_path = f"{spooled_path}.{secrets.token_hex(4)}.tmp"
+        with open(temp_path, 'wb') as output:
+            for index in range(session.total_chunks):
+                with open(os.path.join(session_dir, self._chunk_name(index)), 'rb') as chunk:
+                    data = chunk.read()
+                digest.update(data)
+                output.write(data)
+
+        if session.sha256 and digest.hexdigest() != session.sha256:
+            os.remove(temp_path)
+            raise ValueError("업로드된 파일의 해시가 일치하지 않습니다.")
+
+        os.replace(temp_path, spooled_path)
+        for index in range(session.total_chunks):
+            try:
+                os.remove(os.path.join(session_dir, self._chunk_name(index)))
+            except FileNotFoundError:
+                pass
+        return spooled_path
+
+    @contextmanager
+    def finalize_lock(self, upload_id: str) -> Iterator[None]:
+        """세션 완료 처리 잠금 (여러 워커 프로세스에서 같은 세션을 동시에 합치거나 처리하지 않도록 함)
+
+        잠금 파일을 O_EXCL로 만들어 먼저 만든 요청만 진행하고, 나머지는 409로 거절합니다.
+        """
+        lock_path = os.path.join(self._session_dir(upload_id), FINALIZE_LOCK_FILE)
+        if not self._create_lock(lock_path):
+            # 잠금을 잡은 프로세스가 비정상 종료되어 남은 잠금은 이름을 바꿔 치운 뒤 한 번만 다시 시도
+            if not (self._break_stale_lock(lock_path) and self._create_lock(lock_path)):
+                raise UploadSessionError(f"이미 완료 처리 중인 업로드 세션입니다: {upload_id}", 409)
+        try:
+            yield
+        finally:
+            try:
+                os.remove(lock_path)
+            except FileNotFoundError:
+                # 처리 후 세션 디렉터리가 삭제된 경우
+                pass
+
+    def delete_session(self, upload_id: str) -> None:
+        """업로드 세션과 스풀 파일 삭제"""
+        shutil.rmtree(self._session_dir(upload_id), ignore_errors=True)
+
+    def cleanup_expired(self) -> int:
+        """만료된 세션 디렉터리 삭제 후 삭제한 개수 반환"""
+        if not os.path.isdir(self.spool_dir):
+            return 0
+        removed = 0
+        cutoff = time.time() - self.session_ttl
+        for name in os.listdir(self.spool_dir):
+            session_dir = os.path.join(self.spool_dir, name)
+            if not UPLOAD_ID_PATTERN.match(name):
+                continue
+            try:
+                if os.path.getmtime(session_dir) < cutoff:
+                    shutil.rmtree(session_dir, ignore_errors=True)
+                    removed += 1
+            except FileNotFoundError:
+                continue
+        return removed
+
+    def _check_tenant_limits(self, owner: Optional[str], file_size: int) -> None:
+        """테넌트의 진행 중인 세션 수와 선언한 파일 크기 합계 한도 검사"""
+        if self.sessions_per_tenant <= 0 and self.bytes_per_tenant <= 0:
+            return
+        sessions, total_size = 0, file_size
+        if os.path.isdir(self.spool_dir):
+            for name in os.listdir(self.spool_dir):
+                if not UPLOAD_ID_PATTERN.match(name):
+                    continue
+                session = self._read_session(name)
+                if session is not None and session.owner == owner:
+                    sessions += 1
+                    total_size += session.file_size
+
+        if 0 < self.sessions_per_tenant <= sessions:
+            raise UploadSessionError(
+                f"진행 중인 업로드 세션이 {self.sessions_per_tenant}개를 초과할 수 없습니다. "
+                "기존 세션을 완료하거나 만료된 뒤 다시 시도해 주세요.", 429
+            )
+        if 0 < self.bytes_per_tenant < total_size:
+            raise UploadSessionError(
+                f"진행 중인 업로드의 파일 크기 합계가 {self.bytes_per_tenant // 1024 // 1024}MB를 초과합니다.", 429
+            )
+
+    def _read_session(self, upload_id: str) -> Optional[UploadSession]:
+        """세션 메타데이터 읽기 (없으면 None)"""
+        try:
+            with open(os.path.join(self._session_dir(upload_id), METADATA_FILE), 'rb') as f:
+                return UploadSession.from_dict(json.loads(f.read().decode('utf-8')))
+        except FileNotFoundError:
+            return None
+
+    def _create_lock(self, lock_path: str) -> bool:
+        """잠금 파일을 배타적으로 생성 (이미 있으면 False)"""
+        try:
+            fd = os.open(lock_path, os.O_CREAT | os.O_EXCL | os.O_WRONLY)
+        except FileExistsError:
+            return False
+        except FileNotFoundError:
+            raise ValueError("업로드 세션을 찾을 수 없습니다.")
+        os.close(fd)
+        return True
+
+    def _break_stale_lock(self, lock_path: str) -> bool:
+        """오래된 잠금 파일 제거 (원자적 이름 변경이므로 여러 프로세스 중 하나만 성공)"""
+        try:
+            if time.time() - os.path.getmtime(lock_path) <= Settings.UPLOAD_FINALIZE_LOCK_TIMEOUT:
+                return False
+            stale_path = f"{lock_path}.{secrets.token_hex(4)}.stale"
+            os.rename(lock_path, stale_path)
+        except FileNotFoundError:
+            # 다른 요청이 먼저 잠금을 풀었거나 치움
+            return True
+        if time.time() - os.path.getmtime(stale_path) <= Settings.UPLOAD_FINALIZE_LOCK_TIMEOUT:
+            # 검사와 이름 변경 사이에 다른 요청이 새로 잡은 잠금이면 되돌림
+            os.rename(stale_path, lock_path)
+            return False
+        os.remove(stale_path)
+        return True
+
+    def _session_dir(self, upload_id: str) -> str:
+        """세션 스풀 디렉터리 경로"""
+        if not isinstance(upload_id, str) or not UPLOAD_ID_PATTERN.match(upload_id):
+            raise ValueError("잘못된 업로드 세션 ID입니다.")
+        return os.path.join(self.spool_dir, upload_id)
+
+    def _chunk_name(self, index: int) -> str:
+        """청크 파일 이름"""
+        return f"{CHUNK_PREFIX}{index:06d}"
+
+    def _write_atomic(self, path: str, data: bytes) -> None:
+        """임시 파일에 쓴 뒤 이름을 바꿔 중간에 끊겨도 불완전한 파일이 남지 않도록 저장"""
+        temp_path = f"{path}.{secrets.token_hex(4)}.tmp"
+        with open(temp_path, 'wb') as f:
+            f.write(data)
+        os.replace(temp_path, path)
@@ -0,0 +1,171 @@
+import asyncio
+import pytest
+from config.settings import Settings
+from controllers.document_controller import DocumentController
+from controllers.request_options import TENANT_FIELD
+from controllers.translation_controller import TranslationController
+from models.document import Document, FileType
+from models.translation import Language, TranslationRequest, TranslationResult
+from services.checkpoint_store import CheckpointStore, checkpoint_key
+from services.document_pipeline import DocumentPipeline
+from services.file_processor import FileProcessorService
+from services.segment_executor import SegmentExecutor, run_sync
+from services.translation_memory import TranslationMemory, TranslationPlan
+
+PARAGRAPH = "The quarterly report covers every regional office and its revenue in detail."
+
+
+def _request(text):
+    return TranslationRequest(text=text, source_language=Language.ENGLISH, target_language=Language.KOREAN)
+
+
+class _StubOpenAI:
+    """호출한 구간을 기록하고 대문자로 번역하는 LLM 대역"""
+
+    def __init__(self):
+        self.calls = []
+
+    def translation_checkpoint_params(self, request):
+        return {"model": "stub", "target_language": request.target_language.value}
+
+    def translate_text(self, request):
+        self.calls.append(request.text)
+        return TranslationResult(request.text, request.text.upper(), request.source_language,
+                                 request.target_language, model="stub", usage={"total_tokens": 7})
+
+
+class _StubAsyncOpenAI(_StubOpenAI):
+    async def translate_text(self, request):
+        return _StubOpenAI.translate_text(self, request)
+
+
+LONG_TEXT = "\n\n".join(f"{PARAGRAPH} Section {index}." for index in range(400))
+
+
+def _controller(tmp_path, service):
+    controller = TranslationController.__new__(TranslationController)
+    controller.openai_service = service
+    controller._async_openai_service = service
+    controller.translation_memory = TranslationMemory()
+    controller.checkpoint_store = CheckpointStore(str(tmp_path / "checkpoints.db"))
+    return controller
+
+
+def test_checkpoint_key_is_scoped_per_tenant():
+    params = {"model": "stub"}
+
+    assert checkpoint_key("translation", params, PARAGRAPH, "google:alice") != \
+        checkpoint_key("translation", params, PARAGRAPH, "google:bob")
+    assert checkpoint_key("translation", params, PARAGRAPH, None) == checkpoint_key("translation", params, PARAGRAPH, "")
+
+
+def test_checkpoint_stores_only_translation_and_usage(tmp_path, monkeypatch):
+    monkeypatch.setattr(Settings, "CHECKPOINT_ENABLED", True)
+    service = _StubOpenAI()
+    controller = _controller(tmp_path, service)
+
+    result = controller.translate_request(_request(LONG_TEXT), tenant_id="google:alice")
+    rows = controller.checkpoint_store._connection().execute("SELECT result FROM checkpoints").fetchall()
+
+    assert rows and all("original_text" not in row[0] and PARAGRAPH not in row[0] for row in rows)
+    assert len(rows) == len(service.calls) > 1
+    assert result.translated_text.startswith(PARAGRAPH.upper())
+
+
+def test_sync_and_async_paths_share_checkpoints_per_tenant(tmp_path, monkeypatch):
+    monkeypatch.setattr(Settings, "CHECKPOINT_ENABLED", True)
+    service = _StubAsyncOpenAI()
+    controller = _controller(tmp_path, service)
+    controller.openai_service = _StubOpenAI()
+    request = _request(LONG_TEXT)
+
+    first = controller.translate_request(request, tenant_id="google:alice")
+    calls = len(controller.openai_service.calls)
+    again = asyncio.run(controller._execute_plan(controller._build_plan(request, None), "google:alice",
+                                                 _threaded(service)))
+
+    assert calls > 1 and service.calls == []
+    assert again.translated_text == first.translated_text
+
+    asyncio.run(controller._execute_plan(controller._build_plan(request, None), "google:bob", _threaded(service)))
+    assert len(service.calls) == calls
+
+
+def test_segmenting_follows_checkpoint_setting(monkeypatch):
+    monkeypatch.setattr(Settings, "CHECKPOINT_ENABLED", False)
+    assert TranslationPlan(_request(LONG_TEXT)).segment_count == 1
+    monkeypatch.setattr(Settings, "CHECKPOINT_ENABLED", True)
+    assert TranslationPlan(_request(LONG_TEXT)).segment_count > 1
+
+
+def test_run_sync_drives_sync_executor():
+    executor = SegmentExecutor.sync(lambda request: request * 2)
+
+    async def plan():
+        return await executor.call(3) + await executor.run_blocking(len, "ab")
+
+    assert run_sync(plan()) == 8
+
+
+def test_run_sync_completes_plans_that_suspend():
+    executor = SegmentExecutor.sync(lambda request: request * 2)
+
+    async def plan():
+        # 동기 실행기와 섞여 실제로 대기하는 작업이 있어도 끝까지 실행
+        await asyncio.sleep(0.01)
+        return await executor.call(3) + await asyncio.to_thread(len, "ab")
+
+    assert run_sync(plan()) == 8
+
+
+def _threaded(service):
+    return SegmentExecutor.threaded(service.translate_text)
+
+
+class _PageProcessor(FileProcessorService):
+    """문단 하나씩을 페이지로 반환하는 추출기"""
+
+    def iter_document_pages(self, document, page_stats=None):
+        for index in range(5):
+            yield f"{PARAGRAPH} Page {index}."
+
+
+class _FailingOpenAI(_StubOpenAI):
+    """fail_at번째 호출에서 한 번 실패하는 LLM 대역"""
+
+    def __init__(self, fail_at):
+        super().__init__()
+        self.fail_at = fail_at
+
+    def translate_text(self, request):
+        if len(self.calls) == self.fail_at:
+            self.fail_at = None
+            raise RuntimeError("LLM 호출 실패")
+        return super().translate_text(request)
+
+
+def test_pipeline_retry_skips_checkpointed_segments(tmp_path, monkeypatch):
+    monkeypatch.setattr(Settings, "CHECKPOINT_ENABLED", True)
+    monkeypatch.setattr(Settings, "DOCUMENT_PIPELINE_ENABLED", True)
+    service = _FailingOpenAI(fail_at=3)
+    processor = _PageProcessor()
+    controller = DocumentController.__new__(DocumentController)
+    controller.file_processor = processor
+    # 페이지마다 구간 하나가 되도록 토큰 예산을 작게 잡음
+    controller.document_pipeline = DocumentPipeline(processor, segment_tokens=1)
+    controller._translation_controller = _controller(tmp_path, service)
+    options = {"target_lang": "ko", "source_lang": "en", "normalize": False, "use_memory": False,
+               TENANT_FIELD: "google:alice"}
+
+    def document():
+        return Document(file_name="a.txt", file_type=FileType.TXT, file_size=0, file_data=b"")
+
+    with pytest.raises(RuntimeError):
+        controller._translate_document(document(), options)
+    assert len(service.calls) == 3
+
+    response = controller._translate_document(document(), options)
+
+    # 재시도에서는 실패한 구간부터만 번역
+    assert [call.rsplit(" ", 1)[-1] for call in service.calls] == ["0.", "1.", "2.", "3.", "4."]
+    assert response["translation"]["translated_text"].count(PARAGRAPH.upper()) == 5
@@ -0,0 +1,79 @@
+import threading
+import time
+import pytest
+from models.document import Document, FileType
+from models.translation import Language, TranslationResult
+from services.document_pipeline import DocumentPipeline
+from services.file_processor import FileProcessorService
+from services.memory_budget import memory_budget
+
+
+class _SlowPageProcessor(FileProcessorService):
+    """페이지마다 고정 지연 후 텍스트를 반환하는 추출기"""
+
+    def __init__(self, page_count, page_seconds):
+        super().__init__()
+        self.page_count = page_count
+        self.page_seconds = page_seconds
+
+    def iter_document_pages(self, document, page_stats=None):
+        for index in range(self.page_count):
+            time.sleep(self.page_seconds)
+            yield f"Page {index}: The quick brown fox jumps over the lazy dog."
+
+
+def _document():
+    return Document(file_name="slow.txt", file_type=FileType.TXT, file_size=0, file_data=b"")
+
+
+def _run_in_thread(pipeline, translate):
+    outcome = {}
+
+    def target():
+        try:
+            outcome["result"] = pipeline.run(_document(), False, translate)
+        except BaseException as e:
+            outcome["error"] = e
+
+    thread = threading.Thread(target=target, daemon=True)
+    thread.start()
+    thread.join(5)
+    return thread, outcome
+
+
+def test_translation_failure_during_extraction_stops_pipeline():
+    def translate(text):
+        raise RuntimeError("LLM 호출 실패")
+
+    # 구간마다 번역하도록 토큰 예산을 작게 잡아 추출 중에 번역이 실패하게 함
+    pipeline = DocumentPipeline(_SlowPageProcessor(5, 0.3), queue_size=1, segment_tokens=1)
+    thread, outcome = _run_in_thread(pipeline, translate)
+
+    assert not thread.is_alive()
+    assert isinstance(outcome.get("error"), RuntimeError)
+    assert not any(stage.name.startswith("document-pipeline") for stage in threading.enumerate())
+
+
+def test_memory_reservation_released_after_extraction():
+    reserved_during_translation = []
+
+    def translate(text):
+        time.sleep(0.05)
+        reserved_during_translation.append(memory_budget.reserved_bytes)
+        return TranslationResult(text, text.upper(), Language.ENGLISH, Language.KOREAN)
+
+    pipeline = DocumentPipeline(_SlowPageProcessor(3, 0), queue_size=8, segment_tokens=1)
+    thread, outcome = _run_in_thread(pipeline, translate)
+
+    assert not thread.is_alive()
+    results, stats = outcome["result"]
+    assert len(results) == stats["segments"] == 3
+    # 추출은 번역보다 먼저 끝나므로 마지막 구간을 번역할 때는 예산을 반환한 상태
+    assert reserved_during_translation[-1] == 0
+    assert memory_budget.reserved_bytes == 0
+
+
+@pytest.fixture(autouse=True)
+def _empty_budget():
+    assert memory_budget.reserved_bytes == 0
+    yield
@@ -0,0 +1,88 @@
+import io
+import zipfile
+import pytest
+from services.docx_stream_extractor import DocxStreamExtractor
+
+W = 'xmlns:w="http://schemas.openxmlformats.org/wordprocessingml/2006/main"'
+
+
+def _p(text):
+    return f"<w:p><w:r><w:t>{text}</w:t></w:r></w:p>"
+
+
+def _table(*rows):
+    return "<w:tbl>" + "".join(
+        "<w:tr>" + "".join(f"<w:tc>{cell}</w:tc>" for cell in row) + "</w:tr>" for row in rows
+    ) + "</w:tbl>"
+
+
+def _docx(body, parts=None, compression=zipfile.ZIP_DEFLATED):
+    buffer = io.BytesIO()
+    with zipfile.ZipFile(buffer, "w", compression) as archive:
+        archive.writestr("word/document.xml", f"<w:document {W}><w:body>{body}</w:body></w:document>")
+        for name, content in (parts or {}).items():
+            archive.writestr(name, f"<w:hdr {W}>{content}</w:hdr>")
+    buffer.seek(0)
+    return buffer
+
+
+def _blocks(source, **limits):
+    return list(DocxStreamExtractor(source, **limits).iter_blocks())
+
+
+def test_paragraphs_and_tables_keep_document_order():
+    body = _p("Intro") + _table([_p("A1"), _p("B1")], [_p("A2"), _p("B2")]) + _p("Outro")
+
+    assert _blocks(_docx(body)) == ["Intro", "A1\tB1", "A2\tB2", "Outro"]
+
+
+def test_nested_table_rows_are_merged_into_outer_cell():
+    inner = _table([_p("x"), _p("y")], [_p("z"), _p("w")])
+    body = _table([_p("Outer") + inner, _p("Right")])
+
+    assert _blocks(_docx(body)) == ["Outer x\ty z\tw\tRight"]
+
+
+def test_headers_before_body_and_footers_after_in_numeric_order():
+    parts = {
+        "word/header10.xml": _p("Header ten"),
+        "word/header2.xml": _p("Header two"),
+        "word/footer1.xml": _p("Footer one"),
+        "word/footer11.xml": _p("Footer eleven"),
+        "word/footer3.xml": _p("Footer three"),
+    }
+
+    blocks = _blocks(_docx(_p("Body"), parts))
+
+    assert blocks == ["Header two", "Header ten", "Body", "Footer one", "Footer three", "Footer eleven"]
+
+
+def test_line_breaks_and_tabs_inside_paragraph():
+    body = "<w:p><w:r><w:t>a</w:t><w:tab/><w:t>b</w:t><w:br/><w:t>c</w:t></w:r></w:p>" + _p(" ")
+
+    assert _blocks(_docx(body)) == ["a\tb\nc"]
+
+
+def test_rejects_archive_over_uncompressed_limit():
+    # 반복 문단은 압축률이 높아 압축 파일은 작지만 압축 해제 크기는 한도를 넘음
+    source = _docx(_p("bomb " * 10) * 20000)
+    assert len(source.getvalue()) < 64 * 1024
+
+    with pytest.raises(ValueError, match="압축 해제 크기"):
+        _blocks(source, max_uncompressed_bytes=1024 * 1024)
+
+
+def test_rejects_text_over_char_limit():
+    with pytest.raises(ValueError, match="최대 10자"):
+        _blocks(_docx(_p("first") + _p("second")), max_chars=10)
+
+
+def test_rejects_non_docx_input():
+    with pytest.raises(ValueError, match="DOCX"):
+        _blocks(io.BytesIO(b"not a zip"))
+
+    buffer = io.BytesIO()
+    with zipfile.ZipFile(buffer, "w") as archive:
+        archive.writestr("other.xml", "<x/>")
+    with pytest.raises(ValueError, match="document.xml"):
+        _blocks(io.BytesIO(buffer.getvalue()))
@@ -0,0 +1,92 @@
+import numpy as np
+from models.summary import SummaryMethod, SummaryRequest
+from services.extractive_summarizer import ExtractiveSummarizerService
+from services.token_estimator import estimate_tokens
+
+SENTENCES = [
+    "Solar panels convert sunlight into electricity for homes.",
+    "Solar electricity from panels lowers home energy bills.",
+    "The museum opened a new exhibit on ancient pottery.",
+    "Home solar panels and batteries store electricity for the night.",
+    "A local bakery sells bread every morning."
+]
+
+
+def _service():
+    return ExtractiveSummarizerService()
+
+
+def _summarize(text, method, count):
+    request = SummaryRequest(text=text, method=method, sentences_count=count)
+    return _service().summarize_text(request)
+
+
+def test_textrank_prefers_central_sentences():
+    scores = _service().textrank_scores(SENTENCES)
+
+    assert scores.shape == (len(SENTENCES),)
+    assert np.isclose(scores.sum(), 1.0)
+    # 태양광 문장끼리 서로 연결되어 있으므로 고립된 문장보다 점수가 높음
+    assert min(scores[[0, 1, 3]]) > max(scores[[2, 4]])
+
+
+def test_lsa_scores_use_sparse_svd_for_large_inputs():
+    sentences = [f"Topic {index % 3} sentence about item{index} and shared words." for index in range(40)]
+
+    scores = _service().lsa_scores(sentences, 3)
+
+    assert scores.shape == (40,) and np.all(np.isfinite(scores)) and scores.max() > 0
+
+
+def test_select_sentences_keeps_original_order():
+    scores = np.array([0.1, 0.9, 0.5, 0.8, 0.2])
+
+    selected = _service().select_sentences(SENTENCES, scores, 3)
+
+    assert selected == [SENTENCES[1], SENTENCES[2], SENTENCES[3]]
+
+
+def test_select_sentences_breaks_ties_by_position():
+    selected = _service().select_sentences(SENTENCES, np.ones(len(SENTENCES)), 2)
+
+    assert selected == SENTENCES[:2]
+
+
+def test_summary_returns_text_when_sentences_do_not_exceed_count():
+    for method in (SummaryMethod.TEXTRANK, SummaryMethod.LSA):
+        assert _summarize("Only one sentence here.", method, 3).summary == "Only one sentence here."
+        assert _summarize(" ".join(SENTENCES[:2]), method, 3).summary == " ".join(SENTENCES[:2])
+
+
+def test_lsa_handles_count_close_to_sentence_count():
+    # 요청한 차원 수가 min(행렬 크기) - 1 이상이면 희소 SVD 대신 전체 SVD 사용
+    for count in (1, len(SENTENCES) - 2, len(SENTENCES) - 1):
+        result = _summarize(" ".join(SENTENCES), SummaryMethod.LSA, count)
+        assert len(_service().split_sentences(result.summary)) == count
+
+
+def test_lsa_handles_sentences_without_words():
+    scores = _service().lsa_scores(["!!!", "???", "..."], 1)
+
+    assert scores.shape == (3,) and np.all(np.isfinite(scores))
+
+
+def test_reduce_text_stays_within_token_budget():
+    text = " ".join(SENTENCES * 4)
+    budget = estimate_tokens(text) // 3
+
+    reduced, stats = _service().reduce_text(text, budget)
+
+    assert stats["applied"] and stats["reduced_tokens"] <= budget
+    assert 0 < stats["sentences_kept"] < stats["sentences_total"]
+    assert stats["tokens_saved"] == stats["original_tokens"] - stats["reduced_tokens"]
+    # 중복 감점으로 같은 문장을 다시 고르기 전에 서로 다른 문장을 모두 선택
+    assert set(reduced.split("\n")) == set(SENTENCES)
+
+
+def test_reduce_text_skips_text_within_budget():
+    text = " ".join(SENTENCES)
+
+    reduced, stats = _service().reduce_text(text, estimate_tokens(text))
+
+    assert reduced == text and not stats["applied"] and stats["tokens_saved"] == 0
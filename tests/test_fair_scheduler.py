@@ -0,0 +1,189 @@
+import asyncio
+import pytest
+from services import fair_scheduler
+from services.admission_controller import AdmissionController, AdmissionRejectedError
+from services.fair_scheduler import FairScheduler
+
+
+class FakeClock:
+    """time.monotonic 대체용 시계"""
+
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    fake = FakeClock()
+    monkeypatch.setattr(fair_scheduler.time, "monotonic", fake)
+    return fake
+
+
+def _future(loop: asyncio.AbstractEventLoop, name: str) -> asyncio.Future:
+    future = loop.create_future()
+    future.name = name
+    return future
+
+
+def test_large_request_is_not_starved_by_stream_of_small_requests(clock):
+    """짧은 요청이 계속 들어와도 오래 기다린 큰 요청은 aging으로 앞서게 됨"""
+    loop = asyncio.new_event_loop()
+    try:
+        scheduler = FairScheduler(aging_rate=2000)
+        state = scheduler.tenant("a", 1.0)
+        scheduler.push(state, 10000, _future(loop, "large"))
+
+        served = []
+        for second in range(1, 10):
+            clock.now += 1
+            scheduler.push(state, 100, _future(loop, f"small-{second}"))
+            served.append(scheduler.pop().name)
+
+        # 대기 5초 후 (10000 - 2000×5 = 0 < 100) 큰 요청이 짧은 요청보다 먼저 처리
+        assert served.index("large") == 4
+    finally:
+        loop.close()
+
+
+def test_without_aging_shortest_request_always_wins(clock):
+    """aging이 없으면 같은 테넌트 안에서는 항상 짧은 요청 우선"""
+    loop = asyncio.new_event_loop()
+    try:
+        scheduler = FairScheduler(aging_rate=0)
+        state = scheduler.tenant("a", 1.0)
+        scheduler.push(state, 10000, _future(loop, "large"))
+        for second in range(1, 10):
+            clock.now += 1
+            scheduler.push(state, 100, _future(loop, f"small-{second}"))
+            assert scheduler.pop().name == f"small-{second}"
+    finally:
+        loop.close()
+
+
+def test_virtual_time_serves_tenants_in_weight_ratio(clock):
+    """대기 중인 두 테넌트는 가중치 비율(2:1)대로 번갈아 처리됨"""
+    loop = asyncio.new_event_loop()
+    try:
+        scheduler = FairScheduler(aging_rate=0)
+        heavy = scheduler.tenant("heavy", 2.0)
+        light = scheduler.tenant("light", 1.0)
+        for index in range(6):
+            scheduler.push(heavy, 100, _future(loop, "heavy"))
+            scheduler.push(light, 100, _future(loop, "light"))
+
+        served = [scheduler.pop().name for _ in range(9)]
+        assert served.count("heavy") == 6
+        assert served.count("light") == 3
+        # 한 테넌트가 연속으로 독점하지 않음
+        assert "light" in served[:3]
+    finally:
+        loop.close()
+
+
+def test_new_tenant_starts_at_current_virtual_time(clock):
+    """새 테넌트는 현재 가상 시간에서 시작하여 오래 쉬던 테넌트처럼 몰아서 처리되지 않음"""
+    loop = asyncio.new_event_loop()
+    try:
+        scheduler = FairScheduler(aging_rate=0)
+        busy = scheduler.tenant("busy", 1.0)
+        for _ in range(5):
+            scheduler.push(busy, 100, _future(loop, "busy"))
+            scheduler.pop()
+
+        newcomer = scheduler.tenant("newcomer", 1.0)
+        assert newcomer.finish_tag == scheduler.virtual_time
+    finally:
+        loop.close()
+
+
+def test_zero_weight_is_rejected():
+    """가중치 0은 나눗셈 오류 대신 ValueError"""
+    with pytest.raises(ValueError):
+        FairScheduler().tenant("a", 0)
+
+
+def test_batch_lane_shares_tenant_quota(clock):
+    """배치 대기열은 같은 테넌트의 할당량을 함께 사용"""
+    scheduler = FairScheduler()
+    interactive = scheduler.tenant("a", 1.0, 1000, quota_key="a")
+    batch = scheduler.tenant("a/batch", 0.25, 1000, quota_key="a")
+
+    assert scheduler.charge_quota(interactive, 700) is None
+    assert scheduler.charge_quota(batch, 700) is not None
+    assert scheduler.charge_quota(batch, 300) is None
+
+
+def test_quota_refills_over_time(clock):
+    """분당 할당량은 시간에 비례하여 보충"""
+    scheduler = FairScheduler()
+    state = scheduler.tenant("a", 1.0, 600)
+    assert scheduler.charge_quota(state, 600) is None
+    assert scheduler.charge_quota(state, 100) == 10
+
+    clock.now += 10
+    assert scheduler.charge_quota(state, 100) is None
+
+
+def _admission(**kwargs) -> AdmissionController:
+    return AdmissionController(max_in_flight=1, **kwargs)
+
+
+def test_quota_is_refunded_when_queue_is_full():
+    """대기열이 가득 차 거절된 요청의 할당량은 반환"""
+    async def scenario():
+        admission = _admission(max_queue=0)
+        await admission.acquire(100, "a", 1.0, 1000)
+        with pytest.raises(AdmissionRejectedError) as error:
+            await admission.acquire(400, "a", 1.0, 1000)
+        assert error.value.reason == "queue_full"
+        return admission.scheduler.tenants["a"].quota.tokens
+
+    assert asyncio.run(scenario()) == pytest.approx(900, abs=1)
+
+
+def test_quota_is_refunded_when_queue_wait_times_out():
+    """대기 기한을 넘겨 거절된 요청의 할당량은 반환"""
+    async def scenario():
+        admission = _admission(queue_timeout=0.01)
+        await admission.acquire(100, "a", 1.0, 1000)
+        with pytest.raises(AdmissionRejectedError) as error:
+            await admission.acquire(400, "a", 1.0, 1000)
+        assert error.value.reason == "queue_timeout"
+        assert admission.waiting == 0
+        return admission.scheduler.tenants["a"].quota.tokens
+
+    assert asyncio.run(scenario()) == pytest.approx(900, abs=1)
+
+
+def test_quota_is_refunded_when_waiter_is_cancelled():
+    """클라이언트 연결 종료로 취소된 대기 요청의 할당량은 반환"""
+    async def scenario():
+        admission = _admission()
+        await admission.acquire(100, "a", 1.0, 1000)
+        waiter = asyncio.ensure_future(admission.acquire(400, "a", 1.0, 1000))
+        await asyncio.sleep(0)
+        waiter.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await waiter
+        assert admission.waiting == 0
+        return admission.scheduler.tenants["a"].quota.tokens
+
+    assert asyncio.run(scenario()) == pytest.approx(900, abs=1)
+
+
+def test_quota_exceeded_is_rejected_with_retry_after():
+    """할당량이 부족하면 대기하지 않고 quota_exceeded로 거절"""
+    async def scenario():
+        admission = _admission()
+        await admission.acquire(1000, "a", 1.0, 1000)
+        admission.release()
+        with pytest.raises(AdmissionRejectedError) as error:
+            await admission.acquire(500, "a", 1.0, 1000)
+        return error.value
+
+    error = asyncio.run(scenario())
+    assert error.reason == "quota_exceeded"
+    assert error.retry_after >= 1
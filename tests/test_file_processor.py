@@ -0,0 +1,24 @@
+from concurrent.futures import Future
+from services.file_processor import FileProcessorService
+
+
+def _entry(page, text, error=None):
+    future = Future()
+    if error is not None:
+        future.set_exception(error)
+    else:
+        future.set_result(("", 0.0))
+    return {"page": page, "text": text, "future": future, "elapsed": 0.0}
+
+
+def test_oversized_page_image_degrades_only_that_page():
+    processor = FileProcessorService()
+    page_stats = []
+
+    first = processor._finish_page(_entry(1, "native text", ValueError("too many pixels")), page_stats)
+    second = processor._finish_page(_entry(2, "next page"), page_stats)
+
+    assert (first, second) == ("native text", "next page")
+    assert page_stats[0]["source"] == "text"
+    assert "too many pixels" in page_stats[0]["error"]
+    assert "error" not in page_stats[1]
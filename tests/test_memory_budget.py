@@ -0,0 +1,117 @@
+import io
+import threading
+import time
+import pytest
+from PIL import Image, JpegImagePlugin
+from config.settings import Settings
+from models.document import Document, FileType
+from services.file_processor import FileProcessorService
+from services.memory_budget import MemoryBudget, MemoryBudgetExceededError, estimate_document_memory
+
+
+def _image_bytes(size, image_format):
+    buffer = io.BytesIO()
+    Image.new("RGB", size, "white").save(buffer, image_format)
+    return buffer.getvalue()
+
+
+def test_reserve_waits_for_release():
+    budget = MemoryBudget(budget_bytes=100, wait_timeout=5)
+    holding = threading.Event()
+    release = threading.Event()
+    acquired_at = []
+
+    def hold():
+        with budget.reserve(80):
+            holding.set()
+            release.wait()
+
+    def wait_for_budget():
+        with budget.reserve(50):
+            acquired_at.append(time.monotonic())
+
+    holder = threading.Thread(target=hold)
+    holder.start()
+    holding.wait()
+    waiter = threading.Thread(target=wait_for_budget)
+    waiter.start()
+    time.sleep(0.1)
+
+    # 예산이 부족한 동안은 대기
+    assert acquired_at == [] and budget.stats()["deferred"] == 1
+    released_at = time.monotonic()
+    release.set()
+    holder.join()
+    waiter.join(2)
+
+    assert acquired_at and acquired_at[0] >= released_at
+    assert budget.stats()["reserved_bytes"] == 0 and budget.stats()["in_flight"] == 0
+
+
+def test_reserve_rejects_after_wait_timeout():
+    budget = MemoryBudget(budget_bytes=100, wait_timeout=0.05)
+
+    with budget.reserve(60):
+        with pytest.raises(MemoryBudgetExceededError) as error:
+            with budget.reserve(60):
+                pass
+
+    assert error.value.retry_after >= 1
+    assert budget.stats()["rejected"] == 1 and budget.stats()["reserved_bytes"] == 0
+
+
+def test_reserve_rejects_request_larger_than_budget():
+    budget = MemoryBudget(budget_bytes=100, wait_timeout=5)
+
+    with pytest.raises(ValueError, match="허용 한도"):
+        with budget.reserve(101):
+            pass
+
+
+def test_reservation_released_on_error():
+    budget = MemoryBudget(budget_bytes=100, wait_timeout=0)
+
+    with pytest.raises(RuntimeError):
+        with budget.reserve(100):
+            raise RuntimeError()
+
+    assert budget.stats()["reserved_bytes"] == 0
+
+
+def test_open_image_rejects_over_pixel_cap(monkeypatch):
+    monkeypatch.setattr(Settings, "MAX_IMAGE_PIXELS", 10000)
+
+    for image_format in ("PNG", "JPEG"):
+        with pytest.raises(ValueError, match="해상도"):
+            FileProcessorService()._open_image_for_ocr(_image_bytes((200, 100), image_format))
+
+
+def test_open_jpeg_decodes_at_reduced_size(monkeypatch):
+    monkeypatch.setattr(Settings, "OCR_MAX_PIXELS", 3000)
+    drafts = []
+    original_draft = JpegImagePlugin.JpegImageFile.draft
+
+    def draft(self, mode, size):
+        drafts.append(size)
+        return original_draft(self, mode, size)
+
+    monkeypatch.setattr(JpegImagePlugin.JpegImageFile, "draft", draft)
+
+    image = FileProcessorService()._open_image_for_ocr(_image_bytes((400, 300), "JPEG"))
+
+    assert drafts and image.width * image.height <= 3000
+    # 디코딩 단계에서 draft로 줄인 뒤 OCR 기준 크기로 축소
+    assert image.size == drafts[0]
+
+
+def test_non_jpeg_images_budget_full_decode(monkeypatch):
+    monkeypatch.setattr(Settings, "OCR_MAX_PIXELS", 40000)
+    png = _image_bytes((1000, 1000), "PNG")
+    jpeg = _image_bytes((1000, 1000), "JPEG")
+
+    def estimate(data, file_type):
+        return estimate_document_memory(Document(file_name="x", file_type=file_type, file_size=len(data), file_data=data))
+
+    # PNG는 원본 해상도로 디코딩한 뒤 축소하므로 최소 픽셀당 4바이트, JPEG는 축소 기준의 4배까지만 디코딩
+    assert estimate(png, FileType.PNG) >= 1000 * 1000 * 4
+    assert estimate(jpeg, FileType.JPEG) < 1000 * 1000 * 4
@@ -0,0 +1,32 @@
+import logging
+from services import ocr_engine
+from services.file_processor import _ocr_pdf_page
+from services.ocr_engine import OcrWorkerPool, _mp_context
+
+
+def test_worker_processes_are_not_forked():
+    assert _mp_context().get_start_method() in ("forkserver", "spawn")
+
+
+def test_pool_runs_tasks_in_worker_process():
+    pool = OcrWorkerPool(max_workers=1)
+    try:
+        text, _ = pool.submit(_ocr_pdf_page, []).result(timeout=60)
+    finally:
+        pool.shutdown()
+
+    assert text == ""
+    assert not pool.inline
+
+
+def test_fallback_backend_is_logged_once_per_pool(monkeypatch, caplog):
+    monkeypatch.setattr(ocr_engine, "tesserocr", None)
+    pool = OcrWorkerPool(max_workers=0)
+
+    with caplog.at_level(logging.WARNING, logger=ocr_engine.__name__):
+        for _ in range(3):
+            pool.submit(len, b"abc").result()
+
+    assert [record.message for record in caplog.records if "pytesseract" in record.message] == [
+        "tesserocr를 불러올 수 없어 pytesseract로 OCR합니다 (이미지마다 tesseract 프로세스 실행)."
+    ]
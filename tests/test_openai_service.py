@@ -0,0 +1,104 @@
+import asyncio
+import threading
+from types import SimpleNamespace
+import pytest
+from config.settings import Settings
+from models.summary import SummaryMethod, SummaryRequest
+from models.translation import Language, TranslationRequest
+from services import request_profiler
+from services.openai_service import AsyncOpenAIService, OpenAIService
+
+
+def _response(content):
+    usage = SimpleNamespace(prompt_tokens=120, completion_tokens=8,
+                            prompt_tokens_details=SimpleNamespace(cached_tokens=64))
+    return SimpleNamespace(choices=[SimpleNamespace(message=SimpleNamespace(content=content))], usage=usage)
+
+
+class _Completions:
+    """호출 파라미터와 호출 시점의 프로파일 단계를 기록하는 chat.completions 대역"""
+
+    def __init__(self, content="  결과  ", error=None):
+        self.content = content
+        self.error = error
+        self.calls = []
+        self.stages = []
+
+    def _record(self, kwargs):
+        profiler = request_profiler._active_profilers.get(threading.get_ident())
+        self.stages.append(list(profiler.stages) if profiler else None)
+        self.calls.append(kwargs)
+        if self.error:
+            raise self.error
+        return _response(self.content)
+
+
+class _SyncCompletions(_Completions):
+    def create(self, **kwargs):
+        return self._record(kwargs)
+
+
+class _AsyncCompletions(_Completions):
+    async def create(self, **kwargs):
+        await asyncio.sleep(0)
+        return self._record(kwargs)
+
+
+def _service(cls, completions, monkeypatch):
+    monkeypatch.setattr(Settings, "OPENAI_API_KEY", "sk-test")
+    service = cls()
+    service.client = SimpleNamespace(chat=SimpleNamespace(completions=completions))
+    return service
+
+
+@pytest.fixture
+def profiler():
+    profiler = request_profiler.RequestProfiler("test")
+    request_profiler._active_profilers[threading.get_ident()] = profiler
+    yield profiler
+    request_profiler._active_profilers.pop(threading.get_ident(), None)
+
+
+TRANSLATION = TranslationRequest(text="Hello", source_language=Language.ENGLISH, target_language=Language.KOREAN)
+SUMMARY = SummaryRequest(text="Long text to summarize.", method=SummaryMethod.GPT_BRIEF, sentences_count=2)
+
+
+def test_async_translate_matches_sync_parameters(monkeypatch, profiler):
+    sync_completions, async_completions = _SyncCompletions(), _AsyncCompletions()
+    sync_result = _service(OpenAIService, sync_completions, monkeypatch).translate_text(TRANSLATION)
+    async_service = _service(AsyncOpenAIService, async_completions, monkeypatch)
+    async_result = asyncio.run(async_service.translate_text(TRANSLATION))
+
+    assert async_completions.calls == sync_completions.calls
+    assert async_result.translated_text == sync_result.translated_text == "결과"
+    assert async_result.usage["cached_tokens"] == 64
+
+
+def test_async_summary_uses_shared_parameters(monkeypatch):
+    completions = _AsyncCompletions("요약문")
+    service = _service(AsyncOpenAIService, completions, monkeypatch)
+
+    result = asyncio.run(service.summarize_text(SUMMARY))
+
+    assert completions.calls == [service._summary_kwargs(SUMMARY)]
+    assert completions.calls[0]["max_tokens"] == service.SUMMARY_MAX_TOKENS
+    assert result.summary == "요약문" and result.summary_length == 1
+
+
+def test_both_paths_record_openai_stage(monkeypatch, profiler):
+    sync_completions, async_completions = _SyncCompletions(), _AsyncCompletions()
+    _service(OpenAIService, sync_completions, monkeypatch).summarize_text(SUMMARY)
+    asyncio.run(_service(AsyncOpenAIService, async_completions, monkeypatch).summarize_text(SUMMARY))
+
+    # asyncio.run은 같은 스레드에서 이벤트 루프를 실행하므로 같은 프로파일러에 단계가 기록됨
+    assert sync_completions.stages == async_completions.stages == [["openai"]]
+    assert profiler.stages == []
+
+
+def test_async_errors_are_wrapped_like_sync(monkeypatch):
+    service = _service(AsyncOpenAIService, _AsyncCompletions(error=RuntimeError("boom")), monkeypatch)
+
+    with pytest.raises(Exception, match="번역 중 오류가 발생했습니다: boom"):
+        asyncio.run(service.translate_text(TRANSLATION))
+    with pytest.raises(Exception, match="요약 중 오류가 발생했습니다: boom"):
+        asyncio.run(service.summarize_text(SUMMARY))
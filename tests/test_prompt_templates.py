@@ -0,0 +1,113 @@
+from types import SimpleNamespace
+import pytest
+from config.settings import Settings
+from models.translation import Language, TranslationRequest
+from services import prompt_templates
+from services.openai_service import OpenAIService
+from services.prompt_templates import PromptTemplate, PromptTemplateRegistry, _cached_tokens
+
+V1 = PromptTemplate(name="translation", version="v1", system="번역합니다.", user="대상: {target}\n\n원문:\n{text}")
+V2 = PromptTemplate(name="translation", version="v2", system="규칙에 따라 번역합니다.", user="대상: {target}\n\n원문:\n{text}")
+
+
+def _usage(prompt_tokens, cached_tokens=None, completion_tokens=10, as_dict=False):
+    details = None
+    if cached_tokens is not None:
+        details = {"cached_tokens": cached_tokens} if as_dict else SimpleNamespace(cached_tokens=cached_tokens)
+    return SimpleNamespace(prompt_tokens=prompt_tokens, completion_tokens=completion_tokens, prompt_tokens_details=details)
+
+
+def test_registry_versions():
+    registry = PromptTemplateRegistry()
+    registry.register(V1)
+    registry.register(V2, active=False)
+
+    assert registry.get("translation") is V1
+    assert registry.get("translation", "v2") is V2
+
+    registry.register(V2)
+
+    assert registry.get("translation").key == "translation@v2"
+    assert registry.get("translation", "v1") is V1
+    with pytest.raises(ValueError, match="summary"):
+        registry.get("summary")
+    with pytest.raises(ValueError, match="translation@v3"):
+        registry.get("translation", "v3")
+
+
+def test_first_registered_version_is_active_even_if_inactive():
+    registry = PromptTemplateRegistry()
+    registry.register(V1, active=False)
+
+    assert registry.get("translation") is V1
+
+
+def test_render_keeps_variables_out_of_system_prefix():
+    first = V1.render(target="한국어", text="Hello")
+    second = V1.render(target="English", text="안녕하세요")
+
+    assert [message["role"] for message in first] == ["system", "user"]
+    # 요청마다 달라지는 값은 user 메시지에만 들어가므로 system 접두부는 항상 같음
+    assert first[0] == second[0] == {"role": "system", "content": V1.system}
+    assert first[1]["content"] == "대상: 한국어\n\n원문:\nHello"
+
+
+def test_registered_system_prompts_have_no_variables():
+    for name in ("translation", "translation_reference", "summary"):
+        template = prompt_templates.prompt_registry.get(name)
+        assert "{" not in template.system
+
+    assert (prompt_templates.prompt_registry.get("translation").system
+            == prompt_templates.prompt_registry.get("translation_reference").system)
+
+
+def test_cached_tokens_from_usage_details():
+    assert _cached_tokens(_usage(100, 64)) == 64
+    assert _cached_tokens(_usage(100, 64, as_dict=True)) == 64
+    assert _cached_tokens(_usage(100)) == 0
+    assert _cached_tokens(SimpleNamespace(prompt_tokens=100)) == 0
+    assert _cached_tokens(_usage(100, None, as_dict=True)) == 0
+
+
+def test_usage_accounting_per_template_key():
+    registry = PromptTemplateRegistry()
+    registry.register(V1)
+    registry.register(V2)
+
+    uncached = registry.record_usage(V1, _usage(2000, completion_tokens=50))
+    cached = registry.record_usage(V1, _usage(2000, 1536, completion_tokens=30, as_dict=True))
+    registry.record_usage(V2, _usage(1000, 0))
+
+    assert uncached == {"prompt_template": "translation@v1", "prompt_tokens": 2000,
+                        "cached_tokens": 0, "completion_tokens": 50}
+    assert cached["cached_tokens"] == 1536
+
+    stats = registry.usage_stats()
+    assert stats["translation@v1"] == {"requests": 2, "prompt_tokens": 4000, "cached_tokens": 1536,
+                                       "completion_tokens": 80, "cache_hit_ratio": 0.384}
+    # 버전이 바뀌면 새 키로 따로 누적
+    assert stats["translation@v2"]["requests"] == 1 and stats["translation@v2"]["cache_hit_ratio"] == 0.0
+
+
+def test_usage_stats_without_prompt_tokens():
+    registry = PromptTemplateRegistry()
+    registry.record_usage(V1, SimpleNamespace())
+
+    assert registry.usage_stats()["translation@v1"]["cache_hit_ratio"] == 0.0
+
+
+def test_active_version_change_changes_checkpoint_params(monkeypatch):
+    monkeypatch.setattr(Settings, "OPENAI_API_KEY", "sk-test")
+    registry = PromptTemplateRegistry()
+    registry.register(V1)
+    monkeypatch.setattr("services.openai_service.prompt_registry", registry)
+    service = OpenAIService()
+    request = TranslationRequest(text="Hello", source_language=Language.ENGLISH, target_language=Language.KOREAN)
+
+    before = service.translation_checkpoint_params(request)
+    registry.register(V2)
+    after = service.translation_checkpoint_params(request)
+
+    # 활성 템플릿 버전이 바뀌면 이전 버전으로 저장된 체크포인트를 재사용하지 않음
+    assert before["template"] == "translation@v1" and after["template"] == "translation@v2"
+    assert {**before, "template": None} == {**after, "template": None}
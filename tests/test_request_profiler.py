@@ -0,0 +1,69 @@
+import os
+import time
+from config.settings import Settings
+from services import request_profiler
+from services.request_profiler import RequestProfiler, profile_request, profile_stage, should_profile
+
+
+def _busy(seconds):
+    deadline = time.perf_counter() + seconds
+    while time.perf_counter() < deadline:
+        pass
+
+
+def test_samples_are_folded_stacks_with_route_and_stage_labels(tmp_path, monkeypatch):
+    monkeypatch.setattr(Settings, "PROFILE_OUTPUT_DIR", str(tmp_path))
+    profiler = RequestProfiler("translate", interval=0.002)
+    profiler.start()
+    try:
+        with profile_stage("openai"):
+            _busy(0.1)
+    finally:
+        profiler.stop()
+
+    path = profiler.save()
+    lines = open(path, encoding="utf-8").read().splitlines()
+
+    assert lines and os.path.basename(path).endswith(".folded")
+    for line in lines:
+        stack, count = line.rsplit(" ", 1)
+        frames = stack.split(";")
+        assert frames[0] == "route:translate" and int(count) >= 1
+    assert any(line.startswith("route:translate;stage:openai;") and "_busy (test_request_profiler.py" in line
+               for line in lines)
+    assert profiler.thread_id not in request_profiler._active_profilers
+
+
+def test_profile_stage_is_noop_without_profiler():
+    with profile_stage("openai"):
+        pass
+
+    assert request_profiler._active_profilers == {}
+
+
+def test_sampling_switch(monkeypatch):
+    monkeypatch.setattr(Settings, "PROFILE_HEADER_TOKEN", "secret")
+    monkeypatch.setattr(Settings, "PROFILE_SAMPLE_RATE", 0.0)
+    assert not should_profile({})
+    assert not should_profile({"X-Profile": "wrong"})
+    assert should_profile({"X-Profile": "secret"})
+
+    monkeypatch.setattr(Settings, "PROFILE_SAMPLE_RATE", 1.0)
+    assert should_profile(None)
+
+
+def test_profile_request_skips_unsampled_requests(tmp_path, monkeypatch):
+    monkeypatch.setattr(Settings, "PROFILE_OUTPUT_DIR", str(tmp_path))
+    monkeypatch.setattr(Settings, "PROFILE_HEADER_TOKEN", "")
+    monkeypatch.setattr(Settings, "PROFILE_SAMPLE_RATE", 0.0)
+
+    with profile_request("summarize") as profiler:
+        assert profiler is None
+    assert os.listdir(tmp_path) == []
+
+    monkeypatch.setattr(Settings, "PROFILE_SAMPLE_RATE", 1.0)
+    with profile_request("summarize") as profiler:
+        _busy(0.05)
+
+    assert profiler is not None
+    assert [name for name in os.listdir(tmp_path) if "_summarize_" in name]
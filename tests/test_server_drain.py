@@ -0,0 +1,66 @@
+import asyncio
+import signal
+import pytest
+import uvicorn
+from fastapi.testclient import TestClient
+from config.settings import Settings
+from server import app as server_app
+from server.runner import DrainingServer
+
+DRAIN_HOOK = "server.app:start_draining"
+
+
+@pytest.fixture
+def client(monkeypatch):
+    # 컨트롤러 생성 시 API 키 검증을 통과하도록 임의 키 사용 (LLM은 호출하지 않음)
+    monkeypatch.setattr(Settings, "OPENAI_API_KEY", "sk-test")
+    with TestClient(server_app.app) as client:
+        yield client
+    server_app.app.state.draining = False
+
+
+def _server(drain_seconds):
+    return DrainingServer(uvicorn.Config("server.app:app"), DRAIN_HOOK, drain_seconds)
+
+
+def test_readyz_fails_while_draining(client):
+    assert client.get("/readyz").status_code == 200
+
+    _server(0).handle_exit(signal.SIGTERM, None)
+
+    assert client.get("/readyz").status_code == 503
+    assert client.get("/healthz").status_code == 200
+
+
+def test_exit_waits_for_drain_period(client):
+    server = _server(0.2)
+
+    async def signal_and_watch():
+        server.handle_exit(signal.SIGTERM, None)
+        before = server.should_exit
+        await asyncio.sleep(0.3)
+        return before, server.should_exit
+
+    before, after = asyncio.run(signal_and_watch())
+
+    assert client.get("/readyz").status_code == 503
+    assert before is False and after is True
+
+
+def test_second_signal_exits_immediately(client):
+    server = _server(30)
+
+    async def signal_twice():
+        server.handle_exit(signal.SIGTERM, None)
+        server.handle_exit(signal.SIGTERM, None)
+        return server.should_exit
+
+    assert asyncio.run(signal_twice()) is True
+
+
+def test_other_servers_are_not_patched():
+    assert uvicorn.Server.handle_exit is not DrainingServer.handle_exit
+    server = uvicorn.Server(uvicorn.Config("server.app:app"))
+    server.handle_exit(signal.SIGTERM, None)
+
+    assert server.should_exit and server_app.app.state.draining is False
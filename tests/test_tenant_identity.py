@@ -0,0 +1,87 @@
+import hashlib
+import time
+import jwt
+import pytest
+from cryptography.hazmat.primitives.asymmetric import rsa
+from config.settings import Settings
+from services.tenant_identity import TenantResolver
+
+API_KEY = "secret-key-1"
+CLIENT_ID = "client-id.apps.googleusercontent.com"
+
+
+@pytest.fixture(scope="module")
+def signing_key():
+    return rsa.generate_private_key(public_exponent=65537, key_size=2048)
+
+
+class StaticJwks:
+    """Google 공개 키 조회 대체 (네트워크 없이 테스트 키 반환)"""
+
+    def __init__(self, public_key):
+        self.key = public_key
+
+    def get_signing_key_from_jwt(self, token):
+        return self
+
+
+def _resolver(signing_key) -> TenantResolver:
+    resolver = TenantResolver(
+        api_keys={hashlib.sha256(API_KEY.encode()).hexdigest(): "partner-a"},
+        google_client_id=CLIENT_ID
+    )
+    resolver._jwks = lambda: StaticJwks(signing_key.public_key())
+    return resolver
+
+
+def _google_token(signing_key, **claims) -> str:
+    payload = {"sub": "1234567890", "aud": CLIENT_ID, "iss": "https://accounts.google.com",
+               "exp": int(time.time()) + 600, **claims}
+    return jwt.encode(payload, signing_key, algorithm="RS256")
+
+
+def test_registered_api_key_maps_to_tenant_name(signing_key):
+    resolver = _resolver(signing_key)
+    assert resolver.resolve(API_KEY, None, "10.0.0.1") == "partner-a"
+    assert resolver.resolve(None, API_KEY, "10.0.0.1") == "partner-a"
+
+
+def test_unknown_keys_fall_back_to_client_ip_tenant(signing_key):
+    """임의의 키를 바꿔 보내도 같은 IP 테넌트로 처리되어 새 할당량이 생기지 않음"""
+    resolver = _resolver(signing_key)
+    tenants = {resolver.resolve(f"random-{index}", None, "10.0.0.2") for index in range(20)}
+    assert tenants == {"ip:10.0.0.2"}
+
+
+def test_valid_google_token_maps_to_user_id(signing_key):
+    resolver = _resolver(signing_key)
+    assert resolver.resolve(None, _google_token(signing_key), "10.0.0.3") == "google:1234567890"
+
+
+@pytest.mark.parametrize("claims", [
+    {"aud": "other-client"},
+    {"iss": "https://evil.example.com"},
+    {"exp": int(time.time()) - 60},
+])
+def test_invalid_google_token_falls_back_to_client_ip(signing_key, claims):
+    resolver = _resolver(signing_key)
+    assert resolver.resolve(None, _google_token(signing_key, **claims), "10.0.0.4") == "ip:10.0.0.4"
+
+
+def test_token_signed_by_other_key_is_rejected(signing_key):
+    other_key = rsa.generate_private_key(public_exponent=65537, key_size=2048)
+    resolver = _resolver(signing_key)
+    assert resolver.resolve(None, _google_token(other_key), "10.0.0.5") == "ip:10.0.0.5"
+
+
+def test_google_tokens_ignored_without_client_id(signing_key):
+    resolver = _resolver(signing_key)
+    resolver.google_client_id = ""
+    assert resolver.resolve(None, _google_token(signing_key), "10.0.0.6") == "ip:10.0.0.6"
+
+
+@pytest.mark.parametrize("weights", [{"partner-a": 0}, {"partner-a": -1}, {"partner-a": "2"}])
+def test_non_positive_tenant_weights_fail_validation(monkeypatch, weights):
+    monkeypatch.setattr(Settings, "TENANT_WEIGHTS", weights)
+    with pytest.raises(ValueError):
+        Settings.validate_tenants()
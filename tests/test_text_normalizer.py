@@ -0,0 +1,42 @@
+from services.text_normalizer import TextNormalizer
+
+
+def test_single_page_keeps_number_only_lines():
+    text, stats = TextNormalizer().normalize_text("2024\nRevenue grew this year.\n42")
+
+    assert text.split() == ["2024", "Revenue", "grew", "this", "year.", "42"]
+    assert stats["boilerplate_lines_removed"] == 0
+
+
+def test_multi_page_strips_page_numbers_only_when_enabled():
+    pages = ["Intro paragraph.\n1", "Second page."]
+
+    kept, _ = TextNormalizer().normalize_pages(pages)
+    stripped, stats = TextNormalizer().normalize_pages(pages, page_numbers=True)
+
+    assert kept == "Intro paragraph. 1\n\nSecond page."
+    assert stripped == "Intro paragraph.\n\nSecond page."
+    assert stats["boilerplate_lines_removed"] == 1
+
+
+def test_single_page_document_keeps_numbers_even_with_page_numbers():
+    text, _ = TextNormalizer().normalize_pages(["Total amount\n1500"], page_numbers=True)
+
+    assert text.endswith("1500")
+
+
+def test_reflow_separates_paragraphs_with_blank_lines():
+    page = ("The first paragraph wraps across\nseveral lines of the page and\nends here.\n\n"
+            "A second paragraph follows.\n"
+            "- first item\n- second item\nName\tAmount\nTotal\t1500\n"
+            "Closing paragraph.")
+
+    text, _ = TextNormalizer().normalize_text(page)
+
+    # 문단은 빈 줄로 구분하고, 연속된 목록 항목과 표 행은 한 줄씩 유지
+    assert text.split("\n\n") == [
+        "The first paragraph wraps across several lines of the page and ends here.",
+        "A second paragraph follows.",
+        "- first item\n- second item\nName\tAmount\nTotal\t1500",
+        "Closing paragraph.",
+    ]
@@ -0,0 +1,62 @@
+from controllers.request_options import TENANT_FIELD
+from controllers.translation_controller import TranslationController
+from models.translation import Language, TranslationRequest, TranslationResult
+from services.translation_memory import TranslationMemory, TranslationPlan, paragraphs_aligned
+
+SOURCE = "The quarterly report was published on 2024-03-01 and covers all regional offices in detail."
+
+
+def _request(text):
+    return TranslationRequest(text=text, source_language=Language.ENGLISH, target_language=Language.KOREAN)
+
+
+def test_memory_is_scoped_per_tenant():
+    memory = TranslationMemory(min_chars=10)
+    memory.store(SOURCE, "분기 보고서", "en", "ko", "google:alice")
+
+    assert memory.lookup(SOURCE, "en", "ko", "google:alice").kind == "exact"
+    assert memory.lookup(SOURCE, "en", "ko", "google:bob") is None
+    near = SOURCE.replace("2024-03-01", "2024-06-01")
+    assert memory.lookup(near, "en", "ko", "google:alice").kind == "near"
+    assert memory.lookup(near, "en", "ko", "google:bob") is None
+
+
+def test_plan_without_scope_does_not_use_memory():
+    memory = TranslationMemory()
+    memory.store(SOURCE, "분기 보고서", "en", "ko", "google:alice")
+
+    plan = TranslationPlan(_request(SOURCE), memory)
+
+    assert plan.memory is None and plan.exact_hits == 0
+
+
+def test_memory_scope_requires_verified_tenant():
+    controller = TranslationController.__new__(TranslationController)
+
+    assert controller.memory_scope({TENANT_FIELD: "google:alice"}) == "google:alice"
+    assert controller.memory_scope({TENANT_FIELD: "google:alice", "use_memory": "false"}) is None
+    assert controller.memory_scope({TENANT_FIELD: "ip:10.0.0.1"}) is None
+    assert controller.memory_scope({}) is None
+
+
+def test_alignment_check_rejects_merged_and_split_paragraphs():
+    sources = ["Revenue grew 12 percent in 2023.", "Costs fell.", "Headcount reached 450 people."]
+
+    assert paragraphs_aligned(sources, ["2023년 매출은 12% 증가했다.", "비용은 줄었다.", "인원은 450명이다."])
+    # 앞의 두 문단을 합치고 마지막 문단을 나눈 번역 (문단 수는 같음)
+    merged_split = ["2023년 매출은 12% 증가했고 비용은 줄었다.", "인원은", "450명이다."]
+    assert not paragraphs_aligned(sources, merged_split)
+    assert not paragraphs_aligned(sources, merged_split[:2])
+
+
+def test_misaligned_segment_is_stored_as_one_entry():
+    memory = TranslationMemory()
+    text = "Revenue grew 12 percent in 2023.\n\nCosts fell.\n\nHeadcount reached 450 people."
+    plan = TranslationPlan(_request(text), memory, scope="google:alice")
+    index, segment = plan.pending_requests()[0]
+
+    translated = "2023년 매출은 12% 증가했고 비용은 줄었다.\n\n인원은\n\n450명이다."
+    plan.complete(index, TranslationResult(segment.text, translated, Language.ENGLISH, Language.KOREAN))
+
+    assert memory.lookup("Costs fell.", "en", "ko", "google:alice") is None
+    assert memory.lookup(text, "en", "ko", "google:alice").translation == translated
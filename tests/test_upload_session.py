@@ -0,0 +1,120 @@
+import hashlib
+import os
+import time
+import pytest
+from controllers.upload_session_controller import UploadSessionController
+from controllers.request_options import TENANT_FIELD
+from services.file_processor import FileProcessorService
+from services.upload_session import FINALIZE_LOCK_FILE, UploadSessionError, UploadSessionService
+from views.error_handler import ErrorHandler
+
+
+@pytest.fixture
+def service(tmp_path):
+    return UploadSessionService(spool_dir=str(tmp_path))
+
+
+def _upload(service, data, owner="ip:1.1.1.1"):
+    session = service.create_session("a.txt", "text/plain", len(data), owner=owner)
+    service.put_chunk(session.upload_id, 0, data, hashlib.sha256(data).hexdigest(), owner=owner)
+    return session
+
+
+def test_sessions_are_bound_to_their_tenant(service):
+    session = _upload(service, b"hello")
+
+    assert service.get_session(session.upload_id, "ip:1.1.1.1").received_chunks == [0]
+    assert "owner" not in session.to_status_dict()
+    with pytest.raises(ValueError, match="찾을 수 없습니다"):
+        service.get_session(session.upload_id, "ip:2.2.2.2")
+    with pytest.raises(ValueError, match="찾을 수 없습니다"):
+        service.finalize(session.upload_id, "ip:2.2.2.2")
+
+
+def test_tenant_session_count_and_size_limits(service):
+    service.sessions_per_tenant = 2
+    service.bytes_per_tenant = 100
+    service.create_session("a.txt", "text/plain", 40, owner="ip:1.1.1.1")
+    service.create_session("b.txt", "text/plain", 40, owner="ip:1.1.1.1")
+
+    with pytest.raises(UploadSessionError) as count_error:
+        service.create_session("c.txt", "text/plain", 1, owner="ip:1.1.1.1")
+    assert ErrorHandler.get_error_response(count_error.value)["status_code"] == 429
+
+    service.sessions_per_tenant = 10
+    with pytest.raises(UploadSessionError, match="합계"):
+        service.create_session("c.txt", "text/plain", 21, owner="ip:1.1.1.1")
+    # 다른 테넌트는 영향을 받지 않음
+    service.create_session("d.txt", "text/plain", 100, owner="ip:2.2.2.2")
+
+
+def test_concurrent_finalize_is_rejected_while_locked(service):
+    session = _upload(service, b"hello")
+
+    with service.finalize_lock(session.upload_id):
+        with pytest.raises(UploadSessionError) as error:
+            with service.finalize_lock(session.upload_id):
+                pass
+        assert error.value.status_code == 409
+
+    # 잠금이 풀리면 다시 잡을 수 있음
+    with service.finalize_lock(session.upload_id):
+        assert os.path.exists(service.finalize(session.upload_id, "ip:1.1.1.1"))
+
+
+def test_stale_finalize_lock_is_taken_over(service):
+    session = _upload(service, b"hello")
+    lock_path = os.path.join(service.spool_dir, session.upload_id, FINALIZE_LOCK_FILE)
+    open(lock_path, "w").close()
+    old = time.time() - 7200
+    os.utime(lock_path, (old, old))
+
+    with service.finalize_lock(session.upload_id):
+        assert os.path.getmtime(lock_path) > old
+    assert not os.path.exists(lock_path)
+
+
+def test_finalize_processes_spooled_file_without_loading_it(service):
+    controller = UploadSessionController()
+    controller.upload_service = service
+    session = _upload(service, "스풀된 텍스트".encode("utf-8"))
+
+    result = controller.finalize_upload({"upload_id": session.upload_id, TENANT_FIELD: "ip:1.1.1.1"})
+
+    assert result["success"], result
+    assert result["extracted_text"] == "스풀된 텍스트"
+    assert not os.path.exists(os.path.join(service.spool_dir, session.upload_id))
+
+
+@pytest.mark.parametrize("error, kept", [
+    (RuntimeError("upstream 502"), True),
+    (Exception("AI 서비스 오류"), True),
+    (ValueError("지원하지 않는 파일 형식입니다."), False),
+])
+def test_finalize_keeps_session_unless_error_is_deterministic(service, monkeypatch, error, kept):
+    controller = UploadSessionController()
+    controller.upload_service = service
+    session = _upload(service, b"hello")
+    monkeypatch.setattr(controller.document_controller, "process_spooled_document",
+                        lambda **kwargs: ErrorHandler.get_error_response(error))
+
+    result = controller.finalize_upload({"upload_id": session.upload_id, TENANT_FIELD: "ip:1.1.1.1"})
+
+    assert not result["success"]
+    # OpenAI 오류나 내부 오류(5xx)는 세션을 남겨 finalize만 다시 호출할 수 있음
+    assert os.path.exists(os.path.join(service.spool_dir, session.upload_id)) is kept
+    if kept:
+        monkeypatch.setattr(controller.document_controller, "process_spooled_document",
+                            lambda **kwargs: {"success": True})
+        assert controller.finalize_upload({"upload_id": session.upload_id, TENANT_FIELD: "ip:1.1.1.1"})["success"]
+        assert not os.path.exists(os.path.join(service.spool_dir, session.upload_id))
+
+
+def test_spooled_document_reads_from_file(tmp_path):
+    path = tmp_path / "upload.bin"
+    path.write_bytes(b"plain text")
+
+    document = FileProcessorService().create_document_from_file(str(path), "text/plain", "a.txt")
+
+    assert document.file_data == b"" and document.file_size == 10
+    assert FileProcessorService().extract_text_from_document(document) == "plain text"
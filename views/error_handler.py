@@ -7,12 +7,12 @@ class ErrorHandler:
     
     @staticmethod
     def handle_validation_error(error: ValueError) -> Dict[str, Any]:
-        """유효성 검사 오류 처리"""
+        """유효성 검사 오류 처리 (한도 초과/충돌처럼 상태 코드를 지정한 오류는 그 코드 사용)"""
         return {
             "success": False,
             "error": str(error),
             "error_type": "validation_error",
-            "status_code": 400
+            "status_code": getattr(error, "status_code", 400)
         }
     
     @staticmethod
@@ -61,6 +61,17 @@ class ErrorHandler:
             "status_code": 400
         }
     
+    @staticmethod
+    def handle_overload_error(error: Exception) -> Dict[str, Any]:
+        """과부하(용량 부족) 오류 처리"""
+        return {
+            "success": False,
+            "error": str(error),
+            "error_type": "overloaded",
+            "retry_after": error.retry_after,
+            "status_code": 503
+        }
+    
     @staticmethod
     def handle_unexpected_error(error: Exception) -> Dict[str, Any]:
         """예상치 못한 오류 처리"""
@@ -82,6 +93,8 @@ class ErrorHandler:
         
         if isinstance(error, ValueError):
             return ErrorHandler.handle_validation_error(error)
+        elif getattr(error, "retry_after", None) is not None:
+            return ErrorHandler.handle_overload_error(error)
         elif "OpenAI" in str(type(error)) or "openai" in str(error).lower():
             return ErrorHandler.handle_openai_error(error)
         elif "file" in str(error).lower() or "File" in str(type(error)):